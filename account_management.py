@@ -13,8 +13,10 @@ from typing import List, Optional, Dict, Any, Iterable
 from datetime import UTC, datetime, date
 
 from database_ops import DatabaseManager, Account, AccountType
+from performance_utils import TTLCache, cached_method, shared_commit_cache
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, or_
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -82,6 +84,15 @@ def _generate_filename_candidates(path: Path) -> List[str]:
     return [candidate for candidate in candidates if candidate]
 
 
+# Account types held as liabilities; their balances are reported as negative
+LIABILITY_ACCOUNT_TYPES = frozenset({AccountType.CREDIT})
+
+
+def _balance_cache(db_manager: DatabaseManager) -> TTLCache:
+    """Return the signed-balance cache shared by every manager on a database, cleared on every commit."""
+    return shared_commit_cache(db_manager, "balances", maxsize=512, ttl=60)
+
+
 class AccountManager:
     """
     Manages financial accounts (banks, credit cards, investments, etc.).
@@ -97,6 +108,7 @@ class AccountManager:
             db_manager: DatabaseManager instance
         """
         self.db_manager = db_manager
+        self._balance_cache = _balance_cache(db_manager)
         logger.info("Account manager initialized")
     
     def create_account(
@@ -176,17 +188,18 @@ class AccountManager:
         """
         return self.db_manager.get_account(account_id)
     
-    def get_account_by_name(self, name: str) -> Optional[Account]:
+    def get_account_by_name(self, name: str, session: Optional[Session] = None) -> Optional[Account]:
         """
         Get an account by name.
         
         Args:
             name: Account name
+            session: Optional existing session
         
         Returns:
             Account object or None if not found
         """
-        return self.db_manager.get_account_by_name(name)
+        return self.db_manager.get_account_by_name(name, session=session)
     
     def list_accounts(self, account_type: Optional[AccountType] = None) -> List[Account]:
         """
@@ -810,6 +823,79 @@ class AccountManager:
         finally:
             session.close()
     
+    def get_override_state(
+        self,
+        account_id: int,
+        as_of_date: Optional[date] = None,
+        session: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """
+        Get an account's overrides and its balance with override in one session.
+        
+        Combines get_balance_overrides and get_balance_with_override: the latest
+        applicable override is taken from the fetched override list, so only the
+        transaction sum needs a second query.
+        
+        Args:
+            account_id: Account ID
+            as_of_date: Date to calculate the balance as of (defaults to today)
+            session: Optional existing session (e.g. from read_session)
+        
+        Returns:
+            Dictionary with keys:
+            - 'balance_with_override': Balance as get_balance_with_override
+            - 'overrides': Override dicts as get_balance_overrides (newest first)
+        """
+        from database_ops import BalanceOverride, Transaction
+        
+        if as_of_date is None:
+            as_of_date = date.today()
+        
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            overrides = session.query(BalanceOverride).filter(
+                BalanceOverride.account_id == account_id
+            ).order_by(BalanceOverride.override_date.desc()).all()
+            
+            # Most recent override on or before as_of_date
+            latest = next((o for o in overrides if o.override_date <= as_of_date), None)
+            
+            amount_expr = func.decrypt_numeric(Transaction.amount)
+            query = session.query(func.sum(amount_expr)).filter(
+                Transaction.account_id == account_id,
+                Transaction.date <= as_of_date
+            )
+            if latest:
+                query = query.filter(Transaction.date > latest.override_date)
+            transaction_sum = query.scalar() or 0.0
+            
+            return {
+                'balance_with_override': (
+                    latest.override_balance + transaction_sum if latest else transaction_sum
+                ),
+                'overrides': [
+                    {
+                        'id': override.id,
+                        'override_date': override.override_date,
+                        'override_balance': override.override_balance,
+                        'created_at': override.created_at,
+                        'notes': override.notes
+                    }
+                    for override in overrides
+                ]
+            }
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get balance override state: {e}")
+            return {'balance_with_override': 0.0, 'overrides': []}
+        finally:
+            if close_session:
+                session.close()
+    
     def delete_balance_override(
         self,
         override_id: int
@@ -849,6 +935,7 @@ class AccountManager:
         finally:
             session.close()
     
+    @cached_method('_balance_cache')
     def get_signed_balance(
         self,
         account_id: int,
@@ -863,6 +950,8 @@ class AccountManager:
         This is the correct way to calculate net worth:
         Net Worth = Assets - Liabilities = sum(all signed balances)
         
+        Results are cached per (account_id, as_of_date) until the next commit.
+        
         Args:
             account_id: Account ID
             as_of_date: Date to calculate balance as of (defaults to today)
@@ -879,9 +968,93 @@ class AccountManager:
             logger.error(f"Account {account_id} not found")
             return 0.0
         
-        # Invert sign for credit accounts (they are liabilities/debts)
-        if account.type == AccountType.CREDIT:
+        # Invert sign for liability accounts (credit cards are debts)
+        if account.type in LIABILITY_ACCOUNT_TYPES:
             return -abs(balance)
         
         return balance
 
+    
+    def get_signed_balances_bulk(
+        self,
+        as_of_date: Optional[date] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Get signed balances for all accounts in a fixed number of queries.
+        
+        Equivalent to calling get_signed_balance for every account, but the
+        latest overrides and the per-account transaction sums are each fetched
+        with a single query instead of several queries per account.
+        
+        Args:
+            as_of_date: Date to calculate balances as of (defaults to today)
+        
+        Returns:
+            Column lists keyed by id, name, type (value string) and balance
+            (signed), one entry per account ordered by account name
+        """
+        from database_ops import BalanceOverride, Transaction
+        
+        if as_of_date is None:
+            as_of_date = date.today()
+        
+        session = self.db_manager.get_session()
+        
+        try:
+            columns = {'id': [], 'name': [], 'type': [], 'balance': []}
+            accounts = session.query(Account.id, Account.name, Account.type).order_by(Account.name).all()
+            if not accounts:
+                return columns
+            
+            # Latest override per account on or before as_of_date (later rows win)
+            overrides = {}
+            for account_id, override_date, override_balance in session.query(
+                BalanceOverride.account_id,
+                BalanceOverride.override_date,
+                BalanceOverride.override_balance
+            ).filter(
+                BalanceOverride.override_date <= as_of_date
+            ).order_by(BalanceOverride.override_date, BalanceOverride.id):
+                overrides[account_id] = (override_date, override_balance)
+            
+            # Only transactions after an account's override date count towards it
+            after_override = [
+                and_(Transaction.account_id == account_id, Transaction.date > override_date)
+                for account_id, (override_date, _) in overrides.items()
+            ]
+            if overrides:
+                after_override.append(Transaction.account_id.notin_(list(overrides)))
+            
+            amount_expr = func.decrypt_numeric(Transaction.amount)
+            query = session.query(
+                Transaction.account_id,
+                func.sum(amount_expr)
+            ).filter(
+                Transaction.account_id.isnot(None),
+                Transaction.date <= as_of_date
+            )
+            if after_override:
+                query = query.filter(or_(*after_override))
+            sums = dict(query.group_by(Transaction.account_id).all())
+            
+            for account_id, name, account_type in accounts:
+                balance = sums.get(account_id) or 0.0
+                if account_id in overrides:
+                    balance = overrides[account_id][1] + balance
+                
+                # Invert sign for liability accounts (credit cards are debts)
+                if account_type in LIABILITY_ACCOUNT_TYPES:
+                    balance = -abs(balance)
+                
+                columns['id'].append(account_id)
+                columns['name'].append(name)
+                columns['type'].append(account_type.value)
+                columns['balance'].append(float(balance))
+            
+            return columns
+            
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to calculate signed balances: {e}")
+            return {'id': [], 'name': [], 'type': [], 'balance': []}
+        finally:
+            session.close()
@@ -6,15 +6,36 @@ financial transactions, including category breakdowns, income/expense
 summaries, and time-based trend analysis.
 """
 
+from __future__ import annotations
+
+import calendar
+import functools
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple, Union
-import pandas as pd
+import re
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, extract, case
+from sqlalchemy import func, and_, or_, extract, case, select, delete, insert, bindparam, literal, null, union_all
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import SQLAlchemyError
 
-from database_ops import DatabaseManager, Transaction, Account, AccountType
+from database_ops import (
+    BLANK_CATEGORY_INDEX,
+    DatabaseManager,
+    Transaction,
+    Account,
+    AccountType,
+    MonthlyAggregate,
+    MonthlyAggregateMonth,
+)
+from account_management import AccountManager
 from exceptions import AnalyticsError
+from performance_utils import cached_method, shared_commit_cache
+
+# pandas is imported inside the methods that build DataFrames so importing this
+# module (e.g. for get_income_expense_summary) does not pay pandas' start-up cost
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +48,392 @@ except ImportError:
     logger.debug("Query profiling utilities not available")
 
 
+def _shift_month(year: int, month: int, offset: int) -> Tuple[int, int]:
+    """
+    Shift a (year, month) pair by a number of months.
+    
+    Args:
+        year: Calendar year
+        month: Calendar month (1-12)
+        offset: Number of months to shift (negative shifts backwards)
+    
+    Returns:
+        Tuple of (year, month) after shifting
+    """
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+def _subtract_months(moment: datetime, months: int) -> datetime:
+    """
+    Move a datetime back by whole calendar months.
+    
+    The day of month is clamped to the length of the target month, so
+    31 March minus one month is 28/29 February.
+    
+    Args:
+        moment: Datetime to shift
+        months: Number of months to move back
+    
+    Returns:
+        Shifted datetime with the same time of day
+    """
+    year, month = _shift_month(moment.year, moment.month, -months)
+    day = min(moment.day, calendar.monthrange(year, month)[1])
+    return moment.replace(year=year, month=month, day=day)
+
+
+# Time frame grammars, compiled once at import
+_MONTHS_RE = re.compile(r'^(\d+)m$')
+_DATE_RANGE_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}):(\d{4}-\d{2}-\d{2})$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_time_frame(time_frame: str, hour: datetime) -> Tuple[datetime, datetime]:
+    """
+    Resolve a time frame string relative to the start of the current hour.
+    
+    Relative frames end at the last instant of ``hour``, so results are stable
+    (and cacheable) for the whole hour without excluding anything dated in it.
+    
+    Args:
+        time_frame: Time frame string (see AnalyticsEngine.parse_time_frame)
+        hour: Current time truncated to the hour
+    
+    Returns:
+        Tuple of (start_date, end_date)
+    
+    Raises:
+        AnalyticsError: If time frame format is invalid
+    """
+    end_of_hour = hour + timedelta(hours=1, microseconds=-1)
+    
+    # Handle 'all' time
+    if time_frame.lower() == 'all':
+        return datetime(1900, 1, 1), end_of_hour
+    
+    # Handle custom date range (the regex pins the format; fromisoformat validates values)
+    if ':' in time_frame:
+        try:
+            match = _DATE_RANGE_RE.match(time_frame)
+            if match is None:
+                raise ValueError(f"'{time_frame}' does not match YYYY-MM-DD:YYYY-MM-DD")
+            start_date = datetime.fromisoformat(match.group(1))
+            end_date = datetime.fromisoformat(match.group(2))
+            return start_date, end_date
+        except ValueError as e:
+            raise AnalyticsError(
+                f"Invalid date range format. Use YYYY-MM-DD:YYYY-MM-DD: {e}",
+                details={"time_frame": time_frame, "error": str(e)},
+                original_error=e
+            )
+    
+    # Handle relative months (1m, 3m, 6m, 12m) as exact calendar months
+    if time_frame.endswith('m'):
+        match = _MONTHS_RE.match(time_frame)
+        if match is None:
+            raise AnalyticsError(
+                f"Invalid month format: {time_frame}",
+                details={"time_frame": time_frame}
+            )
+        return _subtract_months(hour, int(match.group(1))), end_of_hour
+    
+    raise AnalyticsError(
+        f"Invalid time frame format: {time_frame}. Use '1m', '3m', '6m', '12m', 'all', or 'YYYY-MM-DD:YYYY-MM-DD'",
+        details={"time_frame": time_frame}
+    )
+
+
+def _month_index(year: int, month: int) -> int:
+    """Return a sortable integer index for a (year, month) pair."""
+    return year * 12 + (month - 1)
+
+
+def _month_start(index: int) -> datetime:
+    """Return the first instant of the month with the given month index."""
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _split_full_months(
+    start_date: datetime,
+    end_date: datetime
+) -> Tuple[Optional[Tuple[int, int]], List[Tuple[datetime, datetime, bool]]]:
+    """
+    Split a date range into whole calendar months and partial edge ranges.
+    
+    Args:
+        start_date: Inclusive start of the range
+        end_date: Inclusive end of the range
+    
+    Returns:
+        Tuple of (full_months, edge_ranges). full_months is a half-open
+        (first, last + 1) month-index pair, or None if no month is fully
+        covered. edge_ranges is a list of (lower, upper, upper_inclusive)
+        tuples covering the rest of the range.
+    """
+    first_full = _month_index(start_date.year, start_date.month)
+    if start_date != _month_start(first_full):
+        first_full += 1
+    
+    # The month containing end_date is never fully covered by an inclusive end
+    full_end = _month_index(end_date.year, end_date.month)
+    
+    if first_full >= full_end:
+        return None, [(start_date, end_date, True)]
+    
+    edge_ranges = []
+    if start_date < _month_start(first_full):
+        edge_ranges.append((start_date, _month_start(first_full), False))
+    edge_ranges.append((_month_start(full_end), end_date, True))
+    return (first_full, full_end), edge_ranges
+
+
+def _date_range_filter(range_shape: Tuple[bool, ...]):
+    """
+    Build a SQL condition matching Transaction.date against bound date ranges.
+    
+    Range ``i`` binds ``lower_i`` and ``upper_i``; see _date_range_params.
+    
+    Args:
+        range_shape: upper_inclusive flag for each range
+    
+    Returns:
+        SQLAlchemy boolean expression
+    """
+    conditions = []
+    for i, upper_inclusive in enumerate(range_shape):
+        upper = bindparam(f'upper_{i}')
+        conditions.append(and_(
+            Transaction.date >= bindparam(f'lower_{i}'),
+            Transaction.date <= upper if upper_inclusive else Transaction.date < upper
+        ))
+    return conditions[0] if len(conditions) == 1 else or_(*conditions)
+
+
+def _date_range_params(
+    ranges: List[Tuple[datetime, datetime, bool]]
+) -> Tuple[Tuple[bool, ...], Dict[str, datetime]]:
+    """
+    Split date ranges into a statement shape and its bind parameters.
+    
+    Args:
+        ranges: List of (lower, upper, upper_inclusive) tuples
+    
+    Returns:
+        Tuple of (range_shape, params) for use with _date_range_filter
+    """
+    params = {}
+    for i, (lower, upper, _) in enumerate(ranges):
+        params[f'lower_{i}'] = lower
+        params[f'upper_{i}'] = upper
+    return tuple(upper_inclusive for _, _, upper_inclusive in ranges), params
+
+
+def _account_filter(stmt, by_account: bool, by_account_type: bool):
+    """
+    Apply the bound account_id / account_type filter shared by the analytics statements.
+    
+    Args:
+        stmt: Select statement over Transaction
+        by_account: Filter on the ``account_id`` bind parameter
+        by_account_type: Join Account and filter on the ``account_type`` bind parameter
+    
+    Returns:
+        Tuple of (statement, list of extra conditions)
+    """
+    if by_account:
+        return stmt, [Transaction.account_id == bindparam('account_id')]
+    if by_account_type:
+        stmt = stmt.join_from(Transaction, Account, Transaction.account_id == Account.id)
+        return stmt, [Account.type == bindparam('account_type')]
+    return stmt, []
+
+
+# Analytics statements are built once per filter shape and reused with new
+# bind parameters on every call, so the expression tree and its compiled SQL
+# are not rebuilt per request.
+
+@functools.lru_cache(maxsize=None)
+def _summary_stmt(
+    range_shape: Tuple[bool, ...],
+    by_account: bool,
+    by_account_type: bool,
+    by_category: bool
+):
+    """Build the income/expense summary statement for a filter shape."""
+    # Amount is encrypted, so the summed value is decrypted explicitly
+    amount_expr = func.decrypt_numeric(Transaction.amount)
+    
+    # SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END) for income
+    # SUM(CASE WHEN amount < 0 THEN ABS(amount) ELSE 0 END) for expenses
+    # COUNT(CASE WHEN amount > 0 THEN 1 END) for income count
+    # COUNT(CASE WHEN amount < 0 THEN 1 END) for expense count
+    # COUNT(CASE WHEN amount = 0 THEN 1 END) for zero-amount rows; the total count
+    # is the sum of the three, so no unconditional COUNT is needed
+    stmt = select(
+        func.sum(case((amount_expr > 0, amount_expr), else_=0)).label('total_income'),
+        func.sum(case((amount_expr < 0, func.abs(amount_expr)), else_=0)).label('total_expenses'),
+        func.count(case((amount_expr > 0, 1), else_=None)).label('income_count'),
+        func.count(case((amount_expr < 0, 1), else_=None)).label('expense_count'),
+        func.count(case((amount_expr == 0, 1), else_=None)).label('zero_count')
+    )
+    
+    stmt, conditions = _account_filter(stmt, by_account, by_account_type)
+    conditions.insert(0, _date_range_filter(range_shape))
+    
+    # Category is encrypted, so it is matched through its indexed search token
+    if by_category:
+        conditions.append(
+            Transaction.category_index.in_(bindparam('category_tokens', expanding=True))
+        )
+    
+    return stmt.where(*conditions)
+
+
+@functools.lru_cache(maxsize=None)
+def _category_stmt(
+    sign: int,
+    include_transfers: bool,
+    by_account: bool,
+    by_account_type: bool
+):
+    """
+    Build the per-category totals statement for a filter shape.
+    
+    ``sign`` selects expenses (-1, summed as magnitudes), income (1) or all
+    transactions (0). Percentages of the grand total are computed in SQL.
+    """
+    amount_expr = func.decrypt_numeric(Transaction.amount)
+    if sign < 0:
+        amount_expr = func.abs(amount_expr)
+    total_expr = func.sum(amount_expr)
+    grand_total_expr = func.sum(total_expr).over()
+    category_expr = func.coalesce(func.decrypt_text(Transaction.category), 'Uncategorized')
+    
+    stmt = select(
+        category_expr.label('category'),
+        total_expr.label('total'),
+        func.count(Transaction.id).label('count'),
+        func.coalesce(
+            100.0 * total_expr / func.nullif(grand_total_expr, 0), 0.0
+        ).label('percentage')
+    )
+    
+    stmt, conditions = _account_filter(stmt, by_account, by_account_type)
+    conditions[:0] = [
+        Transaction.date >= bindparam('start_date'),
+        Transaction.date <= bindparam('end_date'),
+    ]
+    
+    if sign < 0:
+        conditions.append(Transaction.amount < 0)
+    elif sign > 0:
+        conditions.append(Transaction.amount > 0)
+    
+    if not include_transfers:
+        conditions.append(Transaction.is_transfer == 0)
+    
+    # Group by decrypted category (the raw column is per-row ciphertext)
+    return stmt.where(*conditions).group_by(category_expr)
+
+
+@functools.lru_cache(maxsize=None)
+def _monthly_totals_stmt(
+    range_shape: Tuple[bool, ...],
+    by_account: bool,
+    by_account_type: bool
+):
+    """Build the per-month non-transfer income/expense statement for a filter shape."""
+    # Amount is encrypted, so aggregate over the decrypted value explicitly
+    amount_expr = func.decrypt_numeric(Transaction.amount)
+    
+    stmt = select(
+        extract('year', Transaction.date).label('year'),
+        extract('month', Transaction.date).label('month'),
+        func.sum(case((amount_expr > 0, amount_expr), else_=0)).label('income'),
+        func.sum(case((amount_expr < 0, -amount_expr), else_=0)).label('expenses')
+    )
+    
+    stmt, conditions = _account_filter(stmt, by_account, by_account_type)
+    conditions[:0] = [
+        _date_range_filter(range_shape),
+        Transaction.is_transfer == 0,
+    ]
+    
+    stmt = stmt.where(*conditions)
+    return stmt.group_by('year', 'month').order_by('year', 'month')
+
+
+# Rows fetched per batch when streaming un-aggregated result sets
+_STREAM_BATCH_SIZE = 10_000
+
+
+def _stream_frames(session: Session, stmt, columns: List[str], params: Optional[Dict[str, Any]] = None):
+    """
+    Execute a statement in batches and yield each batch as a DataFrame.
+    
+    Rows are fetched with ``yield_per`` so only one batch of Row objects is held
+    in memory at a time.
+    
+    Args:
+        session: Open database session
+        stmt: Core statement to execute
+        columns: DataFrame column names for the selected columns
+        params: Optional bind parameters
+    
+    Yields:
+        DataFrame for each batch of up to _STREAM_BATCH_SIZE rows
+    """
+    import pandas as pd
+    
+    result = session.connection().execute(
+        stmt, params or {}, execution_options={'yield_per': _STREAM_BATCH_SIZE}
+    )
+    for batch in result.partitions():
+        yield pd.DataFrame(batch, columns=columns)
+
+
+def _sort_descending(df: pd.DataFrame, column: str) -> pd.DataFrame:
+    """
+    Sort a small frame by one numeric column, descending, with a fresh index.
+    
+    Per-account frames hold a few dozen rows, where sort_values' index and block
+    bookkeeping costs more than the sort itself; a stable argsort over the
+    column's array and one positional take avoid it.
+    
+    Args:
+        df: Frame to sort
+        column: Numeric column to sort by
+    
+    Returns:
+        Sorted frame with a 0..n-1 index
+    """
+    order = (-df[column].to_numpy(dtype=float)).argsort(kind='stable')
+    return df.iloc[order].reset_index(drop=True)
+
+
+def _filter_params(
+    account_id: Optional[int],
+    account_type: Optional[AccountType]
+) -> Tuple[bool, bool, Dict[str, Any]]:
+    """
+    Resolve the optional account filters into statement flags and bind parameters.
+    
+    Args:
+        account_id: Optional account ID filter (takes precedence)
+        account_type: Optional account type filter
+    
+    Returns:
+        Tuple of (by_account, by_account_type, params)
+    """
+    if account_id:
+        return True, False, {'account_id': account_id}
+    if account_type:
+        return False, True, {'account_type': account_type}
+    return False, False, {}
+
+
 class AnalyticsEngine:
     """
     Core analytics engine for financial data analysis.
@@ -43,8 +450,21 @@ class AnalyticsEngine:
             db_manager: Database manager instance
         """
         self.db_manager = db_manager
+        
+        # Short-lived cache of aggregate results shared by every engine on this
+        # database (e.g. across Streamlit reruns), cleared whenever data is committed
+        self._result_cache = shared_commit_cache(db_manager, "analytics")
+        
+        # Resolved lazily: pre-computed monthly aggregates are SQLite-only
+        self._monthly_aggregates_ready: Optional[bool] = None
+        
         logger.info("Analytics engine initialized")
     
+    @functools.cached_property
+    def _account_manager(self) -> AccountManager:
+        """Account manager sharing this engine's database manager, created on first use."""
+        return AccountManager(self.db_manager)
+    
     def parse_time_frame(self, time_frame: str) -> Tuple[datetime, datetime]:
         """
         Parse time frame string into start and end dates.
@@ -63,43 +483,11 @@ class AnalyticsEngine:
         Raises:
             ValueError: If time frame format is invalid
         """
-        now = datetime.now()
-        
-        # Handle 'all' time
-        if time_frame.lower() == 'all':
-            return datetime(1900, 1, 1), now
-        
-        # Handle custom date range
-        if ':' in time_frame:
-            try:
-                start_str, end_str = time_frame.split(':')
-                start_date = datetime.strptime(start_str, '%Y-%m-%d')
-                end_date = datetime.strptime(end_str, '%Y-%m-%d')
-                return start_date, end_date
-            except ValueError as e:
-                raise AnalyticsError(
-                    f"Invalid date range format. Use YYYY-MM-DD:YYYY-MM-DD: {e}",
-                    details={"time_frame": time_frame, "error": str(e)},
-                    original_error=e
-                )
-        
-        # Handle relative months (1m, 3m, 6m, 12m)
-        if time_frame.endswith('m'):
-            try:
-                months = int(time_frame[:-1])
-                start_date = now - timedelta(days=months * 30)  # Approximate
-                return start_date, now
-            except ValueError:
-                raise AnalyticsError(
-                    f"Invalid month format: {time_frame}",
-                    details={"time_frame": time_frame}
-                )
-        
-        raise AnalyticsError(
-            f"Invalid time frame format: {time_frame}. Use '1m', '3m', '6m', '12m', 'all', or 'YYYY-MM-DD:YYYY-MM-DD'",
-            details={"time_frame": time_frame}
-        )
+        # Parsed results are memoized per hour; see _resolve_time_frame
+        hour = datetime.now().replace(minute=0, second=0, microsecond=0)
+        return _resolve_time_frame(time_frame, hour)
     
+    @cached_method('_result_cache')
     def get_income_expense_summary(
         self,
         time_frame: str = 'all',
@@ -163,69 +551,61 @@ class AnalyticsEngine:
         session = self.db_manager.get_session()
         
         try:
-            # Build query with SQL aggregations using CASE statements
-            # SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END) for income
-            # SUM(CASE WHEN amount < 0 THEN ABS(amount) ELSE 0 END) for expenses
-            # COUNT(CASE WHEN amount > 0 THEN 1 END) for income count
-            # COUNT(CASE WHEN amount < 0 THEN 1 END) for expense count
-            
-            query = session.query(
-                func.sum(
-                    case((Transaction.amount > 0, Transaction.amount), else_=0)
-                ).label('total_income'),
-                func.sum(
-                    case((Transaction.amount < 0, func.abs(Transaction.amount)), else_=0)
-                ).label('total_expenses'),
-                func.count(
-                    case((Transaction.amount > 0, 1), else_=None)
-                ).label('income_count'),
-                func.count(
-                    case((Transaction.amount < 0, 1), else_=None)
-                ).label('expense_count'),
-                func.count(Transaction.id).label('total_count')
-            )
-            
-            # Build filter conditions
-            conditions = [
-                Transaction.date >= start_date,
-                Transaction.date <= end_date
-            ]
-            
-            # Apply account filters
-            if account_id:
-                conditions.append(Transaction.account_id == account_id)
-            elif account_type:
-                query = query.join(Account)
-                conditions.append(Account.type == account_type)
-            
-            # Apply category filter (case-insensitive partial match)
+            # Whole calendar months are read from pre-computed aggregates; only the
+            # partial edge months are scanned (category filters always scan)
+            full_months = None
+            scan_ranges = [(start_date, end_date, True)]
+            if not category_id and self._can_use_monthly_aggregates(start_date, end_date):
+                full_months, scan_ranges = _split_full_months(start_date, end_date)
+                if full_months and not self._refresh_monthly_aggregates(*full_months):
+                    full_months, scan_ranges = None, [(start_date, end_date, True)]
+            
+            total_income = 0.0
+            total_expenses = 0.0
+            income_count = 0
+            expense_count = 0
+            total_count = 0
+            
+            if full_months:
+                for row in self._query_aggregate_totals(
+                    session, *full_months, account_id, account_type, include_transfers=True
+                ):
+                    total_income += float(row.income or 0.0)
+                    total_expenses += float(row.expenses or 0.0)
+                    income_count += int(row.income_count or 0)
+                    expense_count += int(row.expense_count or 0)
+                    total_count += int(row.transaction_count or 0)
+            
+            # Reuse the prepared statement for this filter shape with fresh parameters
+            range_shape, params = _date_range_params(scan_ranges)
+            by_account, by_account_type, account_params = _filter_params(account_id, account_type)
+            params.update(account_params)
             if category_id:
-                # Note: category is encrypted, so we use ilike on the decrypted value
-                # In SQLAlchemy with encrypted fields, we need to handle this carefully
-                # For now, assuming the encryption layer supports pattern matching
-                conditions.append(Transaction.category.ilike(f"%{category_id}%"))
-            
-            # Apply all filters
-            query = query.filter(and_(*conditions))
+                params['category_tokens'] = self._match_category_tokens(session, category_id)
+            stmt = _summary_stmt(range_shape, by_account, by_account_type, bool(category_id))
             
             # Optional: Profile query if profiling is enabled
             if PROFILING_AVAILABLE and is_profiling_enabled():
                 try:
-                    profile_result = explain_query(session, query, analyze=True)
+                    profile_result = explain_query(session, stmt.params(**params), analyze=True)
                     log_query_performance("get_income_expense_summary", profile_result)
                 except Exception as e:
                     # Don't fail the query if profiling fails
                     logger.warning(f"Query profiling failed: {e}")
             
-            # Execute query - returns single row with aggregated results
-            result = query.one()
+            # Execute statement - returns single row with aggregated results
+            result = session.connection().execute(stmt, params).one()
             
             # Handle NULL results from SUM (occurs when no rows match)
-            total_income = float(result.total_income) if result.total_income is not None else 0.0
-            total_expenses = float(result.total_expenses) if result.total_expenses is not None else 0.0
-            income_count = int(result.income_count) if result.income_count is not None else 0
-            expense_count = int(result.expense_count) if result.expense_count is not None else 0
-            total_count = int(result.total_count) if result.total_count is not None else 0
+            total_income += float(result.total_income) if result.total_income is not None else 0.0
+            total_expenses += float(result.total_expenses) if result.total_expenses is not None else 0.0
+            scan_income_count = int(result.income_count) if result.income_count is not None else 0
+            scan_expense_count = int(result.expense_count) if result.expense_count is not None else 0
+            scan_zero_count = int(result.zero_count) if result.zero_count is not None else 0
+            income_count += scan_income_count
+            expense_count += scan_expense_count
+            # Amount is non-nullable, so every scanned row falls in exactly one bucket
+            total_count += scan_income_count + scan_expense_count + scan_zero_count
             
             return {
                 'total_income': total_income,
@@ -255,6 +635,7 @@ class AnalyticsEngine:
         finally:
             session.close()
     
+    @cached_method('_result_cache')
     def get_category_breakdown(
         self,
         time_frame: str = 'all',
@@ -276,55 +657,28 @@ class AnalyticsEngine:
         Returns:
             DataFrame with columns: category, total, count, percentage
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
         session = self.db_manager.get_session()
         
         try:
-            # Build query
-            query = session.query(
-                func.coalesce(Transaction.category, 'Uncategorized').label('category'),
-                func.sum(Transaction.amount).label('total'),
-                func.count(Transaction.id).label('count')
+            # Magnitudes and percentages are computed in SQL (see _category_stmt),
+            # so the frame only needs sorting
+            by_account, by_account_type, params = _filter_params(account_id, account_type)
+            params.update(start_date=start_date, end_date=end_date)
+            stmt = _category_stmt(
+                -1 if expense_only else 0, include_transfers, by_account, by_account_type
             )
             
-            conditions = [
-                Transaction.date >= start_date,
-                Transaction.date <= end_date,
-            ]
-            
-            if expense_only:
-                conditions.append(Transaction.amount < 0)
-            
-            if not include_transfers:
-                conditions.append(Transaction.is_transfer == 0)
-            
-            if account_id:
-                conditions.append(Transaction.account_id == account_id)
-            elif account_type:
-                query = query.join(Account)
-                conditions.append(Account.type == account_type)
-            
-            query = query.filter(*conditions)
-            
-            # Group by category
-            query = query.group_by('category')
-            
-            # Execute query
-            results = query.all()
+            # Execute on the Core connection (rows come back as plain tuples)
+            results = session.connection().execute(stmt, params).all()
             
             if not results:
                 return pd.DataFrame(columns=['category', 'total', 'count', 'percentage'])
             
             # Convert to DataFrame
-            df = pd.DataFrame(results, columns=['category', 'total', 'count'])
-            
-            # Calculate absolute values for expenses
-            if expense_only:
-                df['total'] = df['total'].abs()
-            
-            # Calculate percentages
-            total_sum = df['total'].sum()
-            df['percentage'] = (df['total'] / total_sum * 100) if total_sum > 0 else 0
+            df = pd.DataFrame(results, columns=['category', 'total', 'count', 'percentage'])
             
             # Sort by total descending
             df = df.sort_values('total', ascending=False).reset_index(drop=True)
@@ -338,6 +692,7 @@ class AnalyticsEngine:
         finally:
             session.close()
     
+    @cached_method('_result_cache')
     def get_income_breakdown(
         self,
         time_frame: str = 'all',
@@ -357,49 +712,25 @@ class AnalyticsEngine:
         Returns:
             DataFrame with columns: category, total, count, percentage
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
         session = self.db_manager.get_session()
         
         try:
-            # Build query for income (positive amounts)
-            query = session.query(
-                func.coalesce(Transaction.category, 'Uncategorized').label('category'),
-                func.sum(Transaction.amount).label('total'),
-                func.count(Transaction.id).label('count')
-            )
-            
-            conditions = [
-                Transaction.date >= start_date,
-                Transaction.date <= end_date,
-                Transaction.amount > 0,
-            ]
+            # Income is the positive-amount variant of the category statement
+            by_account, by_account_type, params = _filter_params(account_id, account_type)
+            params.update(start_date=start_date, end_date=end_date)
+            stmt = _category_stmt(1, include_transfers, by_account, by_account_type)
             
-            if not include_transfers:
-                conditions.append(Transaction.is_transfer == 0)
-            
-            if account_id:
-                conditions.append(Transaction.account_id == account_id)
-            elif account_type:
-                query = query.join(Account)
-                conditions.append(Account.type == account_type)
-            
-            query = query.filter(*conditions)
-            
-            # Group by category
-            query = query.group_by('category')
-            
-            # Execute query
-            results = query.all()
+            # Execute on the Core connection (rows come back as plain tuples)
+            results = session.connection().execute(stmt, params).all()
             
             if not results:
                 return pd.DataFrame(columns=['category', 'total', 'count', 'percentage'])
             
             # Convert to DataFrame
-            df = pd.DataFrame(results, columns=['category', 'total', 'count'])
-            
-            # Calculate percentages
-            total_sum = df['total'].sum()
-            df['percentage'] = (df['total'] / total_sum * 100) if total_sum > 0 else 0
+            df = pd.DataFrame(results, columns=['category', 'total', 'count', 'percentage'])
             
             # Sort by total descending
             df = df.sort_values('total', ascending=False).reset_index(drop=True)
@@ -413,11 +744,13 @@ class AnalyticsEngine:
         finally:
             session.close()
     
+    @cached_method('_result_cache', ignore=('session',))
     def get_monthly_trends(
         self,
         time_frame: str = '12m',
         account_id: Optional[int] = None,
-        account_type: Optional[AccountType] = None
+        account_type: Optional[AccountType] = None,
+        session: Optional[Session] = None
     ) -> pd.DataFrame:
         """
         Get monthly income and expense trends.
@@ -426,88 +759,469 @@ class AnalyticsEngine:
             time_frame: Time frame for analysis
             account_id: Optional account ID filter
             account_type: Optional account type filter
+            session: Optional session to reuse (left open); a new one is used otherwise
         
         Returns:
             DataFrame with columns: year, month, income, expenses, net
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
-        session = self.db_manager.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.db_manager.get_session()
         
         try:
-            # Build query
+            # Whole calendar months come from pre-computed aggregates; partial
+            # edge months are aggregated directly from transactions
+            full_months = None
+            scan_ranges = [(start_date, end_date, True)]
+            if self._can_use_monthly_aggregates(start_date, end_date):
+                full_months, scan_ranges = _split_full_months(start_date, end_date)
+                if full_months and not self._refresh_monthly_aggregates(*full_months):
+                    full_months, scan_ranges = None, [(start_date, end_date, True)]
+            
+            results = []
+            if full_months:
+                results.extend(
+                    (row.year, row.month, row.income, row.expenses)
+                    for row in self._query_aggregate_totals(
+                        session, *full_months, account_id, account_type, include_transfers=False
+                    )
+                    if row.transaction_count
+                )
+            results.extend(self._query_monthly_totals(
+                session, scan_ranges, account_id, account_type
+            ))
+            
+            if not results:
+                return pd.DataFrame(columns=['year', 'month', 'income', 'expenses', 'net', 'period'])
+            
+            result_df = self._build_monthly_df(results)
+            
+            logger.info(f"Generated monthly trends with {len(result_df)} months")
+            return result_df
+        
+        except Exception as e:
+            logger.error(f"Failed to get monthly trends: {e}", exc_info=True)
+            raise
+        finally:
+            if owns_session:
+                session.close()
+    
+    def _match_category_tokens(self, session: Session, category_id: str) -> List[str]:
+        """
+        Resolve a case-insensitive partial category match to search tokens.
+        
+        Only one representative row per distinct category is decrypted, so the
+        cost scales with the number of categories rather than transactions.
+        
+        Args:
+            session: Open database session
+            category_id: Category name fragment
+        
+        Returns:
+            List of category_index tokens whose category contains the fragment
+        """
+        representatives = select(func.min(Transaction.id)).where(
+            Transaction.category_index != BLANK_CATEGORY_INDEX
+        ).group_by(Transaction.category_index)
+        stmt = select(Transaction.category_index, Transaction.category).where(
+            Transaction.id.in_(representatives)
+        )
+        
+        needle = category_id.strip().lower()
+        return [
+            token
+            for token, category in session.connection().execute(stmt).all()
+            if category and needle in category.lower()
+        ]
+    
+    def _query_monthly_totals(
+        self,
+        session: Session,
+        ranges: List[Tuple[datetime, datetime, bool]],
+        account_id: Optional[int] = None,
+        account_type: Optional[AccountType] = None
+    ) -> List[Tuple[int, int, float, float]]:
+        """
+        Aggregate non-transfer income and expenses per calendar month in SQL.
+        
+        Args:
+            session: Open database session
+            ranges: List of (lower, upper, upper_inclusive) date ranges to include
+            account_id: Optional account ID filter
+            account_type: Optional account type filter
+        
+        Returns:
+            List of (year, month, income, expenses) rows ordered by year and month
+        """
+        range_shape, params = _date_range_params(ranges)
+        by_account, by_account_type, account_params = _filter_params(account_id, account_type)
+        params.update(account_params)
+        stmt = _monthly_totals_stmt(range_shape, by_account, by_account_type)
+        
+        # Execute on the Core connection to skip ORM row processing
+        return session.connection().execute(stmt, params).all()
+    
+    def _can_use_monthly_aggregates(self, start_date: datetime, end_date: datetime) -> bool:
+        """
+        Check whether pre-computed monthly aggregates can serve a date range.
+        
+        Aggregates require SQLite (triggers keep them fresh) and naive datetime
+        bounds so whole months can be split off the range.
+        
+        Args:
+            start_date: Inclusive start of the date range
+            end_date: Inclusive end of the date range
+        
+        Returns:
+            True if the aggregates table can be used
+        """
+        if not all(
+            isinstance(value, datetime) and value.tzinfo is None
+            for value in (start_date, end_date)
+        ):
+            return False
+        
+        if self._monthly_aggregates_ready is None:
+            engine = getattr(self.db_manager, 'engine', None)
+            dialect_name = getattr(getattr(engine, 'dialect', None), 'name', None)
+            if dialect_name != 'sqlite':
+                self._monthly_aggregates_ready = False
+            else:
+                try:
+                    self._monthly_aggregates_ready = bool(self.db_manager.ensure_monthly_aggregates())
+                except Exception as e:
+                    logger.warning(f"Monthly aggregates unavailable, scanning transactions: {e}")
+                    self._monthly_aggregates_ready = False
+        
+        return self._monthly_aggregates_ready
+    
+    def _refresh_monthly_aggregates(self, first_month: int, end_month: int) -> bool:
+        """
+        Rebuild monthly_aggregates rows for stale months in [first_month, end_month).
+        
+        A month is stale when it has no marker in monthly_aggregate_months;
+        markers are dropped by triggers whenever a transaction in that month is
+        inserted, updated or deleted. The range is clamped to months that
+        actually contain transactions.
+        
+        The rebuild runs in its own derived-data transaction, never on the
+        caller's session, so read-only and caller-managed sessions are left
+        untouched and commit listeners (read caches) are not fired.
+        
+        Args:
+            first_month: First month index (inclusive)
+            end_month: Last month index (exclusive)
+        
+        Returns:
+            True if the aggregates for the range are current, False if the
+            rebuild failed and callers should scan transactions instead
+        """
+        try:
+            with self.db_manager.derived_data_transaction() as connection:
+                self._rebuild_stale_months(connection, first_month, end_month)
+            return True
+        except SQLAlchemyError as e:
+            logger.warning(f"Monthly aggregate refresh failed, scanning transactions: {e}")
+            return False
+    
+    @staticmethod
+    def _rebuild_stale_months(connection: Connection, first_month: int, end_month: int) -> None:
+        """
+        Recompute stale months in [first_month, end_month) on an open connection.
+        
+        Args:
+            connection: Connection inside an open transaction
+            first_month: First month index (inclusive)
+            end_month: Last month index (exclusive)
+        """
+        bounds = connection.execute(
+            select(func.min(Transaction.date), func.max(Transaction.date))
+        ).one()
+        if bounds[0] is None:
+            return
+        first_month = max(first_month, _month_index(bounds[0].year, bounds[0].month))
+        end_month = min(end_month, _month_index(bounds[1].year, bounds[1].month) + 1)
+        if first_month >= end_month:
+            return
+        
+        marker_index = MonthlyAggregateMonth.year * 12 + MonthlyAggregateMonth.month - 1
+        built = {
+            _month_index(year, month)
+            for year, month in connection.execute(
+                select(MonthlyAggregateMonth.year, MonthlyAggregateMonth.month).where(
+                    marker_index >= first_month,
+                    marker_index < end_month
+                )
+            )
+        }
+        stale = [index for index in range(first_month, end_month) if index not in built]
+        if not stale:
+            return
+        
+        amount_expr = func.decrypt_numeric(Transaction.amount)
+        rows = connection.execute(
+            select(
+                extract('year', Transaction.date).label('year'),
+                extract('month', Transaction.date).label('month'),
+                Transaction.account_id,
+                Transaction.is_transfer,
+                func.sum(case((amount_expr > 0, amount_expr), else_=0)).label('income'),
+                func.sum(case((amount_expr < 0, -amount_expr), else_=0)).label('expenses'),
+                func.count(case((amount_expr > 0, 1), else_=None)).label('income_count'),
+                func.count(case((amount_expr < 0, 1), else_=None)).label('expense_count'),
+                func.count(Transaction.id).label('transaction_count')
+            ).where(
+                Transaction.date >= _month_start(stale[0]),
+                Transaction.date < _month_start(stale[-1] + 1)
+            ).group_by('year', 'month', Transaction.account_id, Transaction.is_transfer)
+        ).all()
+        
+        stale_set = set(stale)
+        aggregates = [
+            {
+                'year': int(row.year),
+                'month': int(row.month),
+                'account_id': row.account_id,
+                'is_transfer': row.is_transfer,
+                'income': float(row.income or 0.0),
+                'expenses': float(row.expenses or 0.0),
+                'income_count': row.income_count,
+                'expense_count': row.expense_count,
+                'transaction_count': row.transaction_count,
+            }
+            for row in rows
+            if _month_index(int(row.year), int(row.month)) in stale_set
+        ]
+        
+        aggregate_index = MonthlyAggregate.year * 12 + MonthlyAggregate.month - 1
+        connection.execute(delete(MonthlyAggregate).where(aggregate_index.in_(stale)))
+        if aggregates:
+            connection.execute(insert(MonthlyAggregate), aggregates)
+        connection.execute(delete(MonthlyAggregateMonth).where(marker_index.in_(stale)))
+        connection.execute(
+            insert(MonthlyAggregateMonth),
+            [{'year': index // 12, 'month': index % 12 + 1} for index in stale]
+        )
+        logger.info(f"Rebuilt monthly aggregates for {len(stale)} months")
+    
+    def _query_aggregate_totals(
+        self,
+        session: Session,
+        first_month: int,
+        end_month: int,
+        account_id: Optional[int] = None,
+        account_type: Optional[AccountType] = None,
+        include_transfers: bool = False
+    ) -> List[Any]:
+        """
+        Sum pre-computed monthly aggregates per month for [first_month, end_month).
+        
+        Args:
+            session: Open database session
+            first_month: First month index (inclusive)
+            end_month: Last month index (exclusive)
+            account_id: Optional account ID filter
+            account_type: Optional account type filter
+            include_transfers: If True, include internal transfers
+        
+        Returns:
+            Rows with year, month, income, expenses, income_count, expense_count
+            and transaction_count, ordered by year and month
+        """
+        aggregate_index = MonthlyAggregate.year * 12 + MonthlyAggregate.month - 1
+        stmt = select(
+            MonthlyAggregate.year,
+            MonthlyAggregate.month,
+            func.sum(func.decrypt_numeric(MonthlyAggregate.income)).label('income'),
+            func.sum(func.decrypt_numeric(MonthlyAggregate.expenses)).label('expenses'),
+            func.sum(MonthlyAggregate.income_count).label('income_count'),
+            func.sum(MonthlyAggregate.expense_count).label('expense_count'),
+            func.sum(MonthlyAggregate.transaction_count).label('transaction_count')
+        )
+        
+        conditions = [
+            aggregate_index >= first_month,
+            aggregate_index < end_month,
+        ]
+        
+        if not include_transfers:
+            conditions.append(MonthlyAggregate.is_transfer == 0)
+        
+        if account_id:
+            conditions.append(MonthlyAggregate.account_id == account_id)
+        elif account_type:
+            stmt = stmt.join_from(MonthlyAggregate, Account, MonthlyAggregate.account_id == Account.id)
+            conditions.append(Account.type == account_type)
+        
+        stmt = stmt.where(*conditions)
+        stmt = stmt.group_by(MonthlyAggregate.year, MonthlyAggregate.month)
+        stmt = stmt.order_by(MonthlyAggregate.year, MonthlyAggregate.month)
+        
+        return session.connection().execute(stmt).all()
+    
+    def _build_monthly_df(self, results: List[Tuple[int, int, float, float]]) -> pd.DataFrame:
+        """
+        Build the monthly trends DataFrame from aggregated (year, month, income, expenses) rows.
+        
+        Args:
+            results: Aggregated rows as returned by _query_monthly_totals
+        
+        Returns:
+            DataFrame with columns: year, month, income, expenses, net, period
+        """
+        import pandas as pd
+        
+        df = pd.DataFrame(results, columns=['year', 'month', 'income', 'expenses'])
+        df['year'] = df['year'].astype(int)
+        df['month'] = df['month'].astype(int)
+        df['income'] = df['income'].fillna(0.0).astype(float)
+        df['expenses'] = df['expenses'].fillna(0.0).astype(float)
+        df['net'] = df['income'] - df['expenses']
+        df['period'] = [f"{year}-{month:02d}" for year, month in zip(df['year'], df['month'])]
+        return df.sort_values(['year', 'month']).reset_index(drop=True)
+    
+    def get_trends_with_comparison(
+        self,
+        time_frame: str,
+        comparison_type: str,
+        account_id: Optional[int] = None,
+        account_type: Optional[AccountType] = None,
+        session: Optional[Session] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Get monthly trends for a time frame together with its comparison period.
+        
+        Both periods are aggregated in a single grouped query: each month is
+        bucketed into current and comparison income/expense columns using CASE
+        expressions over the two date windows.
+        
+        Args:
+            time_frame: Time frame for the current period
+            comparison_type: Type of comparison ('previous_month' or 'previous_year')
+            account_id: Optional account ID filter
+            account_type: Optional account type filter
+            session: Optional session to reuse (left open); a new one is used otherwise
+        
+        Returns:
+            Tuple of (current_df, comparison_df), each with columns:
+            year, month, income, expenses, net, period
+        
+        Raises:
+            AnalyticsError: If comparison_type is invalid
+        """
+        import pandas as pd
+        
+        if comparison_type not in ['previous_month', 'previous_year']:
+            raise AnalyticsError(
+                f"Invalid comparison_type: {comparison_type}. Must be 'previous_month' or 'previous_year'",
+                details={"comparison_type": comparison_type}
+            )
+        
+        cur_start, cur_end = self.parse_time_frame(time_frame)
+        months_back = 1 if comparison_type == 'previous_month' else 12
+        
+        # Comparison window covers whole months, shifted back from the current window
+        cmp_start_year, cmp_start_month = _shift_month(cur_start.year, cur_start.month, -months_back)
+        cmp_end_year, cmp_end_month = _shift_month(cur_end.year, cur_end.month, 1 - months_back)
+        cmp_start = datetime(cmp_start_year, cmp_start_month, 1)
+        cmp_end = datetime(cmp_end_year, cmp_end_month, 1)  # Exclusive upper bound
+        
+        owns_session = session is None
+        if owns_session:
+            session = self.db_manager.get_session()
+        
+        try:
+            amount_expr = func.decrypt_numeric(Transaction.amount)
+            in_current = and_(Transaction.date >= cur_start, Transaction.date <= cur_end)
+            in_comparison = and_(Transaction.date >= cmp_start, Transaction.date < cmp_end)
+            
             query = session.query(
                 extract('year', Transaction.date).label('year'),
                 extract('month', Transaction.date).label('month'),
-                Transaction.amount
+                func.sum(
+                    case((and_(in_current, amount_expr > 0), amount_expr), else_=0)
+                ).label('cur_income'),
+                func.sum(
+                    case((and_(in_current, amount_expr < 0), -amount_expr), else_=0)
+                ).label('cur_expenses'),
+                func.count(case((in_current, 1), else_=None)).label('cur_count'),
+                func.sum(
+                    case((and_(in_comparison, amount_expr > 0), amount_expr), else_=0)
+                ).label('cmp_income'),
+                func.sum(
+                    case((and_(in_comparison, amount_expr < 0), -amount_expr), else_=0)
+                ).label('cmp_expenses'),
+                func.count(case((in_comparison, 1), else_=None)).label('cmp_count')
             )
             
             conditions = [
-                Transaction.date >= start_date,
-                Transaction.date <= end_date,
+                Transaction.date >= min(cur_start, cmp_start),
+                Transaction.date <= cur_end,
                 Transaction.is_transfer == 0,
             ]
             
             if account_id:
                 conditions.append(Transaction.account_id == account_id)
             elif account_type:
-                query = query.join(Account)
+                query = query.join(Account, Transaction.account_id == Account.id)
                 conditions.append(Account.type == account_type)
             
             query = query.filter(*conditions)
+            query = query.group_by('year', 'month').order_by('year', 'month')
             
-            # Execute query and convert to DataFrame
             results = query.all()
             
-            if not results:
-                return pd.DataFrame(columns=['year', 'month', 'income', 'expenses', 'net', 'period'])
-            
-            df = pd.DataFrame(results, columns=['year', 'month', 'amount'])
-            
-            # Aggregate by year/month
-            grouped = df.groupby(['year', 'month'])
-            
-            monthly_data = []
-            for (year, month), group in grouped:
-                income = group[group['amount'] > 0]['amount'].sum()
-                expenses = group[group['amount'] < 0]['amount'].abs().sum()
-                net = income - expenses
-                
-                monthly_data.append({
-                    'year': int(year),
-                    'month': int(month),
-                    'income': income,
-                    'expenses': expenses,
-                    'net': net,
-                    'period': f"{int(year)}-{int(month):02d}"
-                })
-            
-            result_df = pd.DataFrame(monthly_data)
-            result_df = result_df.sort_values(['year', 'month']).reset_index(drop=True)
+            current_rows = []
+            comparison_rows = []
+            for year, month, cur_income, cur_expenses, cur_count, cmp_income, cmp_expenses, cmp_count in results:
+                if cur_count:
+                    current_rows.append((year, month, cur_income, cur_expenses))
+                if cmp_count:
+                    comparison_rows.append((year, month, cmp_income, cmp_expenses))
+            
+            empty_columns = ['year', 'month', 'income', 'expenses', 'net', 'period']
+            current_df = self._build_monthly_df(current_rows) if current_rows else pd.DataFrame(columns=empty_columns)
+            comparison_df = (
+                self._build_monthly_df(comparison_rows) if current_rows and comparison_rows
+                else pd.DataFrame(columns=empty_columns)
+            )
             
-            logger.info(f"Generated monthly trends with {len(result_df)} months")
-            return result_df
+            logger.info(
+                f"Generated monthly trends with {len(current_df)} months and "
+                f"{len(comparison_df)} {comparison_type} comparison months"
+            )
+            return current_df, comparison_df
         
         except Exception as e:
-            logger.error(f"Failed to get monthly trends: {e}", exc_info=True)
+            logger.error(f"Failed to get trends with comparison: {e}", exc_info=True)
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def get_comparison_data(
         self,
         current_df: pd.DataFrame,
         comparison_type: str,
         account_id: Optional[int] = None,
-        account_type: Optional[AccountType] = None
+        account_type: Optional[AccountType] = None,
+        session: Optional[Session] = None
     ) -> pd.DataFrame:
         """
         Get comparison data for a previous period based on current monthly trends.
         
+        Deprecated: prefer get_trends_with_comparison, which fetches the current
+        and comparison periods in a single query.
+        
         Args:
             current_df: DataFrame with current period monthly trends (must have 'year', 'month', 'period' columns)
             comparison_type: Type of comparison ('previous_month' or 'previous_year')
             account_id: Optional account ID filter (must match current_df filter)
             account_type: Optional account type filter (must match current_df filter)
+            session: Optional session to reuse (left open); a new one is used otherwise
         
         Returns:
             DataFrame with comparison period data in same format as current_df, or empty DataFrame if no data
@@ -515,6 +1229,8 @@ class AnalyticsEngine:
         Raises:
             ValueError: If comparison_type is invalid or current_df is empty
         """
+        import pandas as pd
+        
         if current_df.empty:
             logger.warning("Cannot get comparison data: current_df is empty")
             return pd.DataFrame(columns=['year', 'month', 'income', 'expenses', 'net', 'period'])
@@ -525,107 +1241,33 @@ class AnalyticsEngine:
                 details={"comparison_type": comparison_type}
             )
         
-        session = self.db_manager.get_session()
+        owns_session = session is None
+        if owns_session:
+            session = self.db_manager.get_session()
         
         try:
-            # Determine comparison period dates
-            # Get the date range from current_df
-            min_period = current_df['period'].min()
-            max_period = current_df['period'].max()
-            
-            # Parse period strings (format: YYYY-MM)
-            min_year, min_month = map(int, min_period.split('-'))
-            max_year, max_month = map(int, max_period.split('-'))
-            
-            if comparison_type == 'previous_month':
-                # Shift all months back by 1
-                comparison_periods = []
-                for _, row in current_df.iterrows():
-                    year = row['year']
-                    month = row['month']
-                    # Calculate previous month
-                    if month == 1:
-                        prev_year = year - 1
-                        prev_month = 12
-                    else:
-                        prev_year = year
-                        prev_month = month - 1
-                    comparison_periods.append((prev_year, prev_month))
-                
-                # Get date range for comparison
-                start_year, start_month = comparison_periods[0]
-                end_year, end_month = comparison_periods[-1]
-                
-            elif comparison_type == 'previous_year':
-                # Shift all years back by 1, keep same months
-                comparison_periods = []
-                for _, row in current_df.iterrows():
-                    prev_year = row['year'] - 1
-                    prev_month = row['month']
-                    comparison_periods.append((prev_year, prev_month))
-                
-                # Get date range for comparison
-                start_year, start_month = comparison_periods[0]
-                end_year, end_month = comparison_periods[-1]
-            
-            # Calculate date range (first day of first month to last day of last month)
-            start_date = datetime(start_year, start_month, 1)
-            # Last day of end month
-            if end_month == 12:
-                end_date = datetime(end_year + 1, 1, 1) - timedelta(days=1)
-            else:
-                end_date = datetime(end_year, end_month + 1, 1) - timedelta(days=1)
-            
-            # Build query (same logic as get_monthly_trends)
-            query = session.query(
-                extract('year', Transaction.date).label('year'),
-                extract('month', Transaction.date).label('month'),
-                Transaction.amount
-            ).filter(
-                and_(
-                    Transaction.date >= start_date,
-                    Transaction.date <= end_date
-                )
+            # Comparison bounds follow directly from the first and last current periods
+            min_year, min_month = map(int, current_df['period'].min().split('-'))
+            max_year, max_month = map(int, current_df['period'].max().split('-'))
+            months_back = 1 if comparison_type == 'previous_month' else 12
+            
+            # Whole months from the shifted first month up to (excluding) the month
+            # after the shifted last month
+            start_index = _month_index(*_shift_month(min_year, min_month, -months_back))
+            end_index = _month_index(*_shift_month(max_year, max_month, -months_back)) + 1
+            
+            results = self._query_monthly_totals(
+                session,
+                [(_month_start(start_index), _month_start(end_index), False)],
+                account_id,
+                account_type
             )
             
-            # Exclude transfers
-            query = query.filter(Transaction.is_transfer == 0)
-            
-            # Apply account filters (must match current_df filters)
-            if account_id:
-                query = query.filter(Transaction.account_id == account_id)
-            elif account_type:
-                query = query.join(Account).filter(Account.type == account_type)
-            
-            # Execute query
-            results = query.all()
-            
             if not results:
                 logger.info(f"No comparison data found for {comparison_type}")
                 return pd.DataFrame(columns=['year', 'month', 'income', 'expenses', 'net', 'period'])
             
-            df = pd.DataFrame(results, columns=['year', 'month', 'amount'])
-            
-            # Aggregate by year/month
-            grouped = df.groupby(['year', 'month'])
-            
-            monthly_data = []
-            for (year, month), group in grouped:
-                income = group[group['amount'] > 0]['amount'].sum()
-                expenses = group[group['amount'] < 0]['amount'].abs().sum()
-                net = income - expenses
-                
-                monthly_data.append({
-                    'year': int(year),
-                    'month': int(month),
-                    'income': income,
-                    'expenses': expenses,
-                    'net': net,
-                    'period': f"{int(year)}-{int(month):02d}"
-                })
-            
-            result_df = pd.DataFrame(monthly_data)
-            result_df = result_df.sort_values(['year', 'month']).reset_index(drop=True)
+            result_df = self._build_monthly_df(results)
             
             logger.info(f"Generated comparison data with {len(result_df)} months for {comparison_type}")
             return result_df
@@ -634,7 +1276,8 @@ class AnalyticsEngine:
             logger.error(f"Failed to get comparison data: {e}", exc_info=True)
             raise
         finally:
-            session.close()
+            if owns_session:
+                session.close()
     
     def calculate_percentage_changes(
         self,
@@ -662,41 +1305,27 @@ class AnalyticsEngine:
                 'net': {'current': 0.0, 'comparison': 0.0, 'change': 0.0, 'percent_change': 0.0}
             }
         
-        current_income = current_df['income'].sum()
-        current_expenses = current_df['expenses'].sum()
-        current_net = current_df['net'].sum()
+        metrics = ['income', 'expenses', 'net']
+        current = current_df[metrics].sum().astype(float)
+        comparison = comparison_df[metrics].sum().astype(float)
+        change = current - comparison
         
-        comp_income = comparison_df['income'].sum()
-        comp_expenses = comparison_df['expenses'].sum()
-        comp_net = comparison_df['net'].sum()
-        
-        def calc_percent_change(current: float, comparison: float) -> float:
-            """Calculate percentage change, handling zero comparison values."""
-            if comparison == 0:
-                return 100.0 if current > 0 else (0.0 if current == 0 else -100.0)
-            return ((current - comparison) / abs(comparison)) * 100.0
+        # A zero comparison value maps to +/-100% (or 0% if both are zero); the
+        # division by zero yields inf there and is replaced by the mask
+        zero_base = current.gt(0) * 100.0 - current.lt(0) * 100.0
+        percent_change = (change / comparison.abs() * 100.0).where(comparison != 0, zero_base)
         
         return {
-            'income': {
-                'current': current_income,
-                'comparison': comp_income,
-                'change': current_income - comp_income,
-                'percent_change': calc_percent_change(current_income, comp_income)
-            },
-            'expenses': {
-                'current': current_expenses,
-                'comparison': comp_expenses,
-                'change': current_expenses - comp_expenses,
-                'percent_change': calc_percent_change(current_expenses, comp_expenses)
-            },
-            'net': {
-                'current': current_net,
-                'comparison': comp_net,
-                'change': current_net - comp_net,
-                'percent_change': calc_percent_change(current_net, comp_net)
+            metric: {
+                'current': current[metric],
+                'comparison': comparison[metric],
+                'change': change[metric],
+                'percent_change': percent_change[metric]
             }
+            for metric in metrics
         }
     
+    @cached_method('_result_cache')
     def get_account_summary(
         self,
         time_frame: str = 'all'
@@ -710,55 +1339,56 @@ class AnalyticsEngine:
         Returns:
             DataFrame with columns: account_name, type, income, expenses, net, count
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
         session = self.db_manager.get_session()
         
         try:
-            # Query transactions with account info
-            query = session.query(
-                Account.name,
-                Account.type,
+            # Stream only (account_id, amount) pairs: narrow numeric rows build
+            # frames and group far faster than rows carrying names and enums
+            stmt = select(
+                Transaction.account_id,
                 Transaction.amount
-            ).join(
-                Transaction, Transaction.account_id == Account.id
-            ).filter(
-                and_(
-                    Transaction.date >= start_date,
-                    Transaction.date <= end_date
-                )
+            ).where(
+                Transaction.account_id.isnot(None),
+                Transaction.date >= start_date,
+                Transaction.date <= end_date
             )
             
-            results = query.all()
+            # Aggregate each batch so peak memory is bounded by the batch size
+            # rather than the number of transactions
+            partials = []
+            for chunk in _stream_frames(session, stmt, ['account_id', 'amount']):
+                amount = chunk['amount']
+                totals = pd.DataFrame({
+                    'income': amount.clip(lower=0),
+                    'expenses': (-amount).clip(lower=0),
+                    'count': 1
+                })
+                partials.append(totals.groupby(chunk['account_id'].to_numpy(), sort=False).sum())
             
-            if not results:
+            if not partials:
                 return pd.DataFrame(columns=['account_name', 'type', 'income', 'expenses', 'net', 'count'])
             
-            df = pd.DataFrame(results, columns=['account_name', 'type', 'amount'])
-            
-            # Convert AccountType enum to string for grouping
-            df['type'] = df['type'].apply(lambda x: x.value if hasattr(x, 'value') else str(x))
-            
-            # Aggregate by account
-            grouped = df.groupby(['account_name', 'type'])
-            
-            account_data = []
-            for (account_name, account_type), group in grouped:
-                income = group[group['amount'] > 0]['amount'].sum()
-                expenses = group[group['amount'] < 0]['amount'].abs().sum()
-                net = income - expenses
-                count = len(group)
-                
-                account_data.append({
-                    'account_name': account_name,
-                    'type': account_type,  # Already converted to string above
-                    'income': income,
-                    'expenses': expenses,
-                    'net': net,
-                    'count': count
-                })
+            # Merge the per-batch totals (a no-op regroup for single-batch results)
+            totals = pd.concat(partials).groupby(level=0, sort=False).sum()
+            
+            # Attach names and types from a single lookup over the matched accounts
+            accounts = session.connection().execute(
+                select(Account.id, Account.name, Account.type).where(
+                    Account.id.in_([int(account_id) for account_id in totals.index])
+                )
+            ).all()
+            accounts_df = pd.DataFrame(accounts, columns=['account_id', 'account_name', 'type'])
+            accounts_df['type'] = accounts_df['type'].map(lambda x: x.value if hasattr(x, 'value') else str(x))
+            
+            result_df = accounts_df.join(totals, on='account_id', how='inner')
+            
+            result_df['net'] = result_df['income'] - result_df['expenses']
+            result_df = result_df[['account_name', 'type', 'income', 'expenses', 'net', 'count']]
             
-            result_df = pd.DataFrame(account_data)
-            result_df = result_df.sort_values('expenses', ascending=False).reset_index(drop=True)
+            result_df = _sort_descending(result_df, 'expenses')
             
             logger.info(f"Generated account summary with {len(result_df)} accounts")
             return result_df
@@ -769,6 +1399,158 @@ class AnalyticsEngine:
         finally:
             session.close()
     
+    @cached_method('_result_cache')
+    def get_full_breakdown(
+        self,
+        time_frame: str = 'all',
+        account_id: Optional[int] = None,
+        include_transfers: bool = False
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get spending, income, account and monthly breakdowns in one round trip.
+        
+        SQLite has no GROUPING SETS, so the four groupings are combined with
+        UNION ALL into a single statement and the rows are dispatched on a
+        ``grouping`` discriminator column. Each frame matches the output of the
+        corresponding single-purpose method for the same filters.
+        
+        Args:
+            time_frame: Time frame for analysis
+            account_id: Optional account ID filter (categories and monthly trends)
+            include_transfers: If True, include internal transfers in the category breakdowns
+        
+        Returns:
+            Dictionary with keys:
+            - categories: as get_category_breakdown (expenses)
+            - income_categories: as get_income_breakdown
+            - accounts: as get_account_summary
+            - monthly: as get_monthly_trends
+        """
+        import pandas as pd
+        
+        start_date, end_date = self.parse_time_frame(time_frame)
+        session = self.db_manager.get_session()
+        
+        try:
+            amount_expr = func.decrypt_numeric(Transaction.amount)
+            category_expr = func.coalesce(func.decrypt_text(Transaction.category), 'Uncategorized')
+            year_expr = extract('year', Transaction.date)
+            month_expr = extract('month', Transaction.date)
+            income_expr = func.sum(case((amount_expr > 0, amount_expr), else_=0))
+            expenses_expr = func.sum(case((amount_expr < 0, -amount_expr), else_=0))
+            
+            in_range = [Transaction.date >= start_date, Transaction.date <= end_date]
+            account_filter = [Transaction.account_id == account_id] if account_id else []
+            transfer_filter = [] if include_transfers else [Transaction.is_transfer == 0]
+            
+            def grouping(name, label, year, month, income, expenses):
+                return [
+                    literal(name).label('grouping'),
+                    label.label('label'),
+                    year.label('year'),
+                    month.label('month'),
+                    income.label('income'),
+                    expenses.label('expenses'),
+                    func.count(Transaction.id).label('count'),
+                ]
+            
+            categories = select(*grouping(
+                'categories', category_expr, null(), null(), null(), func.sum(func.abs(amount_expr))
+            )).where(
+                *in_range, Transaction.amount < 0, *transfer_filter, *account_filter
+            ).group_by(category_expr)
+            
+            income_categories = select(*grouping(
+                'income_categories', category_expr, null(), null(), func.sum(amount_expr), null()
+            )).where(
+                *in_range, Transaction.amount > 0, *transfer_filter, *account_filter
+            ).group_by(category_expr)
+            
+            # Accounts are keyed by id here; names are decrypted in the lookup below
+            accounts = select(*grouping(
+                'accounts', Transaction.account_id, null(), null(), income_expr, expenses_expr
+            )).where(
+                *in_range, Transaction.account_id.isnot(None)
+            ).group_by(Transaction.account_id)
+            
+            monthly = select(*grouping(
+                'monthly', null(), year_expr, month_expr, income_expr, expenses_expr
+            )).where(
+                *in_range, Transaction.is_transfer == 0, *account_filter
+            ).group_by(year_expr, month_expr)
+            
+            stmt = union_all(categories, income_categories, accounts, monthly)
+            rows = pd.DataFrame(
+                session.connection().execute(stmt).all(),
+                columns=['grouping', 'label', 'year', 'month', 'income', 'expenses', 'count']
+            )
+            by_grouping = {name: frame for name, frame in rows.groupby('grouping', sort=False)}
+            
+            def category_frame(name: str, total_column: str) -> pd.DataFrame:
+                frame = by_grouping.get(name)
+                if frame is None:
+                    return pd.DataFrame(columns=['category', 'total', 'count', 'percentage'])
+                df = pd.DataFrame({
+                    'category': frame['label'].to_numpy(),
+                    'total': frame[total_column].astype(float).to_numpy(),
+                    'count': frame['count'].astype(int).to_numpy(),
+                })
+                grand_total = df['total'].sum()
+                df['percentage'] = df['total'] / grand_total * 100 if grand_total else 0.0
+                return df.sort_values('total', ascending=False).reset_index(drop=True)
+            
+            result = {
+                'categories': category_frame('categories', 'expenses'),
+                'income_categories': category_frame('income_categories', 'income'),
+            }
+            
+            account_rows = by_grouping.get('accounts')
+            if account_rows is None:
+                result['accounts'] = pd.DataFrame(
+                    columns=['account_name', 'type', 'income', 'expenses', 'net', 'count']
+                )
+            else:
+                totals = account_rows.assign(account_id=account_rows['label'].astype(int))
+                lookup = session.connection().execute(
+                    select(Account.id, Account.name, Account.type).where(
+                        Account.id.in_(totals['account_id'].tolist())
+                    )
+                ).all()
+                accounts_df = pd.DataFrame(lookup, columns=['account_id', 'account_name', 'type'])
+                accounts_df['type'] = accounts_df['type'].map(lambda x: x.value if hasattr(x, 'value') else str(x))
+                accounts_df = accounts_df.merge(
+                    totals[['account_id', 'income', 'expenses', 'count']], on='account_id'
+                )
+                accounts_df['income'] = accounts_df['income'].astype(float)
+                accounts_df['expenses'] = accounts_df['expenses'].astype(float)
+                accounts_df['count'] = accounts_df['count'].astype(int)
+                accounts_df['net'] = accounts_df['income'] - accounts_df['expenses']
+                result['accounts'] = _sort_descending(
+                    accounts_df[['account_name', 'type', 'income', 'expenses', 'net', 'count']],
+                    'expenses'
+                )
+            
+            monthly_rows = by_grouping.get('monthly')
+            if monthly_rows is None:
+                result['monthly'] = pd.DataFrame(columns=['year', 'month', 'income', 'expenses', 'net', 'period'])
+            else:
+                result['monthly'] = self._build_monthly_df(list(zip(
+                    monthly_rows['year'], monthly_rows['month'],
+                    monthly_rows['income'], monthly_rows['expenses']
+                )))
+            
+            logger.info(
+                f"Generated full breakdown with {len(result['categories'])} spending categories, "
+                f"{len(result['accounts'])} accounts and {len(result['monthly'])} months"
+            )
+            return result
+        
+        except Exception as e:
+            logger.error(f"Failed to get full breakdown: {e}", exc_info=True)
+            raise
+        finally:
+            session.close()
+    
     def get_account_summary_refined(
         self,
         as_of_date: Optional[str] = None
@@ -791,24 +1573,26 @@ class AnalyticsEngine:
             - 'assets_total': Float total assets
             - 'liabilities_total': Float total liabilities
         """
-        from account_management import AccountManager
-        from datetime import datetime, date
+        import pandas as pd
         
-        # Parse as_of_date if provided
+        # Parse as_of_date if provided (the regex pins YYYY-MM-DD, so malformed
+        # input falls back without raising; fromisoformat validates the values)
         query_date = None
-        if as_of_date:
+        if as_of_date and _DATE_RE.match(as_of_date):
             try:
-                query_date = datetime.strptime(as_of_date, '%Y-%m-%d').date()
+                query_date = date.fromisoformat(as_of_date)
             except ValueError:
+                pass
+        if query_date is None:
+            if as_of_date:
                 logger.warning(f"Invalid date format: {as_of_date}, using today")
-                query_date = date.today()
-        else:
             query_date = date.today()
         
-        account_manager = AccountManager(self.db_manager)
-        accounts = account_manager.list_accounts()
+        # Signed balances for all accounts come from one bulk query set rather
+        # than separate override/sum/type lookups per account
+        account_data = self._account_manager.get_signed_balances_bulk(query_date)
         
-        if not accounts:
+        if not account_data['id']:
             return {
                 'assets': pd.DataFrame(columns=['id', 'name', 'type', 'balance']),
                 'liabilities': pd.DataFrame(columns=['id', 'name', 'type', 'balance']),
@@ -817,31 +1601,25 @@ class AnalyticsEngine:
                 'liabilities_total': 0.0
             }
         
-        # Get signed balances for all accounts
-        account_data = []
-        for acc in accounts:
-            signed_balance = account_manager.get_signed_balance(acc.id, query_date)
-            account_data.append({
-                'id': acc.id,
-                'name': acc.name,
-                'type': acc.type.value,
-                'balance': signed_balance
-            })
-        
-        # Create DataFrame
-        df = pd.DataFrame(account_data)
-        
-        # Split into assets and liabilities
-        assets_df = df[df['balance'] >= 0].copy()
-        liabilities_df = df[df['balance'] < 0].copy()
-        
-        # Sort: assets descending, liabilities ascending (least negative first)
-        assets_df = assets_df.sort_values('balance', ascending=False).reset_index(drop=True)
-        liabilities_df = liabilities_df.sort_values('balance', ascending=False).reset_index(drop=True)
-        
-        # Calculate totals
-        assets_total = assets_df['balance'].sum() if not assets_df.empty else 0.0
-        liabilities_total = liabilities_df['balance'].sum() if not liabilities_df.empty else 0.0
+        # Columns arrive as lists, so the frame is built per column with fixed dtypes
+        df = pd.DataFrame({
+            'id': pd.Series(account_data['id'], dtype='int64'),
+            'name': account_data['name'],
+            'type': account_data['type'],
+            'balance': pd.Series(account_data['balance'], dtype='float64')
+        })
+        
+        # Sort once (descending) and split on a single mask; both halves keep the
+        # order: assets descending, liabilities least negative first
+        df = _sort_descending(df, 'balance')
+        balances = df['balance'].to_numpy()
+        is_asset = balances >= 0
+        assets_df = df[is_asset].reset_index(drop=True)
+        liabilities_df = df[~is_asset].reset_index(drop=True)
+        
+        # Calculate totals from the same mask
+        assets_total = float(balances[is_asset].sum())
+        liabilities_total = float(balances[~is_asset].sum())
         net_worth = assets_total + liabilities_total
         
         logger.info(
@@ -876,45 +1654,47 @@ class AnalyticsEngine:
         Returns:
             DataFrame with transaction details
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
         session = self.db_manager.get_session()
         
         try:
-            # Build query
-            query = session.query(Transaction).filter(
-                and_(
-                    Transaction.date >= start_date,
-                    Transaction.date <= end_date
-                )
+            # Select only the displayed columns; amount is encrypted, so it is
+            # filtered and ordered on its decrypted value
+            amount_expr = func.decrypt_numeric(Transaction.amount)
+            stmt = select(
+                Transaction.date,
+                Transaction.description,
+                Transaction.amount,
+                Transaction.category
+            ).where(
+                Transaction.date >= start_date,
+                Transaction.date <= end_date
             )
             
             # Filter by transaction type
             if transaction_type == 'expenses':
-                query = query.filter(Transaction.amount < 0).order_by(Transaction.amount.asc())
+                stmt = stmt.where(amount_expr < 0).order_by(amount_expr.asc())
             elif transaction_type == 'income':
-                query = query.filter(Transaction.amount > 0).order_by(Transaction.amount.desc())
+                stmt = stmt.where(amount_expr > 0).order_by(amount_expr.desc())
             else:  # all
-                query = query.order_by(func.abs(Transaction.amount).desc())
+                stmt = stmt.order_by(func.abs(amount_expr).desc())
             
             # Apply account filter
             if account_id:
-                query = query.filter(Transaction.account_id == account_id)
+                stmt = stmt.where(Transaction.account_id == account_id)
             
             # Limit results
-            transactions = query.limit(limit).all()
+            rows = session.connection().execute(stmt.limit(limit)).all()
             
-            if not transactions:
+            if not rows:
                 return pd.DataFrame(columns=['date', 'description', 'amount', 'category'])
             
-            # Convert to DataFrame
-            data = [{
-                'date': t.date.strftime('%Y-%m-%d'),
-                'description': t.description,
-                'amount': t.amount,
-                'category': t.category or 'Uncategorized'
-            } for t in transactions]
-            
-            df = pd.DataFrame(data)
+            # Format and fill whole columns rather than per row
+            df = pd.DataFrame(rows, columns=['date', 'description', 'amount', 'category'])
+            df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+            df['category'] = df['category'].fillna('Uncategorized')
             logger.info(f"Retrieved top {len(df)} {transaction_type}")
             return df
         
@@ -924,6 +1704,7 @@ class AnalyticsEngine:
         finally:
             session.close()
     
+    @cached_method('_result_cache')
     def get_comparison_periods(
         self,
         periods: List[str]
@@ -931,33 +1712,67 @@ class AnalyticsEngine:
         """
         Compare spending across multiple time periods.
         
+        All periods are aggregated by a single statement. Periods that fail to
+        parse, or all periods if the query fails, are reported as zeros.
+        
         Args:
             periods: List of time frame strings (e.g., ['1m', '3m', '6m'])
         
         Returns:
             DataFrame with period comparisons
         """
-        comparisons = []
+        import pandas as pd
         
+        bounds = {}
         for period in periods:
             try:
-                summary = self.get_income_expense_summary(time_frame=period)
-                comparisons.append({
-                    'period': period,
-                    'income': summary['total_income'],
-                    'expenses': summary['total_expenses'],
-                    'net': summary['net_change'],
-                    'transactions': summary['total_count']
-                })
+                bounds[period] = self.parse_time_frame(period)
             except Exception as e:
                 logger.warning(f"Failed to get data for period {period}: {e}")
-                comparisons.append({
-                    'period': period,
-                    'income': 0,
-                    'expenses': 0,
-                    'net': 0,
-                    'transactions': 0
-                })
+        
+        # One scan over the union of all periods; each period is a set of
+        # conditional aggregates over its own date range
+        totals = {}
+        if bounds:
+            session = self.db_manager.get_session()
+            try:
+                amount_expr = func.decrypt_numeric(Transaction.amount)
+                columns = []
+                for index, (start_date, end_date) in enumerate(bounds.values()):
+                    in_period = and_(Transaction.date >= start_date, Transaction.date <= end_date)
+                    income = case((and_(in_period, amount_expr > 0), amount_expr), else_=0)
+                    expenses = case((and_(in_period, amount_expr < 0), -amount_expr), else_=0)
+                    columns += [
+                        func.sum(income).label(f'income_{index}'),
+                        func.sum(expenses).label(f'expenses_{index}'),
+                        func.count(case((in_period, 1), else_=None)).label(f'count_{index}'),
+                    ]
+                stmt = select(*columns).where(
+                    Transaction.date >= min(start for start, _ in bounds.values()),
+                    Transaction.date <= max(end for _, end in bounds.values())
+                )
+                row = session.connection().execute(stmt).one()._mapping
+                for index, period in enumerate(bounds):
+                    totals[period] = (
+                        float(row[f'income_{index}'] or 0.0),
+                        float(row[f'expenses_{index}'] or 0.0),
+                        int(row[f'count_{index}'] or 0)
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to get data for periods {list(bounds)}: {e}")
+            finally:
+                session.close()
+        
+        comparisons = []
+        for period in periods:
+            income, expenses, count = totals.get(period, (0, 0, 0))
+            comparisons.append({
+                'period': period,
+                'income': income,
+                'expenses': expenses,
+                'net': income - expenses,
+                'transactions': count
+            })
         
         df = pd.DataFrame(comparisons)
         logger.info(f"Generated comparison for {len(periods)} periods")
@@ -978,47 +1793,42 @@ class AnalyticsEngine:
         Returns:
             DataFrame with transfer details: date, description, amount, account, category
         """
+        import pandas as pd
+        
         start_date, end_date = self.parse_time_frame(time_frame)
         session = self.db_manager.get_session()
         
         try:
-            # Build query for transfers only
-            query = session.query(Transaction).filter(
-                and_(
-                    Transaction.date >= start_date,
-                    Transaction.date <= end_date,
-                    Transaction.is_transfer == 1
-                )
+            columns = ['id', 'date', 'description', 'amount', 'account', 'category']
+            
+            # Select the transfer columns directly instead of hydrating Transaction objects
+            stmt = select(
+                Transaction.id,
+                Transaction.date,
+                Transaction.description,
+                Transaction.amount,
+                Transaction.account,
+                Transaction.category
+            ).where(
+                Transaction.date >= start_date,
+                Transaction.date <= end_date,
+                Transaction.is_transfer == 1
             )
             
             # Apply account filter if provided
             if account_id:
-                query = query.filter(Transaction.account_id == account_id)
+                stmt = stmt.where(Transaction.account_id == account_id)
             
             # Order by date descending (most recent first)
-            query = query.order_by(Transaction.date.desc())
-            
-            # Execute query
-            transfers = query.all()
+            result = session.connection().execute(stmt.order_by(Transaction.date.desc()))
             
-            if not transfers:
-                return pd.DataFrame(columns=[
-                    'id', 'date', 'description', 'amount', 'account', 'category'
-                ])
-            
-            # Convert to DataFrame
-            data = []
-            for trans in transfers:
-                data.append({
-                    'id': trans.id,
-                    'date': trans.date,
-                    'description': trans.description,
-                    'amount': trans.amount,
-                    'account': trans.account or 'Unknown',
-                    'category': trans.category or 'Transfer'
-                })
+            # from_records consumes the cursor directly, without first building a list of rows
+            df = pd.DataFrame.from_records(result, columns=columns)
+            if df.empty:
+                return df
             
-            df = pd.DataFrame(data)
+            df['account'] = df['account'].fillna('Unknown')
+            df['category'] = df['category'].fillna('Transfer')
             logger.info(f"Retrieved {len(df)} transfers")
             return df
             
@@ -6,23 +6,60 @@ which allow setting a known balance as of a specific date when historical
 transaction data is incomplete.
 """
 
+from __future__ import annotations
+
 import logging
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime, date
 
-from database_ops import DatabaseManager
-from account_management import AccountManager
+# The database stack (SQLAlchemy, encryption) and tabulate are imported when a
+# command runs, so importing this module stays cheap
+if TYPE_CHECKING:
+    from database_ops import DatabaseManager
+    from account_management import AccountManager
 
 logger = logging.getLogger(__name__)
 
 
+def _get_account_manager(
+    db_manager: DatabaseManager,
+    account_manager: Optional[AccountManager]
+) -> AccountManager:
+    """Return the given account manager, or create one for db_manager."""
+    if account_manager is not None:
+        return account_manager
+    from account_management import AccountManager
+    return AccountManager(db_manager)
+
+
+def _load_override_state(
+    db_manager: DatabaseManager,
+    account_manager: AccountManager,
+    account_name: str
+):
+    """
+    Look up an account and its override state in one read-only session.
+    
+    Returns:
+        Tuple of (account, state from get_override_state), or (None, None) if
+        the account does not exist
+    """
+    with db_manager.read_session() as session:
+        account = account_manager.get_account_by_name(account_name, session=session)
+        if not account:
+            return None, None
+        account_id = account.id if hasattr(account, 'id') else account['id']
+        return account, account_manager.get_override_state(account_id, session=session)
+
+
 def set_balance_override_cli(
     db_manager: DatabaseManager,
     account_name: str,
     override_date_str: str,
     override_balance: float,
-    notes: Optional[str] = None
+    notes: Optional[str] = None,
+    account_manager: Optional[AccountManager] = None
 ) -> bool:
     """
     Set a balance override via CLI command.
@@ -33,11 +70,12 @@ def set_balance_override_cli(
         override_date_str: Override date as string (YYYY-MM-DD)
         override_balance: Known balance as of override_date
         notes: Optional notes
+        account_manager: Optional AccountManager to reuse instead of creating one
     
     Returns:
         True if successful, False otherwise
     """
-    account_manager = AccountManager(db_manager)
+    account_manager = _get_account_manager(db_manager, account_manager)
     
     # Get account
     account = account_manager.get_account_by_name(account_name)
@@ -50,7 +88,7 @@ def set_balance_override_cli(
     
     # Parse date
     try:
-        override_date = datetime.strptime(override_date_str, '%Y-%m-%d').date()
+        override_date = date.fromisoformat(override_date_str)
     except ValueError:
         print(f"Error: Invalid date format '{override_date_str}'. Use YYYY-MM-DD", file=sys.stderr)
         return False
@@ -88,7 +126,8 @@ def set_balance_override_cli(
 
 def list_balance_overrides_cli(
     db_manager: DatabaseManager,
-    account_name: str
+    account_name: str,
+    account_manager: Optional[AccountManager] = None
 ) -> None:
     """
     List all balance overrides for an account.
@@ -96,51 +135,63 @@ def list_balance_overrides_cli(
     Args:
         db_manager: DatabaseManager instance
         account_name: Name of account
+        account_manager: Optional AccountManager to reuse instead of creating one
     """
-    account_manager = AccountManager(db_manager)
+    account_manager = _get_account_manager(db_manager, account_manager)
     
-    # Get account
-    account = account_manager.get_account_by_name(account_name)
+    # Get account, overrides and the current balance with override in one session
+    account, state = _load_override_state(db_manager, account_manager, account_name)
     if not account:
         print(f"Error: Account '{account_name}' not found", file=sys.stderr)
         return
     
-    # Get account ID
-    account_id = account.id if hasattr(account, 'id') else account['id']
-    
-    # Get overrides
-    overrides = account_manager.get_balance_overrides(account_id)
+    overrides = state['overrides']
+    current_balance = state['balance_with_override']
     
     if not overrides:
         print(f"\nNo balance overrides found for {account_name}")
         return
     
-    # Display
-    print(f"\n{'='*100}")
-    print(f"BALANCE OVERRIDES: {account_name}")
-    print(f"{'='*100}")
-    print(f"{'ID':<5} {'Date':<12} {'Balance':>15} {'Created':>20} {'Notes':<40}")
-    print(f"{'-'*100}")
+    from tabulate import tabulate
     
-    for override in overrides:
-        override_id = override['id']
-        override_date = override['override_date'].strftime('%Y-%m-%d')
-        balance = f"${override['override_balance']:,.2f}"
-        created = override['created_at'].strftime('%Y-%m-%d %H:%M:%S')
-        notes = override['notes'] or ""
-        print(f"{override_id:<5} {override_date:<12} {balance:>15} {created:>20} {notes:<40}")
+    rows = [
+        [
+            override['id'],
+            # isoformat avoids strftime's per-call format parsing; the first 19
+            # characters are '%Y-%m-%d %H:%M:%S' with any UTC offset dropped
+            override['override_date'].isoformat(),
+            f"${override['override_balance']:,.2f}",
+            override['created_at'].isoformat(sep=' ', timespec='seconds')[:19],
+            override['notes'] or ""
+        ]
+        for override in overrides
+    ]
     
-    print(f"{'='*100}")
-    print(f"Total overrides: {len(overrides)}")
+    # Build the whole table and write it in one call rather than one print per row;
+    # tabulate sizes each column to its content
+    lines = [
+        f"\n{'='*100}",
+        f"BALANCE OVERRIDES: {account_name}",
+        f"{'='*100}",
+        tabulate(
+            rows,
+            headers=['ID', 'Date', 'Balance', 'Created', 'Notes'],
+            colalign=('left', 'left', 'right', 'right', 'left')
+        ),
+    ]
     
-    # Show current balance with override
-    current_balance = account_manager.get_balance_with_override(account_id)
-    print(f"Current balance (with override): ${current_balance:,.2f}\n")
+    lines += [
+        f"{'='*100}",
+        f"Total overrides: {len(overrides)}",
+        f"Current balance (with override): ${current_balance:,.2f}\n",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def delete_balance_override_cli(
     db_manager: DatabaseManager,
-    override_id: int
+    override_id: int,
+    account_manager: Optional[AccountManager] = None
 ) -> bool:
     """
     Delete a balance override.
@@ -148,11 +199,12 @@ def delete_balance_override_cli(
     Args:
         db_manager: DatabaseManager instance
         override_id: Override ID to delete
+        account_manager: Optional AccountManager to reuse instead of creating one
     
     Returns:
         True if successful, False otherwise
     """
-    account_manager = AccountManager(db_manager)
+    account_manager = _get_account_manager(db_manager, account_manager)
     
     success = account_manager.delete_balance_override(override_id)
     
@@ -166,7 +218,8 @@ def delete_balance_override_cli(
 
 def show_balance_comparison_cli(
     db_manager: DatabaseManager,
-    account_name: str
+    account_name: str,
+    account_manager: Optional[AccountManager] = None
 ) -> None:
     """
     Show balance comparison with and without overrides.
@@ -174,24 +227,19 @@ def show_balance_comparison_cli(
     Args:
         db_manager: DatabaseManager instance
         account_name: Name of account
+        account_manager: Optional AccountManager to reuse instead of creating one
     """
-    account_manager = AccountManager(db_manager)
+    account_manager = _get_account_manager(db_manager, account_manager)
     
-    # Get account
-    account = account_manager.get_account_by_name(account_name)
+    # Get account, balance with override and the overrides in one session
+    account, state = _load_override_state(db_manager, account_manager, account_name)
     if not account:
         print(f"Error: Account '{account_name}' not found", file=sys.stderr)
         return
     
-    # Get account ID
-    account_id = account.id if hasattr(account, 'id') else account['id']
     account_balance = account.balance if hasattr(account, 'balance') else account['balance']
-    
-    # Get balance with override
-    balance_with_override = account_manager.get_balance_with_override(account_id)
-    
-    # Get overrides
-    overrides = account_manager.get_balance_overrides(account_id)
+    balance_with_override = state['balance_with_override']
+    overrides = state['overrides']
     
     print(f"\n{'='*80}")
     print(f"BALANCE COMPARISON: {account_name}")
@@ -5,25 +5,268 @@ This module provides budget envelope functionality, allowing users to
 allocate funds to categories and track spending against budgets.
 """
 
+import functools
 import logging
+import math
+import os
+from calendar import monthrange
+from collections import defaultdict
 from typing import List, Optional, Dict, Any, Tuple, Set
-from datetime import UTC, datetime, date, timedelta
-from dataclasses import dataclass
+from datetime import UTC, datetime, date, time, timedelta
+from dataclasses import dataclass, field, fields
 
-from database_ops import DatabaseManager, Budget, Transaction, IncomeOverride, Account
+from account_management import _balance_cache
+from database_ops import BLANK_CATEGORY_INDEX, DatabaseManager, Budget, Transaction, IncomeOverride, Account
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import func, and_, extract
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy import func, and_, or_, bindparam, case, extract, select, update
+from sqlalchemy.engine import Row
+from encryption_utils import derive_search_token
 from exceptions import BudgetError
+from performance_utils import cached_method, shared_commit_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _start_of_day(day: date) -> datetime:
+    """Return the first moment of day, as stored in budget period_start columns."""
+    return datetime.combine(day, time.min)
+
+
+def _end_of_day(day: date) -> datetime:
+    """Return the last moment of day, as stored in budget period_end columns."""
+    return datetime.combine(day, time.max)
+
+
+def _day_range(start: date, end: date) -> Tuple[datetime, datetime]:
+    """Return the half-open [start, day after end) datetime range covering start..end."""
+    return datetime.combine(start, time.min), datetime.combine(end + timedelta(days=1), time.min)
+
+
+# Fused multiply-add (one rounding, no intermediate float) on Python 3.13+
+_fma = getattr(math, "fma", lambda x, y, z: x * y + z)
+
+
+@functools.lru_cache(maxsize=256)
+def _month_bounds(year: int, month: int) -> Tuple[date, date]:
+    """Return the first and last day of a month (memoized; results are immutable)."""
+    return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+
+
+@functools.lru_cache(maxsize=256)
+def _month_datetime_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Return a month's budget period_start/period_end column values (memoized)."""
+    first, last = _month_bounds(year, month)
+    return _start_of_day(first), _end_of_day(last)
+
+
+# Budget settings derived from config.yaml are parsed and normalized once per
+# version of the file instead of on every lookup.
+
+@functools.lru_cache(maxsize=1)
+def _config_manager():
+    """
+    Import config_manager on first use and reuse the module afterwards.
+    
+    The import is deferred (config_manager pulls in the UI stack) but resolved
+    only once, so config lookups do not go through the import system per call.
+    
+    Returns:
+        The config_manager module, or None if it cannot be imported
+    """
+    try:
+        import config_manager
+    except ImportError:
+        logger.debug("config_manager not available; skipping budget configuration.")
+        return None
+    return config_manager
+
+
+def _config_version() -> Optional[Tuple[int, int]]:
+    """
+    Return a token that changes whenever the config file is rewritten.
+    
+    Returns:
+        (mtime_ns, size) of the config file, or None if it is missing or
+        config_manager is unavailable
+    """
+    config_manager = _config_manager()
+    if config_manager is None:
+        return None
+    try:
+        stat = os.stat(config_manager.CONFIG_FILE)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=1)
+def _config_for_version(version: Optional[Tuple[int, int]]) -> Optional[Dict[str, Any]]:
+    """Load the configuration once per config version (None if config_manager is unavailable)."""
+    config_manager = _config_manager()
+    if config_manager is None:
+        return None
+    return config_manager.load_config()
+
+
+@functools.lru_cache(maxsize=1)
+def _config_alias_tables(
+    version: Optional[Tuple[int, int]]
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, Set[str]]]:
+    """Build (canonical_labels, alias_lookup, canonical_aliases) for a config version."""
+    canonical_labels: Dict[str, str] = {}
+    alias_lookup: Dict[str, str] = {}
+    canonical_aliases: Dict[str, Set[str]] = {}
+    
+    config = _config_for_version(version)
+    if config is None:
+        return canonical_labels, alias_lookup, canonical_aliases
+    alias_config = config.get("budget_category_aliases", {}) or {}
+    
+    for canonical, aliases in alias_config.items():
+        canonical_norm = BudgetManager._normalize_category(str(canonical))
+        if not canonical_norm:
+            continue
+        canonical_key = BudgetManager._category_key(canonical_norm)
+        canonical_labels[canonical_key] = canonical_norm
+        alias_lookup[canonical_key] = canonical_key
+        canonical_aliases.setdefault(canonical_key, set())
+        
+        for alias in aliases or []:
+            alias_norm = BudgetManager._normalize_category(str(alias))
+            if not alias_norm:
+                continue
+            alias_key = BudgetManager._category_key(alias_norm)
+            alias_lookup[alias_key] = canonical_key
+            canonical_aliases.setdefault(canonical_key, set()).add(alias_key)
+    
+    return canonical_labels, alias_lookup, canonical_aliases
+
+
+@functools.lru_cache(maxsize=1)
+def _config_budget_categories(version: Optional[Tuple[int, int]]) -> Tuple[str, ...]:
+    """Build the sorted fallback budget categories (including alias canonicals) for a config version."""
+    config = _config_for_version(version)
+    if config is None:
+        return ()
+    
+    categories_config = config.get("budget_categories", [])
+    if not isinstance(categories_config, list):
+        logger.warning("Config value 'budget_categories' is not a list. Ignoring fallback categories.")
+        return ()
+    
+    unique: Dict[str, str] = {}
+    for raw in categories_config:
+        normalized = BudgetManager._normalize_category(str(raw))
+        if not normalized:
+            continue
+        key = BudgetManager._category_key(normalized)
+        if key and key not in unique:
+            unique[key] = normalized
+    
+    canonical_labels, _, _ = _config_alias_tables(version)
+    for canonical_key, label in canonical_labels.items():
+        if canonical_key not in unique and label:
+            unique[canonical_key] = label
+    
+    # Keys are already lowercased, so sorting them avoids a casefold per comparison
+    return tuple(unique[key] for key in sorted(unique))
+
+
+@functools.lru_cache(maxsize=1)
+def _config_income_categories(version: Optional[Tuple[int, int]]) -> Tuple[str, ...]:
+    """Build the lowercased income categories for a config version."""
+    config = _config_for_version(version)
+    if config is None:
+        return ()
+    
+    categories = config.get("database", {}).get("income_categories", [])
+    if not isinstance(categories, list):
+        logger.warning("Config value 'income_categories' should be a list; ignoring.")
+        return ()
+    
+    normalized = []
+    for raw in categories:
+        norm = BudgetManager._normalize_category(str(raw))
+        if norm:
+            normalized.append(norm.lower())
+    return tuple(normalized)
+
+
+# Hot budget statements are built once and reused with new bind parameters on
+# every call, so the expression tree and its compiled SQL are not rebuilt per request.
+
+def _category_key_expr(column):
+    """SQL expression for the trimmed, lowercased plaintext of an encrypted category column."""
+    return func.lower(func.trim(func.decrypt_text(column)))
+
+
+# Decrypted transaction columns shared by every query (expressions are immutable)
+_DECRYPTED_AMOUNT = func.decrypt_numeric(Transaction.amount)
+_TRANSACTION_CATEGORY_KEY = _category_key_expr(Transaction.category)
+
+
+def _money_sum(expr):
+    """SUM of a money expression rounded to whole cents in SQL, so float drift never leaves the query."""
+    return func.round(func.sum(expr), 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _category_spending_stmt():
+    """Build the single-category spending total statement."""
+    return select(
+        func.coalesce(_money_sum(func.abs(_DECRYPTED_AMOUNT)), 0.0)
+    ).where(
+        Transaction.date >= bindparam('start'),
+        Transaction.date < bindparam('end'),
+        Transaction.is_transfer == 0,
+        Transaction.amount < 0,
+        _TRANSACTION_CATEGORY_KEY.in_(bindparam('category_keys', expanding=True))
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _active_budget_stmt():
+    """Build the statement finding the budget columns for a category key active on a date."""
+    return select(*Budget.__table__.columns).where(
+        Budget.period_start <= bindparam('period'),
+        Budget.period_end >= bindparam('period'),
+        _category_key_expr(Budget.category) == bindparam('category_key')
+    ).limit(1)
+
+
+@functools.lru_cache(maxsize=None)
+def _monthly_budgets_stmt():
+    """Build the statement listing budgets for an exact month period, ordered by category."""
+    return select(Budget).where(
+        Budget.period_start == bindparam('start'),
+        Budget.period_end == bindparam('end')
+    ).order_by(_category_key_expr(Budget.category), Budget.id)
+
+
+@functools.lru_cache(maxsize=None)
+def _monthly_budget_rows_stmt():
+    """Build the column-only variant of _monthly_budgets_stmt for read-only callers."""
+    return select(
+        Budget.id,
+        Budget.category,
+        Budget.allocated_amount,
+        Budget.period_start,
+        Budget.period_end
+    ).where(
+        Budget.period_start == bindparam('start'),
+        Budget.period_end == bindparam('end')
+    ).order_by(_category_key_expr(Budget.category), Budget.id)
+
+
+@dataclass(slots=True, frozen=True)
 class BudgetStatus:
     """
     Status of a budget category.
     
+    Slotted and immutable: statuses are built in bulk and only read.
+    
     Attributes:
         category: Category name
         allocated: Amount allocated to category
@@ -38,6 +281,56 @@ class BudgetStatus:
     percentage_used: float
 
 
+@dataclass(slots=True)
+class FinancialSnapshot:
+    """
+    Metrics shown in the Financial Health Snapshot.
+    
+    Slotted so the health tip and alert checks read attributes rather than
+    dictionary keys.
+    
+    Attributes:
+        income_total: Income for the period (override, actual or historical)
+        income_source: Where income_total came from
+        override: Saved income override for the period, if any
+        assigned_total: Total assigned across active budgets
+        spent_total: Total spent across active budgets
+        available_total: Total still available across active budgets
+        unassigned_funds: Income not yet assigned
+        budget_utilization_pct: Spent as a percentage of assigned
+        current_balances: Sum of all account balances
+        avg_daily_income: Average daily income used for projections
+        avg_daily_spend: Average daily spending used for projections
+        days_left: Days remaining in the period
+        days_in_period: Days in the period
+        projected_balance: Projected end-of-period balance, if enabled
+        show_projections: Whether projections are enabled
+        alerts: High-priority alerts
+        tips: Budget tips
+    """
+    income_total: float = 0.0
+    income_source: str = "actual"
+    override: Optional[IncomeOverride] = None
+    assigned_total: float = 0.0
+    spent_total: float = 0.0
+    available_total: float = 0.0
+    unassigned_funds: float = 0.0
+    budget_utilization_pct: float = 0.0
+    current_balances: float = 0.0
+    avg_daily_income: float = 0.0
+    avg_daily_spend: float = 0.0
+    days_left: int = 0
+    days_in_period: int = 0
+    projected_balance: Optional[float] = None
+    show_projections: bool = True
+    alerts: List[str] = field(default_factory=list)
+    tips: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the snapshot as a plain dictionary (for JSON callers)."""
+        return {item.name: getattr(self, item.name) for item in fields(self)}
+
+
 class BudgetManager:
     """
     Manages budgets and budget envelopes (YNAB-style).
@@ -54,6 +347,13 @@ class BudgetManager:
             db_manager: DatabaseManager instance
         """
         self.db_manager = db_manager
+        
+        # Short-lived caches shared by every manager on this database and cleared
+        # whenever data is committed, so they survive re-created managers (e.g.
+        # Streamlit reruns). Account balances share AccountManager's cache.
+        self._budget_cache = shared_commit_cache(db_manager, "budgets")
+        self._account_balance_cache = _balance_cache(db_manager)
+        
         logger.info("Budget manager initialized")
     
     @staticmethod
@@ -92,72 +392,20 @@ class BudgetManager:
         Returns:
             List of category names from config, or empty list.
         """
-        try:
-            from config_manager import load_config  # Lazy import to avoid circular dependency
-        except ImportError:
-            logger.debug("config_manager not available; skipping budget category fallback.")
-            return []
-        
-        categories_config = load_config().get("budget_categories", [])
-        if not isinstance(categories_config, list):
-            logger.warning("Config value 'budget_categories' is not a list. Ignoring fallback categories.")
-            return []
-        
-        unique: Dict[str, str] = {}
-        for raw in categories_config:
-            normalized = BudgetManager._normalize_category(str(raw))
-            if not normalized:
-                continue
-            key = BudgetManager._category_key(normalized)
-            if key and key not in unique:
-                unique[key] = normalized
-        
-        canonical_labels, _, _ = BudgetManager._load_budget_category_aliases()
-        for canonical_key, label in canonical_labels.items():
-            if canonical_key not in unique and label:
-                unique[canonical_key] = label
-        
-        return sorted(unique.values(), key=str.casefold)
+        return list(_config_budget_categories(_config_version()))
     
     @staticmethod
     def _load_budget_category_aliases() -> Tuple[Dict[str, str], Dict[str, str], Dict[str, Set[str]]]:
         """
         Load budget category alias mappings from configuration.
         
+        The tables are cached per config file version and shared between
+        callers, so they must be treated as read-only.
+        
         Returns:
             Tuple of (canonical_labels, alias_lookup, canonical_aliases)
         """
-        try:
-            from config_manager import load_config  # Lazy import to avoid circular dependency
-        except ImportError:
-            logger.debug("config_manager not available; skipping budget category aliases.")
-            return {}, {}, {}
-        
-        config = load_config()
-        alias_config = config.get("budget_category_aliases", {}) or {}
-        
-        canonical_labels: Dict[str, str] = {}
-        alias_lookup: Dict[str, str] = {}
-        canonical_aliases: Dict[str, Set[str]] = {}
-        
-        for canonical, aliases in alias_config.items():
-            canonical_norm = BudgetManager._normalize_category(str(canonical))
-            if not canonical_norm:
-                continue
-            canonical_key = BudgetManager._category_key(canonical_norm)
-            canonical_labels[canonical_key] = canonical_norm
-            alias_lookup[canonical_key] = canonical_key
-            canonical_aliases.setdefault(canonical_key, set())
-            
-            for alias in aliases or []:
-                alias_norm = BudgetManager._normalize_category(str(alias))
-                if not alias_norm:
-                    continue
-                alias_key = BudgetManager._category_key(alias_norm)
-                alias_lookup[alias_key] = canonical_key
-                canonical_aliases.setdefault(canonical_key, set()).add(alias_key)
-        
-        return canonical_labels, alias_lookup, canonical_aliases
+        return _config_alias_tables(_config_version())
     
     @staticmethod
     def _load_income_categories_from_config() -> List[str]:
@@ -167,33 +415,14 @@ class BudgetManager:
         Returns:
             List of normalized income category names.
         """
-        try:
-            from config_manager import load_config  # Lazy import
-        except ImportError:
-            logger.debug("config_manager not available; skipping income category config.")
-            return []
-        
-        config = load_config()
-        categories = config.get("database", {}).get("income_categories", [])
-        if not isinstance(categories, list):
-            logger.warning("Config value 'income_categories' should be a list; ignoring.")
-            return []
-        
-        normalized = []
-        for raw in categories:
-            norm = BudgetManager._normalize_category(str(raw))
-            if norm:
-                normalized.append(norm.lower())
-        return normalized
+        return list(_config_income_categories(_config_version()))
     
     @staticmethod
     def _show_projections_enabled() -> bool:
         """Return True if projections should be displayed according to config."""
-        try:
-            from config_manager import load_config  # Lazy import
-        except ImportError:
+        config = _config_for_version(_config_version())
+        if config is None:
             return True
-        config = load_config()
         return config.get("show_projections", True)
     
     @staticmethod
@@ -207,12 +436,7 @@ class BudgetManager:
         Returns:
             Tuple of (period_start, period_end).
         """
-        period_start = month.replace(day=1)
-        if period_start.month == 12:
-            period_end = period_start.replace(year=period_start.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            period_end = period_start.replace(month=period_start.month + 1, day=1) - timedelta(days=1)
-        return period_start, period_end
+        return _month_bounds(month.year, month.month)
     
     def create_budget(
         self,
@@ -242,30 +466,33 @@ class BudgetManager:
                 return None
             
             category_key = self._category_key(normalized_category)
-            period_start_dt = datetime.combine(period_start, datetime.min.time())
-            period_end_dt = datetime.combine(period_end, datetime.max.time())
+            period_start_dt = _start_of_day(period_start)
+            period_end_dt = _end_of_day(period_end)
             
-            # Check for overlapping budgets
-            existing = session.query(Budget).filter(
-                func.lower(Budget.category) == category_key,
+            # Check for overlapping budgets (probe the ID only; the row is overwritten below)
+            existing_id = session.query(Budget.id).filter(
+                _category_key_expr(Budget.category) == category_key,
                 Budget.period_start <= period_end_dt,
                 Budget.period_end >= period_start_dt
-            ).first()
+            ).limit(1).scalar()
             
-            if existing:
+            if existing_id is not None:
                 logger.warning(
                     f"Budget already exists for category '{category}' "
                     f"overlapping period {period_start} to {period_end}"
                 )
-                # Update existing instead
-                existing.category = normalized_category
-                existing.allocated_amount = allocated_amount
-                existing.period_start = period_start_dt
-                existing.period_end = period_end_dt
-                existing.updated_at = datetime.now(UTC)
-                session.commit()
-                session.refresh(existing)
+                # Update existing instead, in one UPDATE that returns the new row
+                existing = session.execute(
+                    update(Budget).where(Budget.id == existing_id).values(
+                        category=normalized_category,
+                        allocated_amount=allocated_amount,
+                        period_start=period_start_dt,
+                        period_end=period_end_dt,
+                        updated_at=datetime.now(UTC)
+                    ).returning(Budget)
+                ).scalar_one()
                 session.expunge(existing)
+                session.commit()
                 return existing
             
             budget = Budget(
@@ -275,9 +502,10 @@ class BudgetManager:
                 period_end=period_end_dt
             )
             
+            # Keep the populated instance usable after commit instead of re-selecting it
+            session.expire_on_commit = False
             session.add(budget)
             session.commit()
-            session.refresh(budget)
             session.expunge(budget)
             
             logger.info(f"Created budget for '{category}': ${allocated_amount} ({period_start} to {period_end})")
@@ -290,17 +518,71 @@ class BudgetManager:
         finally:
             session.close()
     
+    def create_budgets_bulk(self, entries: List[Dict[str, Any]]) -> List[Budget]:
+        """
+        Create many budgets in a single transaction.
+        
+        All rows are inserted together and committed once. Unlike create_budget,
+        overlapping budgets are not merged; use bulk_get_or_create_monthly_budgets
+        to seed a month without duplicating existing categories.
+        
+        Args:
+            entries: Dictionaries with category, allocated_amount, period_start
+                and period_end (dates) keys
+        
+        Returns:
+            Created Budget objects with IDs assigned, or empty list if creation failed
+        """
+        budgets: List[Budget] = []
+        for entry in entries:
+            normalized_category = self._normalize_category(entry.get("category"))
+            if not normalized_category:
+                logger.error("Cannot create budget without a category name.")
+                return []
+            budgets.append(Budget(
+                category=normalized_category,
+                allocated_amount=entry["allocated_amount"],
+                period_start=_start_of_day(entry["period_start"]),
+                period_end=_end_of_day(entry["period_end"])
+            ))
+        
+        if not budgets:
+            return []
+        
+        session = self.db_manager.get_session()
+        try:
+            # Keep loaded attributes usable after commit without a refresh per row
+            session.expire_on_commit = False
+            session.add_all(budgets)
+            session.commit()
+            session.expunge_all()
+            
+            logger.info(f"Created {len(budgets)} budgets")
+            return budgets
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to create budgets: {e}")
+            return []
+        finally:
+            session.close()
+    
     def get_budget(
         self,
         category: str,
-        period_date: Optional[date] = None
+        period_date: Optional[date] = None,
+        session: Optional[Session] = None
     ) -> Optional[Budget]:
         """
         Get budget for a category.
         
+        The lookup is cached as plain column values until the next commit and
+        each call builds its own detached Budget, so callers may modify the
+        returned object without affecting later lookups.
+        
         Args:
             category: Category name
             period_date: Date to check (defaults to today)
+            session: Optional existing session
         
         Returns:
             Budget object or None if not found
@@ -308,155 +590,341 @@ class BudgetManager:
         if period_date is None:
             period_date = date.today()
         
-        session = self.db_manager.get_session()
-        try:
-            period_datetime = datetime.combine(period_date, datetime.min.time())
-            normalized_category = self._normalize_category(category)
-            if not normalized_category:
-                return None
-            category_key = self._category_key(normalized_category)
-            
-            candidates = session.query(Budget).filter(
-                Budget.period_start <= period_datetime,
-                Budget.period_end >= period_datetime
-            ).all()
-            
-            for budget in candidates:
-                existing_key = self._category_key(self._normalize_category(budget.category))
-                if existing_key == category_key:
-                    session.expunge(budget)
-                    return budget
+        normalized_category = self._normalize_category(category)
+        if not normalized_category:
+            return None
+        
+        values = self._active_budget_values(
+            self._category_key(normalized_category),
+            _start_of_day(period_date),
+            session=session
+        )
+        if values is None:
             return None
+        
+        budget = Budget(**values)
+        make_transient_to_detached(budget)
+        return budget
+    
+    @cached_method('_budget_cache', ignore=('session',))
+    def _active_budget_values(
+        self,
+        category_key: str,
+        period_datetime: datetime,
+        session: Optional[Session] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the column values of the budget active for a category key on a date.
+        
+        Args:
+            category_key: Trimmed, lowercased category name
+            period_datetime: Start of the day to check
+            session: Optional existing session
+        
+        Returns:
+            Dictionary of Budget column values or None if not found
+        """
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            row = session.execute(
+                _active_budget_stmt(),
+                {'period': period_datetime, 'category_key': category_key}
+            ).first()
+            return row._asdict() if row is not None else None
         except SQLAlchemyError as e:
             logger.error(f"Failed to get budget: {e}")
             return None
         finally:
-            session.close()
+            if close_session:
+                session.close()
     
-    def get_all_budgets(self, period_date: Optional[date] = None) -> List[Budget]:
+    def get_all_budgets(
+        self,
+        period_date: Optional[date] = None,
+        session: Optional[Session] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Budget]:
         """
         Get all active budgets.
         
         Args:
             period_date: Date to check (defaults to today)
+            session: Optional existing session
+            limit: Maximum number of budgets to return (None for all)
+            offset: Number of budgets to skip, for paging
         
         Returns:
-            List of Budget objects
+            List of Budget objects ordered by category
         """
         if period_date is None:
             period_date = date.today()
         
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
         try:
-            period_datetime = datetime.combine(period_date, datetime.min.time())
+            period_datetime = _start_of_day(period_date)
             
+            # Order by the plaintext key (the stored column is ciphertext) with the
+            # id as tie-breaker, so limit/offset pages are stable
             budgets = session.query(Budget).filter(
                 Budget.period_start <= period_datetime,
                 Budget.period_end >= period_datetime
-            ).order_by(Budget.category).all()
+            ).order_by(
+                _category_key_expr(Budget.category), Budget.id
+            ).offset(offset).limit(limit).all()
             
-            for budget in budgets:
-                session.expunge(budget)
+            if close_session:
+                session.expunge_all()
+            else:
+                for budget in budgets:
+                    session.expunge(budget)
             return budgets
         except SQLAlchemyError as e:
             logger.error(f"Failed to get budgets: {e}")
             return []
         finally:
-            session.close()
+            if close_session:
+                session.close()
+    
+    def get_all_budgets_lite(
+        self,
+        period_date: Optional[date] = None,
+        session: Optional[Session] = None
+    ) -> List[Row]:
+        """
+        Get all active budgets as lightweight read-only rows.
+        
+        Selects only the columns read-only callers use, skipping ORM
+        instantiation and identity-map bookkeeping.
+        
+        Args:
+            period_date: Date to check (defaults to today)
+            session: Optional existing session
+        
+        Returns:
+            List of rows with id, category, allocated_amount, period_start and
+            period_end attributes, ordered like get_all_budgets
+        """
+        if period_date is None:
+            period_date = date.today()
+        
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            period_datetime = _start_of_day(period_date)
+            stmt = select(
+                Budget.id,
+                Budget.category,
+                Budget.allocated_amount,
+                Budget.period_start,
+                Budget.period_end
+            ).where(
+                Budget.period_start <= period_datetime,
+                Budget.period_end >= period_datetime
+            ).order_by(_category_key_expr(Budget.category), Budget.id)
+            return session.execute(stmt).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get budgets: {e}")
+            return []
+        finally:
+            if close_session:
+                session.close()
     
+    @cached_method('_budget_cache', ignore=('session',))
     def calculate_category_spending(
         self,
         category: str,
         period_start: Optional[date] = None,
-        period_end: Optional[date] = None
+        period_end: Optional[date] = None,
+        session: Optional[Session] = None
     ) -> float:
         """
         Calculate total spending for a category in a period.
         
-        Legacy wrapper retained for backward compatibility.
+        The total is computed in SQL as a single SUM(ABS(amount)) scalar.
+        
+        Args:
+            category: Category name
+            period_start: Start of period (defaults to first of current month)
+            period_end: End of period (defaults to end of period_start's month)
+            session: Optional existing session
+        
+        Returns:
+            Total spent as a positive amount
         """
         if period_start is None:
             period_start = date.today().replace(day=1)
         if period_end is None:
-            next_month = period_start.replace(day=28) + timedelta(days=4)
-            period_end = next_month - timedelta(days=next_month.day)
+            period_end = _month_bounds(period_start.year, period_start.month)[1]
         
-        activity_map = self.get_activity_by_category(period_start, period_end, [category])
-        category_key = self._category_key(self._normalize_category(category))
-        return activity_map.get(category_key, 0.0)
+        normalized_category = self._normalize_category(category)
+        if not normalized_category:
+            return 0.0
+        
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            _, alias_lookup, _ = self._load_budget_category_aliases()
+            category_key = self._category_key(normalized_category)
+            category_keys = {category_key, alias_lookup.get(category_key, category_key)}
+            
+            start_datetime, end_exclusive = _day_range(period_start, period_end)
+            
+            total = session.connection().execute(
+                _category_spending_stmt(),
+                {'start': start_datetime, 'end': end_exclusive, 'category_keys': list(category_keys)}
+            ).scalar()
+            return float(total or 0.0)
+        except SQLAlchemyError as exc:
+            logger.error("Failed to calculate category spending: %s", exc)
+            return 0.0
+        finally:
+            if close_session:
+                session.close()
     
+    @cached_method('_budget_cache', ignore=('session',))
     def get_activity_by_category(
         self,
         period_start: date,
         period_end: date,
-        categories: Optional[List[str]] = None
+        categories: Optional[List[str]] = None,
+        session: Optional[Session] = None
     ) -> Dict[str, float]:
         """
         Return absolute spending totals grouped by canonical category key for the period.
         """
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
         try:
             canonical_labels, alias_lookup, _ = self._load_budget_category_aliases()
             
-            start_datetime = datetime.combine(period_start, datetime.min.time())
-            end_datetime = datetime.combine(period_end, datetime.max.time())
+            # (key, canonical key) per requested category, normalized once
+            normalize = self._normalize_category
+            category_key = self._category_key
+            category_entries: List[Tuple[str, str]] = []
+            for cat in categories or ():
+                key = category_key(normalize(cat))
+                category_entries.append((key, alias_lookup.get(key, key)))
+            
+            start_datetime, end_exclusive = _day_range(period_start, period_end)
+            
+            # Requested categories map their category_index tokens straight to
+            # canonical keys, so aliases are merged by the GROUP BY itself
+            canonical_tokens: Dict[str, str] = {}
+            if categories:
+                canonical_tokens = {
+                    derive_search_token(entry_key): canonical_key
+                    for key, canonical_key in category_entries
+                    if key
+                    for entry_key in (key, canonical_key)
+                }
+            if canonical_tokens:
+                group_expr = case(canonical_tokens, value=Transaction.category_index)
+            else:
+                group_expr = Transaction.category_index
             
-            category_expr = func.lower(func.trim(func.decrypt_text(Transaction.category)))
-            amount_expr = func.decrypt_numeric(Transaction.amount)
+            # Categories are matched and grouped through the indexed category_index
+            # blind index instead of decrypting them; blank categories never match
+            # Only expenses are summed, so negate in SQL to get positive totals
+            amount_expr = _DECRYPTED_AMOUNT
             query = session.query(
-                category_expr.label("category_key"),
-                func.sum(amount_expr).label("total")
+                group_expr.label("group_key"),
+                _money_sum(-amount_expr).label("total")
             ).filter(
+                Transaction.category_index != BLANK_CATEGORY_INDEX,
                 Transaction.date >= start_datetime,
-                Transaction.date <= end_datetime,
+                Transaction.date < end_exclusive,
                 Transaction.is_transfer == 0,
                 Transaction.amount < 0
             )
+            if canonical_tokens:
+                query = query.filter(Transaction.category_index.in_(canonical_tokens))
             
-            if categories:
-                category_keys = {
-                    self._category_key(self._normalize_category(cat))
-                    for cat in categories
-                    if self._normalize_category(cat)
+            results = query.group_by("group_key").all()
+            if not canonical_tokens and results:
+                # Resolve the tokens that actually occur to their canonical keys
+                token_keys = self._category_keys_for_tokens(session, [token for token, _ in results])
+                canonical_tokens = {
+                    token: alias_lookup.get(key, key) for token, key in token_keys.items()
                 }
-                mapped_keys = {alias_lookup.get(k, k) for k in category_keys}
-                include_keys = category_keys.union(mapped_keys)
-                if include_keys:
-                    query = query.filter(category_expr.in_(include_keys))
-            
-            results = query.group_by("category_key").all()
-            activity_map: Dict[str, float] = {}
-            for key, total in results:
-                if not key:
-                    continue
-                canonical_key = alias_lookup.get(key, key)
-                activity_map[canonical_key] = activity_map.get(canonical_key, 0.0) + abs(total or 0.0)
+                results = [
+                    (canonical_tokens[token], total)
+                    for token, total in results
+                    if token in canonical_tokens
+                ]
             
-            # ensure canonical keys exist even if zero transactions
+            # Seed canonical keys with zero so they exist even without transactions
             if categories:
-                for cat in categories:
-                    normalized = self._normalize_category(cat)
-                    canonical_key = alias_lookup.get(self._category_key(normalized), self._category_key(normalized))
-                    activity_map.setdefault(canonical_key, 0.0)
+                zero_keys = (canonical_key for _, canonical_key in category_entries)
             else:
-                for canonical_key in canonical_labels:
-                    activity_map.setdefault(canonical_key, 0.0)
+                zero_keys = canonical_labels
+            activity_map: Dict[str, float] = defaultdict(float, dict.fromkeys(zero_keys, 0.0))
+            for canonical_key, total in results:
+                activity_map[canonical_key] += total or 0.0
             
-            return activity_map
+            return dict(activity_map)
         except SQLAlchemyError as exc:
             logger.error("Failed to calculate activity by category: %s", exc)
             return {}
         finally:
-            session.close()
+            if close_session:
+                session.close()
+    
+    def _category_keys_for_tokens(self, session: Session, tokens: List[str]) -> Dict[str, str]:
+        """
+        Resolve category_index tokens to category keys, decrypting one row per token.
+        
+        Args:
+            session: Open database session
+            tokens: category_index tokens to resolve
+        
+        Returns:
+            Dictionary mapping token to lowercase category key
+        """
+        representatives = select(func.min(Transaction.id)).where(
+            Transaction.category_index.in_(tokens)
+        ).group_by(Transaction.category_index)
+        rows = session.execute(
+            select(Transaction.category_index, Transaction.category).where(
+                Transaction.id.in_(representatives)
+            )
+        ).all()
+        return {
+            token: self._category_key(category)
+            for token, category in rows
+            if category
+        }
+    
+    def _income_category_condition(self):
+        """Return the configured income category condition, or None if no categories are set."""
+        categories = self._load_income_categories_from_config()
+        if not categories:
+            return None
+        # Matched through the category_index blind index rather than decrypting
+        return Transaction.category_index.in_([derive_search_token(category) for category in categories])
     
     def _apply_income_category_filter(self, query):
         """Apply configured income categories to the provided query if defined."""
-        categories = self._load_income_categories_from_config()
-        if categories:
-            query = query.filter(
-                Transaction.category.isnot(None),
-                func.lower(func.decrypt_text(Transaction.category)).in_(categories)
-            )
+        condition = self._income_category_condition()
+        if condition is not None:
+            query = query.filter(condition)
         return query
     
     def _sum_transactions(
@@ -464,22 +932,19 @@ class BudgetManager:
         period_start: date,
         period_end: date,
         positive_only: bool = False,
-        negative_only: bool = False
+        negative_only: bool = False,
+        session: Optional[Session] = None
     ) -> float:
         """
         Sum transactions for the given period. Expenses are returned as positive values.
         """
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
         try:
-            start_datetime = datetime.combine(period_start, datetime.min.time())
-            end_datetime = datetime.combine(period_end, datetime.max.time())
-            
-            amount_expr = func.decrypt_numeric(Transaction.amount)
-            query = session.query(func.sum(amount_expr)).filter(
-                Transaction.date >= start_datetime,
-                Transaction.date <= end_datetime,
-                Transaction.is_transfer == 0
-            )
+            start_datetime, end_exclusive = _day_range(period_start, period_end)
             
             if positive_only and negative_only:
                 raise BudgetError(
@@ -487,25 +952,134 @@ class BudgetManager:
                     details={"operation": "get_budget_status"}
                 )
             
+            # Expenses are negated in SQL so they come back positive
+            amount_expr = _DECRYPTED_AMOUNT
+            if negative_only:
+                amount_expr = -amount_expr
+            query = session.query(_money_sum(amount_expr)).filter(
+                Transaction.date >= start_datetime,
+                Transaction.date < end_exclusive,
+                Transaction.is_transfer == 0
+            )
+            
             if positive_only:
                 query = query.filter(Transaction.amount > 0)
                 query = self._apply_income_category_filter(query)
             elif negative_only:
                 query = query.filter(Transaction.amount < 0)
             
-            total = query.scalar() or 0.0
-            if negative_only:
-                total = abs(total)
-            return float(total)
+            return float(query.scalar() or 0.0)
         except SQLAlchemyError as exc:
             logger.error("Failed to sum transactions: %s", exc)
             return 0.0
         finally:
-            session.close()
+            if close_session:
+                session.close()
+    
+    def _sum_positive_by_month(
+        self,
+        window_start: date,
+        window_end: date,
+        session: Optional[Session] = None
+    ) -> Dict[Tuple[int, int], float]:
+        """
+        Sum income transactions per calendar month in one grouped query.
+        
+        Args:
+            window_start: First day included
+            window_end: First day excluded
+            session: Optional existing session
+        
+        Returns:
+            Dictionary mapping (year, month) to the income total for that month
+        """
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            year_expr = extract('year', Transaction.date)
+            month_expr = extract('month', Transaction.date)
+            query = session.query(
+                year_expr,
+                month_expr,
+                _money_sum(_DECRYPTED_AMOUNT)
+            ).filter(
+                Transaction.date >= _start_of_day(window_start),
+                Transaction.date < _start_of_day(window_end),
+                Transaction.is_transfer == 0,
+                Transaction.amount > 0
+            )
+            query = self._apply_income_category_filter(query)
+            
+            return {
+                (int(year), int(month)): float(total or 0.0)
+                for year, month, total in query.group_by(year_expr, month_expr).all()
+            }
+        except SQLAlchemyError as exc:
+            logger.error("Failed to sum monthly income: %s", exc)
+            return {}
+        finally:
+            if close_session:
+                session.close()
+    
+    def _sum_income_and_spend(
+        self,
+        period_start: date,
+        period_end: date,
+        session: Optional[Session] = None
+    ) -> Tuple[float, float]:
+        """
+        Sum income and spending for the given period in a single query.
+        
+        Income matches _sum_transactions(positive_only=True), including the
+        income category filter; spending is returned as a positive value.
+        
+        Returns:
+            Tuple of (income, spend)
+        """
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            start_datetime, end_exclusive = _day_range(period_start, period_end)
+            
+            amount_expr = _DECRYPTED_AMOUNT
+            income_condition = Transaction.amount > 0
+            category_condition = self._income_category_condition()
+            if category_condition is not None:
+                income_condition = and_(income_condition, category_condition)
+            
+            income, spend = session.query(
+                _money_sum(case((income_condition, amount_expr), else_=0.0)),
+                _money_sum(case((Transaction.amount < 0, -amount_expr), else_=0.0))
+            ).filter(
+                Transaction.date >= start_datetime,
+                Transaction.date < end_exclusive,
+                Transaction.is_transfer == 0
+            ).one()
+            return float(income or 0.0), float(spend or 0.0)
+        except SQLAlchemyError as exc:
+            logger.error("Failed to sum income and spending: %s", exc)
+            return 0.0, 0.0
+        finally:
+            if close_session:
+                session.close()
     
-    def get_income_override(self, period_start: date) -> Optional[IncomeOverride]:
+    def get_income_override(
+        self,
+        period_start: date,
+        session: Optional[Session] = None
+    ) -> Optional[IncomeOverride]:
         """Return saved income override for the provided period, if any."""
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
         try:
             override = session.query(IncomeOverride).filter(
                 IncomeOverride.period_start == period_start
@@ -517,7 +1091,8 @@ class BudgetManager:
             logger.error("Failed to fetch income override: %s", exc)
             return None
         finally:
-            session.close()
+            if close_session:
+                session.close()
     
     def upsert_income_override(
         self,
@@ -547,8 +1122,9 @@ class BudgetManager:
                 )
                 session.add(override)
             
+            # Keep the populated instance usable after commit instead of re-selecting it
+            session.expire_on_commit = False
             session.commit()
-            session.refresh(override)
             session.expunge(override)
             logger.info("Income override saved for %s: %s", period_start, amount)
             return override
@@ -578,24 +1154,25 @@ class BudgetManager:
         finally:
             session.close()
     
+    @cached_method('_budget_cache', ignore=('session',))
     def calculate_historical_income_average(
         self,
         period_start: date,
-        months: int = 3
+        months: int = 3,
+        session: Optional[Session] = None
     ) -> float:
         """
         Calculate average income for the previous N full months.
         """
-        totals: List[float] = []
+        if months <= 0:
+            return 0.0
+        
         month_start = period_start.replace(day=1)
+        year, month_index = divmod(month_start.year * 12 + month_start.month - 1 - months, 12)
+        window_start = date(year, month_index + 1, 1)
         
-        for _ in range(months):
-            prev_month_end = month_start - timedelta(days=1)
-            prev_month_start = prev_month_end.replace(day=1)
-            total = self._sum_transactions(prev_month_start, prev_month_end, positive_only=True)
-            if total > 0:
-                totals.append(total)
-            month_start = prev_month_start
+        monthly_totals = self._sum_positive_by_month(window_start, month_start, session=session)
+        totals = [total for total in monthly_totals.values() if total > 0]
         
         if not totals:
             return 0.0
@@ -605,12 +1182,13 @@ class BudgetManager:
         self,
         period_start: date,
         period_end: date,
-        fallback_months: int = 3
+        fallback_months: int = 3,
+        session: Optional[Session] = None
     ) -> Dict[str, Any]:
         """
         Determine income for the month with override/historical fallback.
         """
-        override = self.get_income_override(period_start)
+        override = self.get_income_override(period_start, session=session)
         if override:
             return {
                 "amount": float(override.override_amount),
@@ -618,16 +1196,21 @@ class BudgetManager:
                 "override": override
             }
         
-        actual = self._sum_transactions(period_start, period_end, positive_only=True)
+        actual = self._sum_transactions(period_start, period_end, positive_only=True, session=session)
         if actual > 0:
             return {"amount": actual, "source": "actual", "override": None}
         
-        historical_avg = self.calculate_historical_income_average(period_start, fallback_months)
+        historical_avg = self.calculate_historical_income_average(period_start, fallback_months, session=session)
         return {"amount": historical_avg, "source": "historical", "override": None}
     
-    def get_account_balance_total(self) -> float:
+    @cached_method('_account_balance_cache', ignore=('session',))
+    def get_account_balance_total(self, session: Optional[Session] = None) -> float:
         """Return the sum of all account balances."""
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
         try:
             total = session.query(func.sum(Account.balance)).scalar() or 0.0
             return float(total)
@@ -635,12 +1218,14 @@ class BudgetManager:
             logger.error("Failed to fetch account balances: %s", exc)
             return 0.0
         finally:
-            session.close()
+            if close_session:
+                session.close()
     
     def calculate_daily_income_expense(
         self,
         period_start: date,
-        current_date: date
+        current_date: date,
+        session: Optional[Session] = None
     ) -> Dict[str, float]:
         """
         Calculate daily average income and expense for the month to date.
@@ -654,8 +1239,7 @@ class BudgetManager:
                 "avg_daily_spend": 0.0
             }
         
-        income_to_date = self._sum_transactions(period_start, current_date, positive_only=True)
-        spend_to_date = self._sum_transactions(period_start, current_date, negative_only=True)
+        income_to_date, spend_to_date = self._sum_income_and_spend(period_start, current_date, session=session)
         days_elapsed = (current_date - period_start).days + 1
         days_elapsed = max(days_elapsed, 1)
         
@@ -680,26 +1264,26 @@ class BudgetManager:
         avg_daily_spend: float
     ) -> float:
         """Simple projection of end-of-month balance."""
-        return current_balances + days_left * (avg_daily_income - avg_daily_spend)
+        return _fma(days_left, avg_daily_income - avg_daily_spend, current_balances)
     
     @staticmethod
-    def get_health_tips(snapshot: Dict[str, Any]) -> List[str]:
+    def get_health_tips(snapshot: FinancialSnapshot) -> List[str]:
         """Generate budget tips based on snapshot metrics."""
         tips: List[str] = []
-        if snapshot["unassigned_funds"] > 0:
+        if snapshot.unassigned_funds > 0:
             tips.append("Allocate remaining unassigned dollars to savings or priority goals (YNAB Rule 1).")
-        elif snapshot["unassigned_funds"] < 0:
+        elif snapshot.unassigned_funds < 0:
             tips.append("You've over-assigned your income. Move money from lower-priority categories.")
         
-        if snapshot["available_total"] < 0:
+        if snapshot.available_total < 0:
             tips.append("Spending exceeds your assignments. Trim or move funds from other categories.")
-        elif snapshot["available_total"] == 0 and snapshot["assigned_total"] > 0:
+        elif snapshot.available_total == 0 and snapshot.assigned_total > 0:
             tips.append("All assigned funds are spoken for—consider building a buffer for next month.")
         
-        if snapshot["budget_utilization_pct"] >= 90:
+        if snapshot.budget_utilization_pct >= 90:
             tips.append("Budget utilization is high. Pause discretionary spending to stay on track.")
         
-        projected = snapshot.get("projected_balance")
+        projected = snapshot.projected_balance
         if projected is not None and projected < 0:
             tips.append("Projected balance is negative. Boost income or cut spending to avoid a cash shortfall.")
         
@@ -708,40 +1292,105 @@ class BudgetManager:
         return tips
     
     @staticmethod
-    def get_health_alerts(snapshot: Dict[str, Any]) -> List[str]:
+    def get_health_alerts(snapshot: FinancialSnapshot) -> List[str]:
         """High-priority alerts derived from snapshot metrics."""
         alerts: List[str] = []
-        if snapshot["unassigned_funds"] < 0:
+        if snapshot.unassigned_funds < 0:
             alerts.append("Unassigned funds are negative—rebalance your budget to match income.")
-        if snapshot["available_total"] < 0:
+        if snapshot.available_total < 0:
             alerts.append("Remaining available is negative—at least one category is overspent.")
-        projected = snapshot.get("projected_balance")
+        projected = snapshot.projected_balance
         if projected is not None and projected < 0:
             alerts.append("Projected end-of-month balance is negative.")
         return alerts
     
+    @cached_method('_budget_cache')
+    def _load_snapshot_metrics(
+        self,
+        period_start: date,
+        period_end: date,
+        current_date: date
+    ) -> Dict[str, Any]:
+        """Run the database reads behind the Financial Health Snapshot (cached until the next commit)."""
+        # All snapshot queries share one read-only session and connection, so the
+        # figures come from a single transaction instead of one per helper
+        with self.db_manager.read_session() as session:
+            income_info = self.calculate_monthly_income(period_start, period_end, session=session)
+            daily_stats = self.calculate_daily_income_expense(period_start, current_date, session=session)
+            historical_avg_income = 0.0
+            # A "historical" income source already is the (zero) trailing average
+            if float(income_info["amount"]) == 0 and income_info["source"] != "historical":
+                historical_avg_income = self.calculate_historical_income_average(period_start, session=session)
+            current_balances = self.get_account_balance_total(session=session)
+        
+        # Cache the override's column values rather than the ORM instance, so each
+        # snapshot gets its own IncomeOverride (see _income_override_from_values)
+        override = income_info["override"]
+        if override is not None:
+            income_info = dict(income_info, override={
+                column.key: getattr(override, column.key) for column in IncomeOverride.__table__.columns
+            })
+        
+        return {
+            "income_info": income_info,
+            "daily_stats": daily_stats,
+            "historical_avg_income": historical_avg_income,
+            "current_balances": current_balances
+        }
+    
+    @staticmethod
+    def _income_override_from_values(values: Optional[Dict[str, Any]]) -> Optional[IncomeOverride]:
+        """
+        Build a fresh detached IncomeOverride from cached column values.
+        
+        Args:
+            values: Column values captured by _load_snapshot_metrics, or None
+        
+        Returns:
+            IncomeOverride instance, or None when there is no override
+        """
+        if values is None:
+            return None
+        override = IncomeOverride(**values)
+        make_transient_to_detached(override)
+        return override
+    
     def build_financial_snapshot(
         self,
         period_start: date,
         period_end: date,
         active_budgets: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
+    ) -> FinancialSnapshot:
         """Aggregate metrics for the Financial Health Snapshot."""
         assigned_total = sum(float(item.get("assigned", 0.0)) for item in active_budgets)
         spent_total = sum(float(item.get("activity", 0.0)) for item in active_budgets)
         available_total = sum(float(item.get("available", 0.0)) for item in active_budgets)
         utilization_pct = (spent_total / assigned_total * 100.0) if assigned_total > 0 else 0.0
         
-        income_info = self.calculate_monthly_income(period_start, period_end)
-        income_total = float(income_info["amount"])
-        unassigned = self.calculate_unassigned(income_total, assigned_total)
-        
         today = date.today()
         current_date = min(max(today, period_start), period_end)
         days_in_period = (period_end - period_start).days + 1
         days_left = max((period_end - current_date).days, 0)
         
-        daily_stats = self.calculate_daily_income_expense(period_start, current_date)
+        # Nothing budgeted in a period other than the current one: skip the database
+        if not active_budgets and current_date != today:
+            snapshot = FinancialSnapshot(
+                days_left=days_left,
+                days_in_period=days_in_period,
+                show_projections=self._show_projections_enabled()
+            )
+            snapshot.alerts = self.get_health_alerts(snapshot)
+            snapshot.tips = self.get_health_tips(snapshot)
+            return snapshot
+        
+        metrics = self._load_snapshot_metrics(period_start, period_end, current_date)
+        income_info = metrics["income_info"]
+        income_total = float(income_info["amount"])
+        daily_stats = metrics["daily_stats"]
+        historical_avg_income = metrics["historical_avg_income"]
+        current_balances = metrics["current_balances"]
+        
+        unassigned = self.calculate_unassigned(income_total, assigned_total)
         show_projections = self._show_projections_enabled()
         
         if daily_stats["days_elapsed"] == 0:
@@ -753,12 +1402,9 @@ class BudgetManager:
             if avg_income == 0 and income_total > 0:
                 avg_income = income_total / daily_stats["days_elapsed"]
         
-        if income_total == 0:
-            historical_avg_income = self.calculate_historical_income_average(period_start)
-            if historical_avg_income > 0 and days_in_period:
-                avg_income = max(avg_income, historical_avg_income / days_in_period)
+        if historical_avg_income > 0 and days_in_period:
+            avg_income = max(avg_income, historical_avg_income / days_in_period)
         
-        current_balances = self.get_account_balance_total()
         projected_balance = None
         if show_projections:
             projected_balance = self.calculate_projected_balance(
@@ -768,35 +1414,28 @@ class BudgetManager:
                 avg_daily_spend=avg_spend
             )
         
-        snapshot_base = {
-            "unassigned_funds": unassigned,
-            "available_total": available_total,
-            "assigned_total": assigned_total,
-            "budget_utilization_pct": utilization_pct,
-            "projected_balance": projected_balance,
-        }
-        
-        snapshot = {
-            "income_total": income_total,
-            "income_source": income_info["source"],
-            "override": income_info["override"],
-            "assigned_total": assigned_total,
-            "spent_total": spent_total,
-            "available_total": available_total,
-            "unassigned_funds": unassigned,
-            "budget_utilization_pct": utilization_pct,
-            "current_balances": current_balances,
-            "avg_daily_income": avg_income,
-            "avg_daily_spend": avg_spend,
-            "days_left": days_left,
-            "days_in_period": days_in_period,
-            "projected_balance": projected_balance,
-            "alerts": self.get_health_alerts(snapshot_base),
-            "tips": self.get_health_tips(snapshot_base),
-            "show_projections": show_projections,
-        }
+        snapshot = FinancialSnapshot(
+            income_total=income_total,
+            income_source=income_info["source"],
+            override=self._income_override_from_values(income_info["override"]),
+            assigned_total=assigned_total,
+            spent_total=spent_total,
+            available_total=available_total,
+            unassigned_funds=unassigned,
+            budget_utilization_pct=utilization_pct,
+            current_balances=current_balances,
+            avg_daily_income=avg_income,
+            avg_daily_spend=avg_spend,
+            days_left=days_left,
+            days_in_period=days_in_period,
+            projected_balance=projected_balance,
+            show_projections=show_projections
+        )
+        snapshot.alerts = self.get_health_alerts(snapshot)
+        snapshot.tips = self.get_health_tips(snapshot)
         return snapshot
     
+    @cached_method('_budget_cache')
     def get_budget_status(
         self,
         category: str,
@@ -812,23 +1451,37 @@ class BudgetManager:
         Returns:
             BudgetStatus object or None if no budget exists
         """
-        budget = self.get_budget(category, period_date)
-        if not budget:
-            return None
+        with self.db_manager.session_scope() as session:
+            budget = self.get_budget(category, period_date, session=session)
+            if not budget:
+                return None
+            
+            # Calculate spending for the budget period
+            period_start = budget.period_start.date()
+            period_end = budget.period_end.date()
+            spent = self.calculate_category_spending(category, period_start, period_end, session=session)
         
-        # Calculate spending for the budget period
-        period_start = budget.period_start.date()
-        period_end = budget.period_end.date()
-        spent = self.calculate_category_spending(category, period_start, period_end)
+        return self._build_status(category, budget.allocated_amount, spent)
+    
+    @staticmethod
+    def _build_status(category: str, allocated: float, spent: float) -> BudgetStatus:
+        """
+        Build a BudgetStatus from an allocation and the amount spent against it.
         
-        remaining = budget.allocated_amount - spent
-        percentage_used = (spent / budget.allocated_amount * 100) if budget.allocated_amount > 0 else 0.0
+        Args:
+            category: Category name
+            allocated: Amount allocated to the category
+            spent: Amount spent in the budget period
         
+        Returns:
+            BudgetStatus with remaining and percentage used derived
+        """
+        percentage_used = (spent / allocated * 100) if allocated > 0 else 0.0
         return BudgetStatus(
             category=category,
-            allocated=budget.allocated_amount,
+            allocated=allocated,
             spent=spent,
-            remaining=remaining,
+            remaining=allocated - spent,
             percentage_used=percentage_used
         )
     
@@ -836,21 +1489,53 @@ class BudgetManager:
         """
         Get budget status for all categories with budgets.
         
+        Budgets are outer-joined to their period's spending and grouped per
+        budget, so allocation and spending come back in a single query.
+        
         Args:
             period_date: Date to check (defaults to today)
         
         Returns:
             List of BudgetStatus objects
         """
-        budgets = self.get_all_budgets(period_date)
-        statuses = []
+        if period_date is None:
+            period_date = date.today()
         
-        for budget in budgets:
-            status = self.get_budget_status(budget.category, period_date)
-            if status:
-                statuses.append(status)
+        session = self.db_manager.get_session()
+        try:
+            _, alias_lookup, _ = self._load_budget_category_aliases()
+            period_datetime = _start_of_day(period_date)
+            
+            rows = session.query(
+                Budget.category,
+                Budget.allocated_amount,
+                func.coalesce(_money_sum(func.abs(_DECRYPTED_AMOUNT)), 0.0)
+            ).outerjoin(
+                Transaction,
+                and_(
+                    self._budget_transaction_match(alias_lookup),
+                    Transaction.date >= Budget.period_start,
+                    Transaction.date <= Budget.period_end,
+                    Transaction.is_transfer == 0,
+                    Transaction.amount < 0
+                )
+            ).filter(
+                Budget.period_start <= period_datetime,
+                Budget.period_end >= period_datetime
+            ).group_by(Budget.id).order_by(
+                _category_key_expr(Budget.category), Budget.id
+            ).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get budget statuses: {e}")
+            return []
+        finally:
+            session.close()
         
-        return statuses
+        build_status = self._build_status
+        return [
+            build_status(category, float(allocated), float(spent or 0.0))
+            for category, allocated, spent in rows
+        ]
     
     def update_budget(
         self,
@@ -874,7 +1559,7 @@ class BudgetManager:
         session = self.db_manager.get_session()
         
         try:
-            budget = session.query(Budget).filter(Budget.id == budget_id).first()
+            budget = session.get(Budget, budget_id)
             if not budget:
                 logger.warning(f"Budget {budget_id} not found")
                 return None
@@ -882,13 +1567,14 @@ class BudgetManager:
             if allocated_amount is not None:
                 budget.allocated_amount = allocated_amount
             if period_start is not None:
-                budget.period_start = datetime.combine(period_start, datetime.min.time())
+                budget.period_start = _start_of_day(period_start)
             if period_end is not None:
-                budget.period_end = datetime.combine(period_end, datetime.max.time())
+                budget.period_end = _end_of_day(period_end)
             
             budget.updated_at = datetime.now(UTC)
+            # Keep the populated instance usable after commit instead of re-selecting it
+            session.expire_on_commit = False
             session.commit()
-            session.refresh(budget)
             session.expunge(budget)
             
             logger.info(f"Updated budget {budget_id}")
@@ -914,7 +1600,7 @@ class BudgetManager:
         session = self.db_manager.get_session()
         
         try:
-            budget = session.query(Budget).filter(Budget.id == budget_id).first()
+            budget = session.get(Budget, budget_id)
             if not budget:
                 logger.warning(f"Budget {budget_id} not found")
                 return False
@@ -942,8 +1628,63 @@ class BudgetManager:
         Returns:
             Total allocated amount
         """
-        budgets = self.get_all_budgets(period_date)
-        return sum(budget.allocated_amount for budget in budgets)
+        if period_date is None:
+            period_date = date.today()
+        
+        session = self.db_manager.get_session()
+        try:
+            period_datetime = _start_of_day(period_date)
+            total = session.query(
+                func.coalesce(func.sum(func.decrypt_numeric(Budget.allocated_amount)), 0.0)
+            ).filter(
+                Budget.period_start <= period_datetime,
+                Budget.period_end >= period_datetime
+            ).scalar()
+            return float(total or 0.0)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get total allocated: {e}")
+            return 0.0
+        finally:
+            session.close()
+    
+    @staticmethod
+    def _canonical_category_expr(column, alias_lookup: Dict[str, str]):
+        """
+        Build a SQL expression mapping an encrypted category column to its canonical key.
+        
+        Args:
+            column: Encrypted category column
+            alias_lookup: Alias key to canonical key mapping from config
+        
+        Returns:
+            SQL expression yielding the lowercase, trimmed canonical category key
+        """
+        key_expr = _category_key_expr(column)
+        aliases = {alias: canonical for alias, canonical in alias_lookup.items() if alias != canonical}
+        if not aliases:
+            return key_expr
+        return case(aliases, value=key_expr, else_=key_expr)
+    
+    @classmethod
+    def _budget_transaction_match(cls, alias_lookup: Dict[str, str]):
+        """
+        Build the join condition matching transactions to the budget they count against.
+        
+        A budget counts transactions whose category key is the budget's own key or
+        that key's canonical form, the same key set calculate_category_spending
+        uses; sibling aliases of the canonical category are not included.
+        
+        Args:
+            alias_lookup: Alias key to canonical key mapping from config
+        
+        Returns:
+            SQL boolean expression over Transaction and Budget
+        """
+        budget_key = _category_key_expr(Budget.category)
+        canonical_key = cls._canonical_category_expr(Budget.category, alias_lookup)
+        if canonical_key is budget_key:
+            return _TRANSACTION_CATEGORY_KEY == budget_key
+        return or_(_TRANSACTION_CATEGORY_KEY == budget_key, _TRANSACTION_CATEGORY_KEY == canonical_key)
     
     def get_total_spent(self, period_date: Optional[date] = None) -> float:
         """
@@ -955,56 +1696,93 @@ class BudgetManager:
         Returns:
             Total spent amount
         """
-        budgets = self.get_all_budgets(period_date)
-        total = 0.0
-        
-        for budget in budgets:
-            period_start = budget.period_start.date()
-            period_end = budget.period_end.date()
-            total += self.calculate_category_spending(budget.category, period_start, period_end)
+        if period_date is None:
+            period_date = date.today()
         
-        return total
+        session = self.db_manager.get_session()
+        try:
+            _, alias_lookup, _ = self._load_budget_category_aliases()
+            period_datetime = _start_of_day(period_date)
+            
+            total = session.query(
+                _money_sum(func.abs(_DECRYPTED_AMOUNT))
+            ).select_from(Budget).join(
+                Transaction,
+                and_(
+                    self._budget_transaction_match(alias_lookup),
+                    Transaction.date >= Budget.period_start,
+                    Transaction.date <= Budget.period_end
+                )
+            ).filter(
+                Budget.period_start <= period_datetime,
+                Budget.period_end >= period_datetime,
+                Transaction.is_transfer == 0,
+                Transaction.amount < 0
+            ).scalar()
+            return float(total or 0.0)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to get total spent: {e}")
+            return 0.0
+        finally:
+            session.close()
     
-    def get_all_categories_from_transactions(self) -> List[str]:
+    def get_all_categories_from_transactions(self, session: Optional[Session] = None) -> List[str]:
         """
         Get all unique categories from transactions for budget setup.
         
+        Args:
+            session: Optional existing session
+        
         Returns:
             List of unique category names
         """
-        session = self.db_manager.get_session()
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
         
         try:
             canonical_labels, alias_lookup, _ = self._load_budget_category_aliases()
             
-            query = session.query(
-                func.trim(Transaction.category)
-            )
-            query = query.filter(
-                Transaction.category.isnot(None),
-                func.trim(Transaction.category) != "",
+            # category_index is a blind index of the trimmed, lowercased category, so
+            # grouping on it de-duplicates in SQL (blank categories are excluded). Alias
+            # tokens are folded into their canonical token so aliases collapse there too.
+            group_expr = Transaction.category_index
+            alias_tokens = {
+                derive_search_token(alias_key): derive_search_token(canonical_key)
+                for alias_key, canonical_key in alias_lookup.items()
+                if alias_key != canonical_key
+            }
+            if alias_tokens:
+                group_expr = case(alias_tokens, value=Transaction.category_index, else_=Transaction.category_index)
+            category_label = func.min(func.trim(func.decrypt_text(Transaction.category)))
+            # Rows are consumed in batches rather than materialized with .all()
+            raw_categories = session.query(category_label).filter(
+                Transaction.category_index != BLANK_CATEGORY_INDEX,
+                Transaction.category_index != derive_search_token("transfer"),
                 Transaction.is_transfer == 0
-            )
-            query = query.distinct()
-            raw_categories = query.all()
+            ).group_by(group_expr).order_by(
+                func.lower(category_label)
+            ).execution_options(yield_per=500)
             
             canonical_set: Dict[str, str] = {}
+            normalize = self._normalize_category
+            alias_get = alias_lookup.get
+            label_get = canonical_labels.get
+            add_first = canonical_set.setdefault
             for (category,) in raw_categories:
-                normalized = self._normalize_category(category)
-                if not normalized:
-                    continue
-                key = self._category_key(normalized)
-                if key == "transfer":
-                    continue
-                canonical_key = alias_lookup.get(key, key)
-                if canonical_key not in canonical_set:
-                    canonical_set[canonical_key] = canonical_labels.get(canonical_key, normalized)
+                if normalized := normalize(category):
+                    key = normalized.lower()
+                    canonical_key = alias_get(key, key)
+                    add_first(canonical_key, label_get(canonical_key, normalized))
             
             # ensure canonical labels from config are included even without transactions
             for canonical_key, label in canonical_labels.items():
                 canonical_set.setdefault(canonical_key, label)
             
-            category_list = sorted(canonical_set.values(), key=str.casefold)
+            # Rows arrive ordered; this re-sort only places alias and config labels.
+            # Keys are already lowercased, so they are sorted directly.
+            category_list = [canonical_set[key] for key in sorted(canonical_set)]
             logger.info(f"Found {len(category_list)} unique categories")
             return category_list
             
@@ -1012,7 +1790,8 @@ class BudgetManager:
             logger.error(f"Failed to get categories: {e}")
             return []
         finally:
-            session.close()
+            if close_session:
+                session.close()
     
     def get_or_create_monthly_budget(
         self,
@@ -1031,14 +1810,8 @@ class BudgetManager:
         Returns:
             Budget object or None if error
         """
-        # Normalize to first of month
-        period_start = month.replace(day=1)
-        
-        # Get last day of month
-        if period_start.month == 12:
-            period_end = period_start.replace(year=period_start.year + 1, month=1, day=1) - timedelta(days=1)
-        else:
-            period_end = period_start.replace(month=period_start.month + 1, day=1) - timedelta(days=1)
+        # Normalize to the first and last day of the month
+        period_start, period_end = self.get_month_period(month)
         
         # Try to get existing budget
         existing = self.get_budget(category, period_start)
@@ -1053,14 +1826,87 @@ class BudgetManager:
             period_end=period_end
         )
     
-    def get_budget_categories(self) -> List[str]:
+    def bulk_get_or_create_monthly_budgets(
+        self,
+        categories: List[str],
+        month: date,
+        allocated_amount: float = 0.0
+    ) -> List[Budget]:
+        """
+        Get or create monthly budgets for many categories in one session.
+        
+        Existing budgets for the month are loaded with a single query; missing
+        categories are inserted together and committed once.
+        
+        Args:
+            categories: Category names (blank and duplicate names are skipped)
+            month: Month date (will be normalized to first of month)
+            allocated_amount: Amount to allocate to newly created budgets
+        
+        Returns:
+            List of Budget objects in input order, or empty list if error
+        """
+        period_start, period_end = self.get_month_period(month)
+        start_dt, end_dt = _month_datetime_bounds(month.year, month.month)
+        
+        session = self.db_manager.get_session()
+        try:
+            existing = session.query(Budget).filter(
+                Budget.period_start <= start_dt,
+                Budget.period_end >= start_dt
+            ).all()
+            budgets_by_key: Dict[str, Budget] = {}
+            for budget in existing:
+                budgets_by_key.setdefault(self._category_key(budget.category), budget)
+            
+            budgets: List[Budget] = []
+            created: List[Budget] = []
+            seen: Set[str] = set()
+            for category in categories:
+                normalized = self._normalize_category(category)
+                key = self._category_key(normalized)
+                if not normalized or key in seen:
+                    continue
+                seen.add(key)
+                
+                budget = budgets_by_key.get(key)
+                if budget is None:
+                    budget = Budget(
+                        category=normalized,
+                        allocated_amount=allocated_amount,
+                        period_start=start_dt,
+                        period_end=end_dt
+                    )
+                    created.append(budget)
+                budgets.append(budget)
+            
+            if created:
+                # Keep loaded attributes usable after commit without a refresh per row
+                session.expire_on_commit = False
+                session.add_all(created)
+                session.commit()
+                logger.info(f"Created {len(created)} budgets for {period_start} to {period_end}")
+            
+            session.expunge_all()
+            return budgets
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to get or create monthly budgets: {e}")
+            return []
+        finally:
+            session.close()
+    
+    def get_budget_categories(self, session: Optional[Session] = None) -> List[str]:
         """
         Retrieve budget categories from transactions or configuration fallback.
         
+        Args:
+            session: Optional existing session.
+        
         Returns:
             Sorted list of distinct categories.
         """
-        categories = self.get_all_categories_from_transactions()
+        categories = self.get_all_categories_from_transactions(session=session)
         if categories:
             return categories
         fallback = self._load_budget_categories_from_config()
@@ -1085,42 +1931,51 @@ class BudgetManager:
             Sorted list of available category names.
         """
         _, alias_lookup, _ = self._load_budget_category_aliases()
-        all_categories = categories if categories is not None else self.get_budget_categories()
-        if not all_categories:
-            return []
-        
-        existing_budgets = self.get_monthly_budgets(month)
-        existing_keys: Set[str] = {
-            alias_lookup.get(self._category_key(self._normalize_category(budget.category)), self._category_key(self._normalize_category(budget.category)))
-            for budget in existing_budgets
-        }
-        
-        available = [
-            category for category in all_categories
-            if alias_lookup.get(self._category_key(self._normalize_category(category)), self._category_key(self._normalize_category(category))) not in existing_keys
-        ]
-        return sorted(available, key=str.casefold)
+        # _category_key strips and lowercases, so it is the whole normalization
+        category_key = self._category_key
+        
+        # Category listing and budget lookup share one session
+        with self.db_manager.session_scope() as session:
+            all_categories = categories if categories is not None else self.get_budget_categories(session=session)
+            if not all_categories:
+                return []
+            
+            existing_keys: Set[str] = set()
+            for budget in self.get_monthly_budgets_lite(month, session=session):
+                key = category_key(budget.category)
+                existing_keys.add(alias_lookup.get(key, key))
+        
+        # Key each category once, filter on its canonical key and sort on its own key
+        keyed = [(category_key(category), category) for category in all_categories]
+        available = sorted(
+            (key, category) for key, category in keyed
+            if alias_lookup.get(key, key) not in existing_keys
+        )
+        return [category for _, category in available]
     
-    def get_monthly_budgets(self, month: date) -> List[Budget]:
+    def get_monthly_budgets(self, month: date, session: Optional[Session] = None) -> List[Budget]:
         """
         Retrieve budgets for the specified month.
         
         Args:
             month: Month to retrieve budgets for.
+            session: Optional existing session.
         
         Returns:
             List of Budget objects.
         """
-        period_start, period_end = self.get_month_period(month)
-        start_dt = datetime.combine(period_start, datetime.min.time())
-        end_dt = datetime.combine(period_end, datetime.max.time())
+        start_dt, end_dt = _month_datetime_bounds(month.year, month.month)
+        
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
         
-        session = self.db_manager.get_session()
         try:
-            budgets = session.query(Budget).filter(
-                Budget.period_start == start_dt,
-                Budget.period_end == end_dt
-            ).order_by(func.lower(Budget.category)).all()
+            budgets = session.scalars(
+                _monthly_budgets_stmt(),
+                {'start': start_dt, 'end': end_dt}
+            ).all()
             
             for budget in budgets:
                 session.expunge(budget)
@@ -1129,8 +1984,40 @@ class BudgetManager:
             logger.error(f"Failed to fetch monthly budgets: {e}")
             return []
         finally:
-            session.close()
+            if close_session:
+                session.close()
     
+    def get_monthly_budgets_lite(self, month: date, session: Optional[Session] = None) -> List[Row]:
+        """
+        Retrieve budgets for the specified month as lightweight read-only rows.
+        
+        Args:
+            month: Month to retrieve budgets for.
+            session: Optional existing session.
+        
+        Returns:
+            List of rows with id, category, allocated_amount, period_start and
+            period_end attributes, ordered like get_monthly_budgets.
+        """
+        start_dt, end_dt = _month_datetime_bounds(month.year, month.month)
+        
+        close_session = False
+        if session is None:
+            session = self.db_manager.get_session()
+            close_session = True
+        
+        try:
+            return session.execute(
+                _monthly_budget_rows_stmt(),
+                {'start': start_dt, 'end': end_dt}
+            ).all()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to fetch monthly budgets: {e}")
+            return []
+        finally:
+            if close_session:
+                session.close()
+
     def get_budget_overview(self, month: date) -> List[Dict[str, Any]]:
         """
         Build budget overview data for the UI.
@@ -1141,41 +2028,48 @@ class BudgetManager:
         Returns:
             List of dictionaries containing budget summary fields.
         """
-        budgets = self.get_monthly_budgets(month)
         overview: List[Dict[str, Any]] = []
-        if not budgets:
-            return overview
+        with self.db_manager.session_scope() as session:
+            budgets = self.get_monthly_budgets_lite(month, session=session)
+            if not budgets:
+                return overview
+            
+            period_start = budgets[0].period_start.date()
+            period_end = budgets[0].period_end.date()
+            activity_map = self.get_activity_by_category(
+                period_start=period_start,
+                period_end=period_end,
+                categories=[budget.category for budget in budgets],
+                session=session
+            )
         
-        period_start = budgets[0].period_start.date()
-        period_end = budgets[0].period_end.date()
         canonical_labels, alias_lookup, _ = self._load_budget_category_aliases()
-        activity_map = self.get_activity_by_category(
-            period_start=period_start,
-            period_end=period_end,
-            categories=[budget.category for budget in budgets]
-        )
+        # Bind per-entry lookups once; the month query matches the period exactly,
+        # so every budget shares the period_start/period_end computed above
+        normalize = self._normalize_category
+        alias_get = alias_lookup.get
+        label_get = canonical_labels.get
+        activity_get = activity_map.get
+        append = overview.append
         
         for budget in budgets:
-            period_start = budget.period_start.date()
-            period_end = budget.period_end.date()
-            normalized = self._normalize_category(budget.category)
-            category_key = self._category_key(normalized)
-            canonical_key = alias_lookup.get(category_key, category_key)
-            display_label = canonical_labels.get(canonical_key, normalized)
-            activity = activity_map.get(canonical_key, 0.0)
-            available = budget.allocated_amount - activity
-            used_pct = (activity / budget.allocated_amount * 100) if budget.allocated_amount > 0 else 0.0
+            normalized = normalize(budget.category)
+            # normalized is already stripped, so lowering it is the category key
+            category_key = normalized.lower()
+            canonical_key = alias_get(category_key, category_key)
+            allocated = budget.allocated_amount
+            activity = activity_get(canonical_key, 0.0)
             
-            overview.append({
+            append({
                 "id": budget.id,
-                "category": display_label,
+                "category": label_get(canonical_key, normalized),
                 "canonical_key": canonical_key,
-                "assigned": budget.allocated_amount,
+                "assigned": allocated,
                 "activity": activity,
-                "available": available,
+                "available": allocated - activity,
                 "period_start": period_start,
                 "period_end": period_end,
-                "budget_used_pct": used_pct
+                "budget_used_pct": (activity / allocated * 100) if allocated > 0 else 0.0
             })
         
         return overview
@@ -1200,8 +2094,10 @@ class BudgetManager:
         if not overview:
             return []
         
-        comparator = (lambda value: value > min_assigned) if strict else (lambda value: value >= min_assigned)
-        filtered = [entry for entry in overview if comparator(float(entry.get("assigned", 0.0)))]
+        if strict:
+            filtered = [entry for entry in overview if float(entry.get("assigned", 0.0)) > min_assigned]
+        else:
+            filtered = [entry for entry in overview if float(entry.get("assigned", 0.0)) >= min_assigned]
         
         logger.debug(
             "Filtered budget overview: %s -> %s entries (min_assigned=%s, strict=%s)",
@@ -1223,9 +2119,12 @@ class BudgetManager:
         Returns:
             Dictionary with total_assigned, total_activity, total_available, budget_used_pct.
         """
-        total_assigned = sum(float(entry.get("assigned", 0.0)) for entry in overview)
-        total_activity = sum(float(entry.get("activity", 0.0)) for entry in overview)
-        total_available = sum(float(entry.get("available", 0.0)) for entry in overview)
+        # One pass over the entries, summing the three columns together
+        total_assigned = total_activity = total_available = 0.0
+        for entry in overview:
+            total_assigned += float(entry.get("assigned", 0.0))
+            total_activity += float(entry.get("activity", 0.0))
+            total_available += float(entry.get("available", 0.0))
         budget_used_pct = (total_activity / total_assigned * 100.0) if total_assigned > 0 else 0.0
         
         summary = {
@@ -1279,3 +2178,81 @@ class BudgetManager:
             period_end=period_end
         )
 
+    
+    def upsert_monthly_budgets_bulk(
+        self,
+        items: List[Tuple[str, float]],
+        month: date
+    ) -> List[Budget]:
+        """
+        Create or update monthly budgets for many categories in one transaction.
+        
+        Existing budgets active at the start of the month are loaded with a
+        single query and updated in place; the rest are inserted. Everything
+        is flushed together and committed once.
+        
+        Args:
+            items: (category, allocated_amount) pairs; blank categories are
+                skipped and the last amount wins for repeated categories
+            month: Target month
+        
+        Returns:
+            List of Budget objects, one per distinct category in input order,
+            or empty list if error
+        """
+        period_start, period_end = self.get_month_period(month)
+        start_dt, end_dt = _month_datetime_bounds(month.year, month.month)
+        
+        amounts: Dict[str, Tuple[str, float]] = {}
+        for category, allocated_amount in items:
+            normalized = self._normalize_category(category)
+            if normalized:
+                amounts[normalized.lower()] = (normalized, allocated_amount)
+        if not amounts:
+            return []
+        
+        session = self.db_manager.get_session()
+        try:
+            existing = session.query(Budget).filter(
+                Budget.period_start <= start_dt,
+                Budget.period_end >= start_dt
+            ).all()
+            budgets_by_key: Dict[str, Budget] = {}
+            for budget in existing:
+                budgets_by_key.setdefault(self._category_key(budget.category), budget)
+            
+            budgets: List[Budget] = []
+            created: List[Budget] = []
+            now = datetime.now(UTC)
+            for key, (normalized, allocated_amount) in amounts.items():
+                budget = budgets_by_key.get(key)
+                if budget is None:
+                    budget = Budget(
+                        category=normalized,
+                        allocated_amount=allocated_amount,
+                        period_start=start_dt,
+                        period_end=end_dt
+                    )
+                    created.append(budget)
+                else:
+                    budget.allocated_amount = allocated_amount
+                    budget.period_start = start_dt
+                    budget.period_end = end_dt
+                    budget.updated_at = now
+                budgets.append(budget)
+            
+            # Keep loaded attributes usable after commit without a refresh per row
+            session.expire_on_commit = False
+            session.add_all(created)
+            session.commit()
+            session.expunge_all()
+            logger.info(
+                f"Upserted {len(budgets)} budgets ({len(created)} new) for {period_start} to {period_end}"
+            )
+            return budgets
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error(f"Failed to upsert monthly budgets: {e}")
+            return []
+        finally:
+            session.close()
@@ -7,9 +7,12 @@ using SQLAlchemy ORM. Supports SQLite by default with easy migration to other da
 
 import logging
 import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from sqlalchemy import (
     Column,
@@ -21,8 +24,10 @@ from sqlalchemy import (
     Integer,
     String,
     create_engine,
+    event,
     text,
 )
+from sqlalchemy.engine import Connection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, relationship, sessionmaker, validates, declarative_base
 import enum
@@ -110,6 +115,149 @@ def _ensure_account_security_columns(engine) -> None:
         raise
 
 
+# category_index value for categories that are present but blank, so the
+# backfill can tell them apart from rows that still need a token
+BLANK_CATEGORY_INDEX = ""
+
+
+def category_index_value(category: Optional[str]) -> Optional[str]:
+    """
+    Return the category_index to store for a plaintext category.
+    
+    Args:
+        category: Plaintext category (None when the transaction has none)
+    
+    Returns:
+        Search token, BLANK_CATEGORY_INDEX for a blank category, or None
+    """
+    if category is None:
+        return None
+    return derive_search_token(category) or BLANK_CATEGORY_INDEX
+
+
+def _backfill_category_index(connection) -> int:
+    """
+    Populate category_index for transactions that have a category but no token.
+    
+    Blank categories get BLANK_CATEGORY_INDEX so they are not selected again.
+    
+    Args:
+        connection: Open SQLAlchemy connection (inside a transaction)
+    
+    Returns:
+        Number of rows updated
+    """
+    manager = get_encryption_manager()
+    rows = connection.execute(
+        text(
+            "SELECT id, category FROM transactions "
+            "WHERE category_index IS NULL AND category IS NOT NULL"
+        )
+    ).fetchall()
+    
+    updates = []
+    for row_id, stored_category in rows:
+        if is_ciphertext(stored_category):
+            try:
+                plaintext = manager.decrypt_value(stored_category, str)
+            except DecryptionError:
+                plaintext = None
+        else:
+            plaintext = stored_category
+        if plaintext is None:
+            continue  # undecryptable; retried on the next sync
+        updates.append({"token": category_index_value(plaintext), "id": row_id})
+    
+    if updates:
+        connection.execute(
+            text("UPDATE transactions SET category_index = :token WHERE id = :id"),
+            updates,
+        )
+    return len(updates)
+
+
+def _ensure_transaction_category_index(engine) -> None:
+    """
+    Ensure the transaction category search-token column exists and is populated.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    try:
+        with engine.begin() as connection:
+            table_exists = connection.execute(
+                text("SELECT name FROM sqlite_master WHERE type='table' AND name='transactions'")
+            ).fetchone()
+            if not table_exists:
+                return
+            column_rows = connection.execute(text("PRAGMA table_info(transactions)")).fetchall()
+            column_names = {row[1] for row in column_rows}
+            if "category_index" not in column_names:
+                connection.execute(text("ALTER TABLE transactions ADD COLUMN category_index VARCHAR(96)"))
+            connection.execute(
+                text(
+                    "CREATE INDEX IF NOT EXISTS ix_transactions_category_index "
+                    "ON transactions(category_index)"
+                )
+            )
+            _backfill_category_index(connection)
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.error("Failed to ensure transaction category index: %s", exc)
+        raise
+
+
+_MONTHLY_AGGREGATE_TRIGGERS = {
+    "trg_transactions_monthly_agg_insert": (
+        "AFTER INSERT ON transactions BEGIN "
+        "DELETE FROM monthly_aggregate_months "
+        "WHERE year = CAST(strftime('%Y', NEW.date) AS INTEGER) "
+        "AND month = CAST(strftime('%m', NEW.date) AS INTEGER); END"
+    ),
+    "trg_transactions_monthly_agg_update": (
+        "AFTER UPDATE ON transactions BEGIN "
+        "DELETE FROM monthly_aggregate_months "
+        "WHERE (year = CAST(strftime('%Y', OLD.date) AS INTEGER) "
+        "AND month = CAST(strftime('%m', OLD.date) AS INTEGER)) "
+        "OR (year = CAST(strftime('%Y', NEW.date) AS INTEGER) "
+        "AND month = CAST(strftime('%m', NEW.date) AS INTEGER)); END"
+    ),
+    "trg_transactions_monthly_agg_delete": (
+        "AFTER DELETE ON transactions BEGIN "
+        "DELETE FROM monthly_aggregate_months "
+        "WHERE year = CAST(strftime('%Y', OLD.date) AS INTEGER) "
+        "AND month = CAST(strftime('%m', OLD.date) AS INTEGER); END"
+    ),
+}
+
+
+def _ensure_monthly_aggregate_triggers(connection) -> bool:
+    """
+    Ensure triggers that invalidate pre-computed monthly aggregates exist.
+
+    Any write to a transaction removes the "built" marker for the affected
+    month(s), so the next analytics read recomputes them. Triggers run inside
+    SQLite itself and therefore also cover bulk updates and raw sqlite3 writes.
+
+    Args:
+        connection: Open SQLAlchemy connection (inside a transaction)
+
+    Returns:
+        True if the triggers are in place, False if unsupported or the
+        transactions table does not exist yet.
+    """
+    if connection.dialect.name != "sqlite":
+        return False
+
+    table_exists = connection.execute(
+        text("SELECT name FROM sqlite_master WHERE type='table' AND name='transactions'")
+    ).fetchone()
+    if not table_exists:
+        return False
+    for trigger_name, trigger_body in _MONTHLY_AGGREGATE_TRIGGERS.items():
+        connection.execute(text(f"CREATE TRIGGER IF NOT EXISTS {trigger_name} {trigger_body}"))
+    return True
+
+
 # Base class for declarative models (using SQLAlchemy 2.0+ pattern)
 Base = declarative_base()
 
@@ -188,6 +336,10 @@ class Budget(Base):
     created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
     
+    __table_args__ = (
+        Index('idx_budget_period', 'period_start', 'period_end'),  # Active-budget range filters
+    )
+    
     def __repr__(self) -> str:
         """String representation of the budget."""
         return (
@@ -301,6 +453,7 @@ class Transaction(Base):
         description: Transaction description
         amount: Transaction amount (float, 2 decimal places)
         category: Optional transaction category
+        category_index: Deterministic search token for the category (blind index)
         account: Optional account name
         source_file: Name of the CSV file from which this transaction was imported
         import_timestamp: Timestamp when this record was imported
@@ -316,6 +469,7 @@ class Transaction(Base):
     description = Column(EncryptedString(500), nullable=False)
     amount = Column(EncryptedNumeric(), nullable=False)
     category = Column(EncryptedString(100), nullable=True)
+    category_index = Column(String(96), nullable=True, index=True)
     account = Column(EncryptedString(100), nullable=True)  # Legacy field for backward compatibility
     account_id = Column(Integer, ForeignKey("accounts.id"), nullable=True, index=True)
     source_file = Column(EncryptedString(255), nullable=False)
@@ -333,6 +487,12 @@ class Transaction(Base):
         Index('idx_date_amount', 'date', 'amount'),
         Index('idx_account_date', 'account_id', 'date'),
         Index('idx_category_date', 'category', 'date'),  # For category filtering with date ranges
+        Index('idx_tx_date_xfer_acct', 'date', 'is_transfer', 'account_id'),  # Analytics filter triple
+        Index(
+            'idx_tx_nontransfer', 'date',
+            sqlite_where=text('is_transfer = 0'),
+            postgresql_where=text('is_transfer = 0'),
+        ),  # Date-range scans that exclude transfers
     )
     
     def __repr__(self) -> str:
@@ -342,6 +502,84 @@ class Transaction(Base):
             f"description='{self.description[:30]}...', amount={self.amount})>"
         )
 
+    @validates("category")
+    def _update_category_index(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Update deterministic search token whenever the plaintext category changes."""
+        self.category_index = category_index_value(value)
+        return value
+
+
+class MonthlyAggregate(Base):
+    """
+    SQLAlchemy model holding pre-computed monthly transaction totals.
+    
+    One row per (year, month, account_id, is_transfer) bucket. Rows are rebuilt
+    lazily by the analytics engine for months missing from
+    monthly_aggregate_months, whose markers are removed by triggers whenever a
+    transaction in that month changes.
+    
+    Attributes:
+        id: Auto-incrementing primary key
+        year: Calendar year of the bucket
+        month: Calendar month of the bucket (1-12)
+        account_id: Account the totals belong to (None for unassigned transactions)
+        is_transfer: Transfer flag of the aggregated transactions (1=yes, 0=no)
+        income: Sum of positive amounts
+        expenses: Sum of absolute values of negative amounts
+        income_count: Number of positive transactions
+        expense_count: Number of negative transactions
+        transaction_count: Number of transactions, including zero amounts
+    """
+    
+    __tablename__ = "monthly_aggregates"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+    account_id = Column(Integer, nullable=True)
+    is_transfer = Column(Integer, default=0, nullable=False)
+    income = Column(EncryptedNumeric(), default=0.0, nullable=False)
+    expenses = Column(EncryptedNumeric(), default=0.0, nullable=False)
+    income_count = Column(Integer, default=0, nullable=False)
+    expense_count = Column(Integer, default=0, nullable=False)
+    transaction_count = Column(Integer, default=0, nullable=False)
+    
+    __table_args__ = (
+        Index('idx_monthly_agg_period', 'year', 'month', 'account_id'),
+    )
+    
+    def __repr__(self) -> str:
+        """String representation of the monthly aggregate."""
+        return (
+            f"<MonthlyAggregate(year={self.year}, month={self.month}, "
+            f"account_id={self.account_id}, is_transfer={self.is_transfer})>"
+        )
+
+
+class MonthlyAggregateMonth(Base):
+    """
+    SQLAlchemy model marking months whose monthly_aggregates rows are current.
+    
+    Attributes:
+        year: Calendar year
+        month: Calendar month (1-12)
+        refreshed_at: When the month's aggregates were last rebuilt
+    """
+    
+    __tablename__ = "monthly_aggregate_months"
+    
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    refreshed_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    
+    def __repr__(self) -> str:
+        """String representation of the month marker."""
+        return f"<MonthlyAggregateMonth(year={self.year}, month={self.month})>"
+
+
+# Execution option marking connections that only rebuild derived tables
+_DERIVED_DATA_OPTION = "finance_app_derived_data"
+
 
 class DatabaseManager:
     """
@@ -365,7 +603,11 @@ class DatabaseManager:
             self.engine = create_engine(connection_string, echo=False)
             attach_sqlalchemy_listeners(self.engine)
             self.SessionLocal = sessionmaker(bind=self.engine)
+            self._commit_listeners: List[Callable[[], Optional[Callable[[], None]]]] = []
+            self._commit_listeners_lock = threading.Lock()
+            event.listen(self.engine, "commit", self._notify_commit_listeners)
             _ensure_account_security_columns(self.engine)
+            _ensure_transaction_category_index(self.engine)
             logger.info(f"Database manager initialized with connection: {connection_string}")
         except SQLAlchemyError as e:
             logger.error(f"Failed to initialize database: {e}")
@@ -380,11 +622,101 @@ class DatabaseManager:
         """
         try:
             Base.metadata.create_all(self.engine)
+            # create_all skips existing tables, so add indexes introduced since they were created
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(self.engine, checkfirst=True)
+            with self.engine.begin() as connection:
+                _ensure_monthly_aggregate_triggers(connection)
             logger.info("Database tables created/verified successfully")
         except SQLAlchemyError as e:
             logger.error(f"Failed to create database tables: {e}")
             raise
     
+    def ensure_monthly_aggregates(self) -> bool:
+        """
+        Make sure the monthly aggregate tables and invalidation triggers exist.
+        
+        Returns:
+            True if pre-computed monthly aggregates can be used (SQLite only)
+        """
+        if self.engine.dialect.name != "sqlite":
+            return False
+        
+        try:
+            # Schema for derived data: set up without notifying commit listeners
+            with self.derived_data_transaction() as connection:
+                MonthlyAggregate.__table__.create(connection, checkfirst=True)
+                MonthlyAggregateMonth.__table__.create(connection, checkfirst=True)
+                return _ensure_monthly_aggregate_triggers(connection)
+        except SQLAlchemyError as e:
+            logger.warning(f"Monthly aggregates unavailable: {e}")
+            return False
+    
+    def sync_category_index(self) -> int:
+        """
+        Fill in category search tokens for rows written without them.
+        
+        Rows inserted through the ORM get their token from Transaction's
+        validator and insert_transaction_sqlite writes its own, so this only
+        needs to run after other raw SQL writes (migrations, manual fixes). It
+        also runs once when the manager is created.
+        
+        Returns:
+            Number of rows updated (always 0 on non-SQLite backends)
+        """
+        if self.engine.dialect.name != "sqlite":
+            return 0
+        
+        try:
+            # Only commit when something changed so read-side caches stay warm
+            with self.engine.connect() as connection:
+                updated = _backfill_category_index(connection)
+                if updated:
+                    connection.commit()
+            if updated:
+                logger.info(f"Backfilled category index for {updated} transactions")
+            return updated
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to sync category index: {e}")
+            raise
+    
+    def add_commit_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after every committed transaction.
+        
+        Used by read-side caches to invalidate themselves when data changes.
+        Bound methods are held weakly, so registering a listener does not keep
+        its owner alive; dead listeners are dropped on the next commit.
+        
+        Args:
+            callback: Zero-argument callable
+        """
+        if hasattr(callback, '__self__') and hasattr(callback, '__func__'):
+            reference = weakref.WeakMethod(callback)
+        else:
+            reference = lambda: callback
+        with self._commit_listeners_lock:
+            self._commit_listeners.append(reference)
+    
+    def _notify_commit_listeners(self, connection) -> None:
+        """Engine commit hook that fans out to registered listeners."""
+        if connection.get_execution_options().get(_DERIVED_DATA_OPTION):
+            return
+        with self._commit_listeners_lock:
+            callbacks = [reference() for reference in self._commit_listeners]
+            self._commit_listeners[:] = [
+                reference for reference, callback in zip(self._commit_listeners, callbacks)
+                if callback is not None
+            ]
+        for callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback()
+            except Exception as e:  # pragma: no cover - defensive
+                logger.warning(f"Commit listener failed: {e}")
+    
     def get_session(self) -> Session:
         """
         Get a new database session.
@@ -397,6 +729,78 @@ class DatabaseManager:
         """
         return self.SessionLocal()
     
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """
+        Provide one session for a group of related reads.
+        
+        The session is rolled back on error and always closed. Nothing is
+        committed automatically; callers that write must commit explicitly.
+        
+        Yields:
+            SQLAlchemy session object
+        
+        Example:
+            >>> with db_manager.session_scope() as session:
+            >>>     trends = analytics.get_monthly_trends('6m', session=session)
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+    
+    @contextmanager
+    def read_session(self) -> Iterator[Session]:
+        """
+        Provide one read-only session, bound to a single connection, for a group of reads.
+        
+        All reads share one connection and transaction (one BEGIN/ROLLBACK instead
+        of one per helper call). On SQLite the connection is switched to
+        ``PRAGMA query_only`` for the duration, so an accidental write fails
+        instead of being committed; the pragma is reset before the connection
+        returns to the pool.
+        
+        Yields:
+            SQLAlchemy session object
+        
+        Example:
+            >>> with db_manager.read_session() as session:
+            >>>     state = account_manager.get_override_state(account_id, session=session)
+        """
+        is_sqlite = self.engine.dialect.name == "sqlite"
+        with self.engine.connect() as connection:
+            if is_sqlite:
+                connection.exec_driver_sql("PRAGMA query_only = ON")
+            session = self.SessionLocal(bind=connection)
+            try:
+                yield session
+            finally:
+                session.close()
+                if is_sqlite:
+                    connection.exec_driver_sql("PRAGMA query_only = OFF")
+    
+    @contextmanager
+    def derived_data_transaction(self) -> Iterator[Connection]:
+        """
+        Provide a dedicated connection and transaction for rebuilding derived data.
+        
+        Derived tables (such as monthly aggregates) are recomputed from
+        transactions, so writing them neither touches a caller's session nor
+        notifies commit listeners: read-side caches stay valid. The transaction
+        commits on success and rolls back on error.
+        
+        Yields:
+            SQLAlchemy Connection inside an open transaction
+        """
+        with self.engine.connect() as connection:
+            connection.execution_options(**{_DERIVED_DATA_OPTION: True})
+            with connection.begin():
+                yield connection
+    
     def check_duplicate_hashes(self, hashes: List[str], session: Optional[Session] = None) -> set:
         """
         Check which duplicate hashes already exist in the database.
@@ -867,6 +1271,7 @@ def init_sqlite_db(conn: sqlite3.Connection) -> None:
                 description TEXT NOT NULL,
                 amount TEXT NOT NULL,
                 category TEXT,
+                category_index TEXT,
                 account TEXT,
                 account_id INTEGER,
                 source_file TEXT NOT NULL,
@@ -941,12 +1346,30 @@ def init_sqlite_db(conn: sqlite3.Connection) -> None:
             "CREATE INDEX IF NOT EXISTS idx_transactions_duplicate_hash ON transactions(duplicate_hash)",
             (),
         ),
+        (
+            # Composite index for the analytics date/transfer/account filter triple.
+            "CREATE INDEX IF NOT EXISTS idx_tx_date_xfer_acct ON transactions(date, is_transfer, account_id)",
+            (),
+        ),
+        (
+            # Partial index for date-range scans that exclude transfers.
+            "CREATE INDEX IF NOT EXISTS idx_tx_nontransfer ON transactions(date) WHERE is_transfer = 0",
+            (),
+        ),
     )
 
     try:
         with conn:
             for statement, params in schema_statements:
                 conn.execute(statement, params)
+            # Databases created before category_index existed get the column here
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(transactions)")}
+            if "category_index" not in columns:
+                conn.execute("ALTER TABLE transactions ADD COLUMN category_index TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_transactions_category_index "
+                "ON transactions(category_index)"
+            )
         logger.info("SQLite schema initialized successfully.")
     except sqlite3.Error as exc:
         logger.exception("Failed to initialize SQLite schema.")
@@ -978,6 +1401,7 @@ def insert_transaction_sqlite(conn: sqlite3.Connection, transaction_data: Dict[s
                     description,
                     amount,
                     category,
+                    category_index,
                     account,
                     account_id,
                     source_file,
@@ -986,13 +1410,14 @@ def insert_transaction_sqlite(conn: sqlite3.Connection, transaction_data: Dict[s
                     is_transfer,
                     transfer_to_account_id
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?)
                 """,
                 (
                     transaction_data["date"],
                     payload.get("description"),
                     payload.get("amount"),
                     payload.get("category"),
+                    category_index_value(transaction_data.get("category")),
                     payload.get("account"),
                     transaction_data.get("account_id"),
                     payload.get("source_file"),
@@ -1036,6 +1461,7 @@ def bulk_insert_transactions_sqlite(
                 payload.get("description"),
                 payload.get("amount"),
                 payload.get("category"),
+                category_index_value(transaction.get("category")),
                 payload.get("account"),
                 transaction.get("account_id"),
                 payload.get("source_file"),
@@ -1062,6 +1488,7 @@ def bulk_insert_transactions_sqlite(
                     description,
                     amount,
                     category,
+                    category_index,
                     account,
                     account_id,
                     source_file,
@@ -1070,7 +1497,7 @@ def bulk_insert_transactions_sqlite(
                     is_transfer,
                     transfer_to_account_id
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, CURRENT_TIMESTAMP), ?, ?, ?)
                 """,
                 to_insert,
             )
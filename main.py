@@ -1295,7 +1295,7 @@ def handle_budget_command(args: argparse.Namespace, connection_string: str) -> N
                 sys.exit(1)
         
         elif args.budget_action == "list":
-            budgets = budget_manager.get_all_budgets()
+            budgets = budget_manager.get_all_budgets_lite()
             if not budgets:
                 print("No active budgets found.")
             else:
@@ -1336,8 +1336,9 @@ def handle_budget_command(args: argparse.Namespace, connection_string: str) -> N
                     for status in statuses:
                         print(f"{status.category:<25} ${status.allocated:>14,.2f} ${status.spent:>14,.2f} ${status.remaining:>14,.2f} {status.percentage_used:>9.1f}%")
                     print("=" * 100)
-                    total_allocated = budget_manager.get_total_allocated()
-                    total_spent = budget_manager.get_total_spent()
+                    # Totals come from the statuses already loaded instead of two more scans
+                    total_allocated = sum(status.allocated for status in statuses)
+                    total_spent = sum(status.spent for status in statuses)
                     print(f"\nTotal Allocated: ${total_allocated:,.2f}")
                     print(f"Total Spent: ${total_spent:,.2f}")
                     print(f"Total Remaining: ${total_allocated - total_spent:,.2f}")
@@ -5,9 +5,15 @@ This module provides tools for profiling SQL queries using EXPLAIN ANALYZE
 to identify performance bottlenecks and optimize database queries.
 """
 
+import functools
+import inspect
 import logging
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
@@ -55,21 +61,36 @@ def explain_query(
         Seq Scan on transactions ...
     """
     try:
-        # Get the SQL query string
-        sql_query = str(query.statement.compile(compile_kwargs={"literal_binds": True}))
+        # SQLite has no EXPLAIN ANALYZE; EXPLAIN QUERY PLAN reports index usage instead
+        bind = session.get_bind()
+        dialect = getattr(bind, "dialect", None)
+        is_sqlite = getattr(dialect, "name", None) == "sqlite"
+        
+        # Get the SQL query string (accepts ORM queries and Core statements)
+        statement = getattr(query, "statement", query)
+        if is_sqlite:
+            sql_query = str(statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        else:
+            sql_query = str(statement.compile(compile_kwargs={"literal_binds": True}))
         
         # Build EXPLAIN command
-        explain_cmd = "EXPLAIN"
-        if analyze:
-            explain_cmd += " ANALYZE"
-        if verbose:
-            explain_cmd += " VERBOSE"
+        if is_sqlite:
+            explain_cmd = "EXPLAIN QUERY PLAN"
+        else:
+            explain_cmd = "EXPLAIN"
+            if analyze:
+                explain_cmd += " ANALYZE"
+            if verbose:
+                explain_cmd += " VERBOSE"
         
         explain_sql = f"{explain_cmd} {sql_query}"
         
-        # Execute EXPLAIN
+        # Execute EXPLAIN (SQLite plan rows are (id, parent, notused, detail))
         result = session.execute(text(explain_sql))
-        explain_rows = [row[0] for row in result.fetchall()]
+        if is_sqlite:
+            explain_rows = [str(row[-1]) for row in result.fetchall()]
+        else:
+            explain_rows = [row[0] for row in result.fetchall()]
         
         # Parse timing information from explain output (PostgreSQL format)
         query_time = None
@@ -264,3 +285,187 @@ def profile_analytics_method(
         logger.warning(f"Failed to profile {method_name}: {e}")
         return None
 
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    
+    Used to memoize read-only query results in-process. Entries are evicted in
+    least-recently-used order once maxsize is reached.
+    
+    Example:
+        >>> cache = TTLCache(maxsize=256, ttl=60)
+        >>> cache.set(("summary", "3m"), {"total_income": 100.0})
+        >>> cache.get(("summary", "3m"))
+        {'total_income': 100.0}
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept in the cache
+            ttl: Time-to-live of each entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+        
+        Args:
+            key: Cache key
+            default: Value returned on a cache miss
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value under key, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+# Commit-cleared caches, one per database manager and name, so every manager
+# object built on a database (e.g. on each Streamlit rerun) shares the same
+# cache and only one commit listener is registered per cache
+_SHARED_CACHES: "weakref.WeakKeyDictionary[Any, Dict[str, TTLCache]]" = weakref.WeakKeyDictionary()
+_SHARED_CACHES_LOCK = threading.Lock()
+
+
+def shared_commit_cache(db_manager: Any, name: str, maxsize: int = 256, ttl: float = 60.0) -> TTLCache:
+    """
+    Return the named TTLCache shared by everything using db_manager, cleared on every commit.
+    
+    Args:
+        db_manager: DatabaseManager whose commits invalidate the cache
+        name: Cache name (one cache per name and database)
+        maxsize: Maximum number of entries, used when the cache is created
+        ttl: Time-to-live of each entry in seconds, used when the cache is created
+    
+    Returns:
+        The shared TTLCache
+    """
+    with _SHARED_CACHES_LOCK:
+        caches = _SHARED_CACHES.get(db_manager)
+        if caches is None:
+            caches = _SHARED_CACHES[db_manager] = {}
+        cache = caches.get(name)
+        if cache is None:
+            cache = caches[name] = TTLCache(maxsize=maxsize, ttl=ttl)
+            db_manager.add_commit_listener(cache.clear)
+        return cache
+
+
+def _copy_result(value: Any) -> Any:
+    """
+    Copy a cached result so callers and the cache never share mutable state.
+    
+    Dicts, lists and tuples are rebuilt with their items copied recursively
+    (e.g. a dict of DataFrames); other objects exposing copy() are copied with
+    it; anything else (numbers, strings, frozen dataclasses) is returned as is.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, tuple):
+        items = (_copy_result(item) for item in value)
+        return value._make(items) if hasattr(value, '_make') else tuple(items)
+    if hasattr(value, 'copy'):
+        return value.copy()
+    return value
+
+
+def cached_method(cache_attr: str, ignore: Tuple[str, ...] = ()) -> Callable:
+    """
+    Decorator that memoizes a method's result in a TTLCache stored on the instance.
+    
+    The cache key is the method name plus the bound argument tuple (defaults
+    applied), so positional and keyword calls share entries. List arguments are
+    keyed as tuples; calls with other unhashable arguments bypass the cache.
+    Results are copied on the way in and out, including the items of dicts,
+    lists and tuples (e.g. a dict of DataFrames), so callers can mutate them
+    without corrupting the cache.
+    
+    Args:
+        cache_attr: Name of the instance attribute holding the TTLCache
+        ignore: Parameter names left out of the cache key (e.g. a reused session)
+    
+    Returns:
+        Method decorator
+    
+    Example:
+        >>> class Engine:
+        >>>     def __init__(self):
+        >>>         self._result_cache = TTLCache()
+        >>>     @cached_method('_result_cache')
+        >>>     def summary(self, time_frame='all'):
+        >>>         ...
+    """
+    def decorator(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache = getattr(self, cache_attr, None)
+            if cache is None:
+                return method(self, *args, **kwargs)
+            
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (method.__name__,) + tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in tuple(bound.arguments.items())[1:] if name not in ignore
+            )
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+            
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = method(self, *args, **kwargs)
+                cache.set(key, _copy_result(value))
+                return value
+            return _copy_result(value)
+        
+        return wrapper
+    
+    return decorator
@@ -45,6 +45,31 @@ def test_database():
                 pass
 
 
+FOOD_ALIASES = (
+    {"food": "Food"},
+    {"food": "food", "groceries": "food", "dining": "food"},
+    {"food": {"groceries", "dining"}},
+)
+
+
+def _insert_spending(db_manager, account, spending):
+    """Insert expense transactions given as (category, amount, date) tuples."""
+    db_manager.insert_transactions([
+        {
+            "date": txn_date,
+            "description": f"{category} purchase",
+            "amount": amount,
+            "category": category,
+            "account_id": account.id,
+            "account": account.name,
+            "source_file": "test.csv",
+            "duplicate_hash": f"hash-{category}-{index}",
+            "is_transfer": 0
+        }
+        for index, (category, amount, txn_date) in enumerate(spending)
+    ])
+
+
 class TestAccountManagement:
     """Tests for AccountManager class."""
     
@@ -276,6 +301,217 @@ class TestBudgeting:
         
         db_manager.close()
     
+    def test_create_budget_overlap_updates_existing(self, test_database):
+        """Test creating an overlapping budget updates the existing one in place."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        first = budget_manager.create_budget(
+            category="Groceries",
+            allocated_amount=500.0,
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31)
+        )
+        second = budget_manager.create_budget(
+            category="groceries",
+            allocated_amount=650.0,
+            period_start=date(2024, 1, 1),
+            period_end=date(2024, 1, 31)
+        )
+        
+        assert second.id == first.id
+        assert second.category == "groceries"
+        assert second.allocated_amount == 650.0
+        assert len(budget_manager.get_all_budgets(date(2024, 1, 15))) == 1
+        
+        db_manager.close()
+    
+    def test_create_budgets_bulk(self, test_database):
+        """Test creating several budgets in one transaction."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        budgets = budget_manager.create_budgets_bulk([
+            {
+                "category": category,
+                "allocated_amount": amount,
+                "period_start": date(2024, 2, 1),
+                "period_end": date(2024, 2, 29)
+            }
+            for category, amount in [("Groceries", 400.0), ("Rent", 1200.0)]
+        ])
+        
+        assert [budget.category for budget in budgets] == ["Groceries", "Rent"]
+        assert all(budget.id is not None for budget in budgets)
+        assert budget_manager.get_total_allocated(date(2024, 2, 10)) == 1600.0
+        
+        db_manager.close()
+    
+    def test_get_budget_matches_category_in_sql(self, test_database):
+        """Test get_budget matches the normalized category and active period in one lookup."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        budget_manager.create_budgets_bulk([
+            {
+                "category": category,
+                "allocated_amount": 100.0,
+                "period_start": date(2024, 3, 1),
+                "period_end": date(2024, 3, 31)
+            }
+            for category in ["Dining", "Groceries", "Travel"]
+        ])
+        
+        found = budget_manager.get_budget("  groceries ", date(2024, 3, 31))
+        
+        assert found is not None
+        assert found.category == "Groceries"
+        assert budget_manager.get_budget("Groceries", date(2024, 4, 1)) is None
+        assert budget_manager.get_budget("Fuel", date(2024, 3, 15)) is None
+        
+        db_manager.close()
+    
+    def test_get_budget_cache_hits_return_independent_objects(self, test_database):
+        """Test cached get_budget lookups do not share a mutable Budget instance."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        budget_manager.create_budget(
+            category="Groceries",
+            allocated_amount=100.0,
+            period_start=date(2024, 3, 1),
+            period_end=date(2024, 3, 31)
+        )
+        
+        first = budget_manager.get_budget("Groceries", date(2024, 3, 10))
+        first.allocated_amount = 999.0
+        second = budget_manager.get_budget("Groceries", date(2024, 3, 10))
+        
+        assert second is not first
+        assert second.id == first.id
+        assert second.allocated_amount == 100.0
+        
+        db_manager.close()
+    
+    def test_get_all_budgets_pages_in_category_order(self, test_database):
+        """Test get_all_budgets orders by category and applies limit/offset in SQL."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        budget_manager.create_budgets_bulk([
+            {
+                "category": category,
+                "allocated_amount": 100.0,
+                "period_start": date(2024, 5, 1),
+                "period_end": date(2024, 5, 31)
+            }
+            for category in ["Travel", "dining", "Groceries"]
+        ])
+        
+        everything = budget_manager.get_all_budgets(date(2024, 5, 10))
+        page = budget_manager.get_all_budgets(date(2024, 5, 10), limit=2, offset=1)
+        
+        assert [budget.category for budget in everything] == ["dining", "Groceries", "Travel"]
+        assert [budget.category for budget in page] == ["Groceries", "Travel"]
+        
+        db_manager.close()
+    
+    def test_upsert_monthly_budgets_bulk(self, test_database):
+        """Test bulk upsert updates existing month budgets and inserts the rest."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        existing = budget_manager.create_budget(
+            category="Groceries",
+            allocated_amount=300.0,
+            period_start=date(2024, 4, 1),
+            period_end=date(2024, 4, 30)
+        )
+        
+        budgets = budget_manager.upsert_monthly_budgets_bulk(
+            [("groceries", 450.0), ("Rent", 1200.0), ("  ", 5.0)],
+            month=date(2024, 4, 15)
+        )
+        
+        assert [budget.category for budget in budgets] == ["Groceries", "Rent"]
+        assert budgets[0].id == existing.id
+        assert budgets[0].allocated_amount == 450.0
+        assert budget_manager.get_total_allocated(date(2024, 4, 10)) == 1650.0
+        
+        db_manager.close()
+    
+    def test_update_budget_returns_detached_updated_budget(self, test_database):
+        """Test update_budget returns the committed values without re-selecting the row."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        
+        created = budget_manager.create_budget(
+            category="Utilities",
+            allocated_amount=150.0,
+            period_start=date(2024, 6, 1),
+            period_end=date(2024, 6, 30)
+        )
+        
+        updated = budget_manager.update_budget(created.id, allocated_amount=175.0)
+        
+        assert updated.allocated_amount == 175.0
+        assert updated.category == "Utilities"
+        assert updated.updated_at >= created.updated_at
+        assert budget_manager.get_budget("Utilities", date(2024, 6, 15)).allocated_amount == 175.0
+        assert budget_manager.update_budget(created.id + 1000, allocated_amount=1.0) is None
+        
+        db_manager.close()
+    
+    def test_budget_statuses_match_single_status_with_aliases(self, test_database, monkeypatch):
+        """Test batch statuses count only the budget's own key and its canonical key."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        monkeypatch.setattr(budget_manager, "_load_budget_category_aliases", lambda: FOOD_ALIASES)
+        
+        account = AccountManager(db_manager).create_account("Test", AccountType.BANK)
+        _insert_spending(db_manager, account, [
+            ("Food", -10.0, datetime(2024, 1, 5)),
+            ("Groceries", -20.0, datetime(2024, 1, 6)),
+            ("Dining", -40.0, datetime(2024, 1, 7)),
+        ])
+        for category in ("Food", "Dining"):
+            budget_manager.create_budget(category, 100.0, date(2024, 1, 1), date(2024, 1, 31))
+        
+        statuses = {status.category: status for status in budget_manager.get_all_budget_statuses(date(2024, 1, 15))}
+        
+        assert statuses["Food"].spent == 10.0
+        assert statuses["Dining"].spent == 50.0
+        for category, status in statuses.items():
+            assert status == budget_manager.get_budget_status(category, date(2024, 1, 15))
+        
+        db_manager.close()
+    
+    def test_total_spent_matches_per_budget_spending_with_aliases(self, test_database, monkeypatch):
+        """Test total spent sums each active budget's spending without sibling aliases."""
+        db_manager = DatabaseManager(test_database)
+        budget_manager = BudgetManager(db_manager)
+        monkeypatch.setattr(budget_manager, "_load_budget_category_aliases", lambda: FOOD_ALIASES)
+        
+        account = AccountManager(db_manager).create_account("Test", AccountType.BANK)
+        _insert_spending(db_manager, account, [
+            ("Food", -10.0, datetime(2024, 1, 5)),
+            ("Groceries", -20.0, datetime(2024, 1, 6)),
+            ("Dining", -40.0, datetime(2024, 1, 7)),
+            ("Dining", -5.0, datetime(2024, 2, 1)),
+        ])
+        for category in ("Food", "Dining"):
+            budget_manager.create_budget(category, 100.0, date(2024, 1, 1), date(2024, 1, 31))
+        
+        expected = sum(
+            budget_manager.calculate_category_spending(budget.category, date(2024, 1, 1), date(2024, 1, 31))
+            for budget in budget_manager.get_all_budgets(date(2024, 1, 15))
+        )
+        
+        assert expected == 60.0
+        assert budget_manager.get_total_spent(date(2024, 1, 15)) == expected
+        
+        db_manager.close()
+    
     def test_get_budget_status(self, test_database):
         """Test getting budget status."""
         from duplicate_detection import DuplicateDetector
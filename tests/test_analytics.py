@@ -10,9 +10,10 @@ import pandas as pd
 from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock, patch
 
-from analytics import AnalyticsEngine
+from analytics import AnalyticsEngine, _resolve_time_frame
 from report_generator import ReportGenerator
 from database_ops import DatabaseManager, Transaction, Account, AccountType
+from exceptions import AnalyticsError
 
 
 @pytest.fixture
@@ -62,6 +63,31 @@ class TestTimeFrameParsing:
         assert (now - start).days >= 355
         assert (now - start).days <= 370
     
+    def test_parse_relative_months_uses_calendar_months(self):
+        """Test relative months are exact and clamp to the end of shorter months."""
+        start, end = _resolve_time_frame('1m', datetime(2024, 3, 31, 14))
+        assert start == datetime(2024, 2, 29, 14)
+        assert end == datetime(2024, 3, 31, 14, 59, 59, 999999)
+        
+        start, _ = _resolve_time_frame('12m', datetime(2024, 1, 15, 9))
+        assert start == datetime(2023, 1, 15, 9)
+    
+    def test_parse_rejects_loose_formats(self, analytics_engine):
+        """Test only YYYY-MM-DD ranges and unsigned month counts are accepted."""
+        for time_frame in ('2023-01-01T10:00:2023-12-31', '2023-1-1:2023-12-31', '-3m', '3 m'):
+            with pytest.raises(AnalyticsError):
+                analytics_engine.parse_time_frame(time_frame)
+    
+    def test_parse_time_frame_cached_within_hour(self, analytics_engine):
+        """Test repeated parses within the same hour are served from the cache."""
+        _resolve_time_frame.cache_clear()
+        
+        first = analytics_engine.parse_time_frame('6m')
+        second = analytics_engine.parse_time_frame('6m')
+        
+        assert first == second
+        assert _resolve_time_frame.cache_info().hits >= 1
+    
     def test_parse_custom_date_range(self, analytics_engine):
         """Test parsing custom date ranges."""
         start, end = analytics_engine.parse_time_frame('2023-01-01:2023-12-31')
@@ -144,16 +170,14 @@ class TestCategoryBreakdown:
         mock_session = Mock()
         mock_db_manager.get_session.return_value = mock_session
         
-        # Mock query results
+        # Mock query results (magnitudes and percentages are computed in SQL)
         mock_results = [
-            ('Groceries', -300.0, 5),
-            ('Gas', -150.0, 3),
-            ('Restaurants', -100.0, 2),
+            ('Gas', 150.0, 3, 150.0 / 550.0 * 100),
+            ('Groceries', 300.0, 5, 300.0 / 550.0 * 100),
+            ('Restaurants', 100.0, 2, 100.0 / 550.0 * 100),
         ]
         
-        mock_query = Mock()
-        mock_query.filter.return_value.group_by.return_value.all.return_value = mock_results
-        mock_session.query.return_value = mock_query
+        mock_session.connection.return_value.execute.return_value.all.return_value = mock_results
         
         # Execute
         df = analytics_engine.get_category_breakdown(time_frame='all', expense_only=True)
@@ -173,9 +197,7 @@ class TestCategoryBreakdown:
         mock_session = Mock()
         mock_db_manager.get_session.return_value = mock_session
         
-        mock_query = Mock()
-        mock_query.filter.return_value.group_by.return_value.all.return_value = []
-        mock_session.query.return_value = mock_query
+        mock_session.connection.return_value.execute.return_value.all.return_value = []
         
         df = analytics_engine.get_category_breakdown(time_frame='all')
         
@@ -272,17 +294,13 @@ class TestMonthlyTrends:
         mock_session = Mock()
         mock_db_manager.get_session.return_value = mock_session
         
-        # Mock query results (year, month, amount)
+        # Mock aggregated query results (year, month, income, expenses)
         mock_results = [
-            (2023, 1, 1000.0),
-            (2023, 1, -500.0),
-            (2023, 2, 1200.0),
-            (2023, 2, -600.0),
+            (2023, 1, 1000.0, 500.0),
+            (2023, 2, 1200.0, 600.0),
         ]
         
-        mock_query = Mock()
-        mock_query.filter.return_value.all.return_value = mock_results
-        mock_session.query.return_value = mock_query
+        mock_session.connection.return_value.execute.return_value.all.return_value = mock_results
         
         # Execute
         df = analytics_engine.get_monthly_trends(time_frame='all')
@@ -297,6 +315,29 @@ class TestMonthlyTrends:
         assert df.iloc[0]['period'] == '2023-01'
 
 
+class TestPercentageChanges:
+    """Test percentage change calculation."""
+    
+    def test_percentage_changes(self, analytics_engine):
+        """Test changes are relative to the comparison magnitude, with zero bases handled."""
+        current_df = pd.DataFrame({'income': [100.0, 50.0], 'expenses': [0.0, 0.0], 'net': [-10.0, 0.0]})
+        comparison_df = pd.DataFrame({'income': [75.0], 'expenses': [0.0], 'net': [0.0]})
+        
+        changes = analytics_engine.calculate_percentage_changes(current_df, comparison_df)
+        
+        assert changes['income']['current'] == 150.0
+        assert changes['income']['change'] == 75.0
+        assert changes['income']['percent_change'] == 100.0
+        assert changes['expenses']['percent_change'] == 0.0
+        assert changes['net']['percent_change'] == -100.0
+    
+    def test_percentage_changes_empty(self, analytics_engine):
+        """Test empty inputs return zeroed metrics."""
+        changes = analytics_engine.calculate_percentage_changes(pd.DataFrame(), pd.DataFrame())
+        
+        assert changes['net'] == {'current': 0.0, 'comparison': 0.0, 'change': 0.0, 'percent_change': 0.0}
+
+
 class TestAccountSummary:
     """Test account summary functionality."""
     
@@ -308,16 +349,21 @@ class TestAccountSummary:
         mock_session = Mock()
         mock_db_manager.get_session.return_value = mock_session
         
-        # Mock query results
-        mock_results = [
-            ('Checking', AccountType.BANK, 2000.0),
-            ('Checking', AccountType.BANK, -1000.0),
-            ('Credit Card', AccountType.CREDIT, -500.0),
+        # Streamed (account_id, amount) rows, split across two batches to exercise the merge
+        stream_result = Mock()
+        stream_result.partitions.return_value = [
+            [(1, 2000.0)],
+            [(1, -1000.0), (2, -500.0)],
         ]
         
-        mock_query = Mock()
-        mock_query.join.return_value.filter.return_value.all.return_value = mock_results
-        mock_session.query.return_value = mock_query
+        # Account lookup for the aggregated ids
+        lookup_result = Mock()
+        lookup_result.all.return_value = [
+            (1, 'Checking', AccountType.BANK),
+            (2, 'Credit Card', AccountType.CREDIT),
+        ]
+        
+        mock_session.connection.return_value.execute.side_effect = [stream_result, lookup_result]
         
         # Execute
         df = analytics_engine.get_account_summary(time_frame='all')
@@ -326,6 +372,94 @@ class TestAccountSummary:
         assert len(df) == 2
         assert 'Checking' in df['account_name'].values
         assert 'Credit Card' in df['account_name'].values
+        
+        checking = df[df['account_name'] == 'Checking'].iloc[0]
+        assert checking['type'] == 'bank'
+        assert checking['income'] == 2000.0
+        assert checking['expenses'] == 1000.0
+        assert checking['net'] == 1000.0
+        assert checking['count'] == 2
+        assert list(df.columns) == ['account_name', 'type', 'income', 'expenses', 'net', 'count']
+
+
+class TestTopTransactions:
+    """Test top transactions functionality."""
+    
+    @patch.object(AnalyticsEngine, 'parse_time_frame')
+    def test_top_transactions(self, mock_parse, mock_db_manager, analytics_engine):
+        """Test top transactions are built from Core rows."""
+        mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
+        
+        mock_session = Mock()
+        mock_db_manager.get_session.return_value = mock_session
+        
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.all.return_value = [
+            (datetime(2023, 5, 2, 14, 30), 'Rent', -1500.0, 'Housing'),
+            (datetime(2023, 6, 1), 'Mystery charge', -80.0, None),
+        ]
+        
+        df = analytics_engine.get_top_transactions(time_frame='all', limit=2)
+        
+        assert list(df.columns) == ['date', 'description', 'amount', 'category']
+        assert list(df['date']) == ['2023-05-02', '2023-06-01']
+        assert list(df['category']) == ['Housing', 'Uncategorized']
+        
+        # Amount is filtered on its decrypted value and the limit is applied in SQL
+        stmt = mock_execute.call_args[0][0]
+        assert 'decrypt_numeric' in str(stmt)
+        assert 'LIMIT' in str(stmt)
+    
+    @patch.object(AnalyticsEngine, 'parse_time_frame')
+    def test_top_transactions_empty(self, mock_parse, mock_db_manager, analytics_engine):
+        """Test top transactions with no data."""
+        mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
+        
+        mock_session = Mock()
+        mock_db_manager.get_session.return_value = mock_session
+        mock_session.connection.return_value.execute.return_value.all.return_value = []
+        
+        df = analytics_engine.get_top_transactions(time_frame='all')
+        
+        assert df.empty
+        assert list(df.columns) == ['date', 'description', 'amount', 'category']
+
+
+class TestComparisonPeriods:
+    """Test multi-period comparison functionality."""
+    
+    def test_comparison_periods_single_query(self, mock_db_manager, analytics_engine):
+        """Test all periods are aggregated by one statement."""
+        mock_session = Mock()
+        mock_db_manager.get_session.return_value = mock_session
+        
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value._mapping = {
+            'income_0': 1000.0, 'expenses_0': 400.0, 'count_0': 5,
+            'income_1': 2500.0, 'expenses_1': 900.0, 'count_1': 12,
+        }
+        
+        df = analytics_engine.get_comparison_periods(['1m', '3m'])
+        
+        mock_execute.assert_called_once()
+        assert list(df['period']) == ['1m', '3m']
+        assert list(df['net']) == [600.0, 1600.0]
+        assert list(df['transactions']) == [5, 12]
+    
+    def test_comparison_periods_invalid_period(self, mock_db_manager, analytics_engine):
+        """Test unparseable periods are reported as zeros."""
+        mock_session = Mock()
+        mock_db_manager.get_session.return_value = mock_session
+        
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value._mapping = {
+            'income_0': 100.0, 'expenses_0': 50.0, 'count_0': 2,
+        }
+        
+        df = analytics_engine.get_comparison_periods(['bogus', '1m'])
+        
+        assert list(df['income']) == [0, 100.0]
+        assert list(df['transactions']) == [0, 2]
 
 
 if __name__ == '__main__':
@@ -6,14 +6,18 @@ including performance comparisons and edge cases.
 """
 
 import pytest
+import pandas as pd
 import tempfile
 import os
 from pathlib import Path
 from datetime import datetime, timedelta
+from unittest.mock import Mock
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
 from analytics import AnalyticsEngine
-from database_ops import DatabaseManager, Transaction, Account, AccountType
+from database_ops import DatabaseManager, Transaction, Account, AccountType, MonthlyAggregateMonth
 from exceptions import AnalyticsError
 
 
@@ -113,6 +117,37 @@ class TestIncomeExpenseSummaryIntegration:
         # Should only include transactions with category containing 'Groceries'
         assert summary['total_count'] >= 0  # May be 0 if no matches
     
+    def test_summary_category_filter_uses_search_tokens(self, analytics_engine, sample_transactions, test_db_manager):
+        """Partial, case-insensitive category matches resolve through the category index."""
+        summary = analytics_engine.get_income_expense_summary(
+            date_from=datetime(2023, 6, 1),
+            date_to=datetime(2023, 6, 30),
+            category_id='groc'
+        )
+        
+        # Groceries rows are i = 0, 3, 6, 9: two incomes of 1000 and two expenses of 200
+        assert summary['total_count'] == 4
+        assert summary['total_income'] == 2000.0
+        assert summary['total_expenses'] == 400.0
+    
+    def test_category_index_backfilled_for_raw_rows(self, analytics_engine, sample_transactions, test_db_manager):
+        """Rows written without a search token are matched once the index is synced."""
+        with test_db_manager.engine.begin() as connection:
+            connection.execute(text("UPDATE transactions SET category_index = NULL"))
+            connection.execute(text("UPDATE transactions SET category = '  ' WHERE id = 1"))
+        
+        assert test_db_manager.sync_category_index() > 0
+        # Blank categories get a sentinel, so nothing is left to re-decrypt
+        assert test_db_manager.sync_category_index() == 0
+        
+        summary = analytics_engine.get_income_expense_summary(
+            date_from=datetime(2023, 6, 1),
+            date_to=datetime(2023, 6, 30),
+            category_id='Gas'
+        )
+        
+        assert summary['total_count'] == 3
+    
     def test_summary_with_explicit_dates(self, analytics_engine, sample_transactions):
         """Test summary with explicit date range."""
         start_date = datetime(2023, 6, 1)
@@ -207,6 +242,334 @@ class TestIncomeExpenseSummaryIntegration:
             session.close()
 
 
+class TestMonthlyAggregatesIntegration:
+    """Integration tests for pre-computed monthly aggregates."""
+    
+    @pytest.fixture
+    def multi_month_account(self, test_db_manager):
+        """Insert transactions spread over several months."""
+        session = test_db_manager.get_session()
+        try:
+            account = Account(name="Aggregates", type=AccountType.BANK, balance=0.0)
+            session.add(account)
+            session.flush()
+            session.add_all([
+                Transaction(
+                    date=datetime(2023, 1, 1) + timedelta(days=i * 9),
+                    description=f"Agg {i}",
+                    amount=300.0 if i % 3 == 0 else -45.5,
+                    account_id=account.id,
+                    source_file="agg.csv",
+                    duplicate_hash=f"agg_hash_{i}",
+                    is_transfer=1 if i % 7 == 0 else 0
+                )
+                for i in range(40)
+            ])
+            session.commit()
+            return account.id
+        finally:
+            session.close()
+    
+    def test_aggregates_match_transaction_scan(self, analytics_engine, test_db_manager, multi_month_account):
+        """Summaries and trends agree with a direct transaction scan."""
+        scan_engine = AnalyticsEngine(test_db_manager)
+        scan_engine._monthly_aggregates_ready = False
+        scan_engine._result_cache = None  # engines on one database share results otherwise
+        
+        for time_frame in ['2023-01-01:2023-12-31', '2023-02-14:2023-09-03', '2023-03-01:2023-04-01']:
+            assert (
+                analytics_engine.get_income_expense_summary(time_frame=time_frame)
+                == scan_engine.get_income_expense_summary(time_frame=time_frame)
+            )
+            aggregate_trends = analytics_engine.get_monthly_trends(time_frame=time_frame)
+            scan_trends = scan_engine.get_monthly_trends(time_frame=time_frame)
+            assert aggregate_trends.round(6).equals(scan_trends.round(6))
+        
+        session = test_db_manager.get_session()
+        try:
+            assert session.query(MonthlyAggregateMonth).count() > 0
+        finally:
+            session.close()
+    
+    def test_write_invalidates_month(self, analytics_engine, test_db_manager, multi_month_account):
+        """Writing a transaction marks its month for recomputation."""
+        time_frame = '2023-01-01:2023-12-31'
+        before = analytics_engine.get_income_expense_summary(time_frame=time_frame)
+        
+        session = test_db_manager.get_session()
+        try:
+            session.add(Transaction(
+                date=datetime(2023, 3, 10),
+                description="Refund",
+                amount=99.0,
+                account_id=multi_month_account,
+                source_file="agg.csv",
+                duplicate_hash="agg_hash_refund",
+                is_transfer=0
+            ))
+            session.commit()
+            assert session.query(MonthlyAggregateMonth).filter_by(year=2023, month=3).count() == 0
+        finally:
+            session.close()
+        
+        after = analytics_engine.get_income_expense_summary(time_frame=time_frame)
+        assert after['total_income'] == before['total_income'] + 99.0
+        assert after['income_count'] == before['income_count'] + 1
+
+    
+    def test_aggregates_rebuilt_inside_read_session(self, test_db_manager, multi_month_account):
+        """Reads on a read-only session rebuild aggregates on their own connection."""
+        engine = AnalyticsEngine(test_db_manager)
+        scan_engine = AnalyticsEngine(test_db_manager)
+        scan_engine._monthly_aggregates_ready = False
+        scan_engine._result_cache = None  # engines on one database share results otherwise
+        time_frame = '2023-01-01:2023-06-30'
+        
+        with test_db_manager.read_session() as session:
+            trends = engine.get_monthly_trends(time_frame=time_frame, session=session)
+        
+        assert trends.round(6).equals(scan_engine.get_monthly_trends(time_frame=time_frame).round(6))
+        session = test_db_manager.get_session()
+        try:
+            assert session.query(MonthlyAggregateMonth).filter_by(year=2023, month=1).count() == 1
+        finally:
+            session.close()
+    
+    def test_aggregate_rebuild_leaves_caches_and_caller_alone(
+        self, analytics_engine, test_db_manager, multi_month_account, monkeypatch
+    ):
+        """Rebuilding aggregates neither commits the caller's session nor fires commit listeners."""
+        listener = Mock()
+        test_db_manager.add_commit_listener(listener)
+        
+        with test_db_manager.session_scope() as session:
+            monkeypatch.setattr(session, 'commit', lambda: pytest.fail("caller's session was committed"))
+            analytics_engine.get_monthly_trends(time_frame='2023-01-01:2023-06-30', session=session)
+        
+        listener.assert_not_called()
+        session = test_db_manager.get_session()
+        try:
+            assert session.query(MonthlyAggregateMonth).count() > 0
+        finally:
+            session.close()
+    
+    def test_failed_rebuild_falls_back_to_scan(self, analytics_engine, test_db_manager, multi_month_account, monkeypatch):
+        """If aggregates cannot be rebuilt the whole range is scanned."""
+        scan_engine = AnalyticsEngine(test_db_manager)
+        scan_engine._monthly_aggregates_ready = False
+        scan_engine._result_cache = None  # engines on one database share results otherwise
+        time_frame = '2023-01-01:2023-12-31'
+        
+        def failing_transaction():
+            raise OperationalError("rebuild", {}, Exception("attempt to write a readonly database"))
+        
+        monkeypatch.setattr(test_db_manager, 'derived_data_transaction', failing_transaction)
+        
+        assert (
+            analytics_engine.get_income_expense_summary(time_frame=time_frame)
+            == scan_engine.get_income_expense_summary(time_frame=time_frame)
+        )
+
+
+class TestResultCacheIntegration:
+    """Integration tests for the analytics result cache."""
+    
+    def test_cache_cleared_on_commit(self, analytics_engine, sample_transactions, test_db_manager):
+        """Committing new transactions invalidates cached aggregates."""
+        time_frame = '2023-06-01:2023-06-30'
+        before = analytics_engine.get_income_expense_summary(time_frame=time_frame)
+        assert analytics_engine.get_income_expense_summary(time_frame=time_frame) == before
+        
+        session = test_db_manager.get_session()
+        try:
+            session.add(Transaction(
+                date=datetime(2023, 6, 20),
+                description="Late addition",
+                amount=-25.0,
+                account_id=sample_transactions,
+                source_file="test.csv",
+                duplicate_hash="hash_late",
+                is_transfer=0
+            ))
+            session.commit()
+        finally:
+            session.close()
+        
+        after = analytics_engine.get_income_expense_summary(time_frame=time_frame)
+        assert after['total_count'] == before['total_count'] + 1
+
+
+class TestMonthlyTrendsIntegration:
+    """Integration tests for get_monthly_trends."""
+    
+    def test_monthly_trends_aggregates_in_sql(self, analytics_engine, sample_transactions):
+        """Monthly income and expenses are summed over decrypted amounts."""
+        df = analytics_engine.get_monthly_trends(time_frame='2023-06-01:2023-06-30')
+        
+        assert len(df) == 1
+        row = df.iloc[0]
+        assert row['year'] == 2023
+        assert row['month'] == 6
+        assert row['income'] == 5000.0
+        assert row['expenses'] == 1000.0
+        assert row['net'] == 4000.0
+        assert row['period'] == '2023-06'
+    
+    def test_monthly_trends_empty_range(self, analytics_engine, sample_transactions):
+        """Empty date ranges return an empty frame with the expected columns."""
+        df = analytics_engine.get_monthly_trends(time_frame='2024-01-01:2024-12-31')
+        
+        assert df.empty
+        assert list(df.columns) == ['year', 'month', 'income', 'expenses', 'net', 'period']
+    
+    def test_trends_with_comparison_single_query(self, analytics_engine, sample_transactions):
+        """Current and comparison months are split from one grouped query."""
+        current_df, comparison_df = analytics_engine.get_trends_with_comparison(
+            time_frame='2023-07-01:2023-07-31',
+            comparison_type='previous_month'
+        )
+        
+        # No July data, so the current period is empty and no comparison is returned
+        assert current_df.empty
+        assert comparison_df.empty
+        
+        current_df, comparison_df = analytics_engine.get_trends_with_comparison(
+            time_frame='2023-06-01:2023-07-31',
+            comparison_type='previous_month'
+        )
+        
+        assert list(current_df['period']) == ['2023-06']
+        assert current_df.iloc[0]['income'] == 5000.0
+        assert list(comparison_df['period']) == ['2023-06']
+        assert comparison_df.iloc[0]['expenses'] == 1000.0
+    
+    def test_trends_reuse_caller_session(self, analytics_engine, sample_transactions, test_db_manager, monkeypatch):
+        """A session passed in by the caller serves both calls without opening another."""
+        with test_db_manager.session_scope() as session:
+            monkeypatch.setattr(
+                test_db_manager, 'get_session',
+                lambda: pytest.fail("analytics opened its own session")
+            )
+            current_df, comparison_df = analytics_engine.get_trends_with_comparison(
+                time_frame='2023-06-01:2023-07-31',
+                comparison_type='previous_month',
+                session=session
+            )
+            trends_df = analytics_engine.get_monthly_trends(
+                time_frame='2023-06-01:2023-07-31',
+                session=session
+            )
+            
+            # The caller's session is left open for further use
+            assert session.execute(text("SELECT 1")).scalar() == 1
+        
+        assert list(current_df['period']) == ['2023-06']
+        assert list(trends_df['period']) == ['2023-06']
+        assert trends_df.iloc[0]['income'] == current_df.iloc[0]['income']
+    
+    def test_comparison_data_shifts_whole_months(self, analytics_engine, sample_transactions):
+        """Comparison bounds come from the first and last current periods."""
+        current_df = pd.DataFrame({
+            'year': [2023, 2023], 'month': [7, 8], 'period': ['2023-07', '2023-08']
+        })
+        previous_month = analytics_engine.get_comparison_data(current_df, 'previous_month')
+        
+        assert list(previous_month['period']) == ['2023-06']
+        assert previous_month.iloc[0]['income'] == 5000.0
+        
+        current_df = pd.DataFrame({'year': [2024], 'month': [6], 'period': ['2024-06']})
+        previous_year = analytics_engine.get_comparison_data(current_df, 'previous_year')
+        
+        assert list(previous_year['period']) == ['2023-06']
+        assert previous_year.iloc[0]['expenses'] == 1000.0
+    
+    def test_trends_with_comparison_invalid_type(self, analytics_engine):
+        """Unknown comparison types are rejected."""
+        with pytest.raises(AnalyticsError):
+            analytics_engine.get_trends_with_comparison(time_frame='3m', comparison_type='previous_week')
+
+
+class TestCategoryBreakdownIntegration:
+    """Integration tests for get_category_breakdown."""
+    
+    def test_category_breakdown_computed_in_sql(self, analytics_engine, sample_transactions):
+        """Categories are grouped on decrypted values with positive totals and percentages."""
+        df = analytics_engine.get_category_breakdown(time_frame='2023-06-01:2023-06-30')
+        
+        by_category = df.set_index('category')
+        assert sorted(by_category.index) == ['Gas', 'Groceries', 'Uncategorized']
+        assert by_category.loc['Gas', 'total'] == 400.0
+        assert by_category.loc['Gas', 'count'] == 2
+        assert by_category.loc['Uncategorized', 'total'] == 200.0
+        assert by_category.loc['Uncategorized', 'percentage'] == pytest.approx(20.0)
+        assert df['percentage'].sum() == pytest.approx(100.0)
+        assert list(df['total']) == sorted(df['total'], reverse=True)
+    
+    def test_category_breakdown_empty_range(self, analytics_engine, sample_transactions):
+        """Empty date ranges return an empty frame with the expected columns."""
+        df = analytics_engine.get_category_breakdown(time_frame='2024-01-01:2024-12-31')
+        
+        assert df.empty
+        assert list(df.columns) == ['category', 'total', 'count', 'percentage']
+
+
+class TestAccountSummaryIntegration:
+    """Integration tests for get_account_summary."""
+    
+    def test_account_summary_streams_in_batches(self, analytics_engine, sample_transactions, monkeypatch):
+        """Per-batch totals merge to the same result as a single pass."""
+        import analytics
+        monkeypatch.setattr(analytics, '_STREAM_BATCH_SIZE', 3)
+        
+        df = analytics_engine.get_account_summary(time_frame='2023-06-01:2023-06-30')
+        
+        assert len(df) == 1
+        row = df.iloc[0]
+        assert row['account_name'] == 'Test Checking'
+        assert row['type'] == 'bank'
+        assert row['income'] == 5000.0
+        assert row['expenses'] == 1000.0
+        assert row['net'] == 4000.0
+        assert row['count'] == 10
+
+
+class TestFullBreakdownIntegration:
+    """Integration tests for get_full_breakdown."""
+    
+    def test_full_breakdown_matches_individual_methods(self, analytics_engine, sample_transactions):
+        """Each frame of the combined query matches its single-purpose method."""
+        time_frame = '2023-06-01:2023-06-30'
+        full = analytics_engine.get_full_breakdown(time_frame=time_frame)
+        
+        def by_category(df):
+            return df.sort_values('category').reset_index(drop=True)
+        
+        pd.testing.assert_frame_equal(
+            by_category(full['categories']),
+            by_category(analytics_engine.get_category_breakdown(time_frame=time_frame)),
+            check_dtype=False
+        )
+        pd.testing.assert_frame_equal(
+            by_category(full['income_categories']),
+            by_category(analytics_engine.get_income_breakdown(time_frame=time_frame)),
+            check_dtype=False
+        )
+        pd.testing.assert_frame_equal(
+            full['accounts'], analytics_engine.get_account_summary(time_frame=time_frame), check_dtype=False
+        )
+        pd.testing.assert_frame_equal(
+            full['monthly'], analytics_engine.get_monthly_trends(time_frame=time_frame), check_dtype=False
+        )
+    
+    def test_full_breakdown_empty_range(self, analytics_engine, sample_transactions):
+        """Empty ranges return empty frames with the usual columns."""
+        full = analytics_engine.get_full_breakdown(time_frame='2024-01-01:2024-12-31')
+        
+        assert full['categories'].empty
+        assert list(full['accounts'].columns) == ['account_name', 'type', 'income', 'expenses', 'net', 'count']
+        assert list(full['monthly'].columns) == ['year', 'month', 'income', 'expenses', 'net', 'period']
+
+
 class TestErrorHandlingIntegration:
     """Test error handling with real database."""
     
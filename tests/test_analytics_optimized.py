@@ -50,13 +50,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 400.0
         mock_result.income_count = 2
         mock_result.expense_count = 3
-        mock_result.total_count = 5
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.join.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         # Execute
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
@@ -72,10 +69,9 @@ class TestIncomeExpenseSummaryOptimized:
         assert summary['expense_count'] == 3
         assert summary['total_count'] == 5
         
-        # Verify SQL aggregation was used (query should use func.sum/case, not query.all)
-        assert mock_session.query.called
-        mock_session.query.assert_called_once()
-        mock_query.one.assert_called_once()  # Should use .one() for aggregation, not .all()
+        # Verify SQL aggregation was used (single statement read with .one(), not .all())
+        mock_execute.assert_called_once()
+        mock_execute.return_value.one.assert_called_once()
     
     def test_summary_empty_dataset(self, analytics_engine, mock_db_manager, mock_session):
         """Test summary with no transactions returns zero values."""
@@ -87,12 +83,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = None
         mock_result.income_count = None
         mock_result.expense_count = None
-        mock_result.total_count = None
+        mock_result.zero_count = None
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         # Execute
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
@@ -107,7 +101,30 @@ class TestIncomeExpenseSummaryOptimized:
         assert summary['income_count'] == 0
         assert summary['expense_count'] == 0
         assert summary['total_count'] == 0
-    
+
+    def test_summary_total_count_includes_zero_amounts(self, analytics_engine, mock_db_manager, mock_session):
+        """Test total count is derived from the income, expense and zero-amount counts."""
+        mock_db_manager.get_session.return_value = mock_session
+
+        mock_result = Mock()
+        mock_result.total_income = 100.0
+        mock_result.total_expenses = 50.0
+        mock_result.income_count = 1
+        mock_result.expense_count = 1
+        mock_result.zero_count = 2
+
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
+
+        with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
+            mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
+
+            summary = analytics_engine.get_income_expense_summary(time_frame='all')
+
+        assert summary['income_count'] == 1
+        assert summary['expense_count'] == 1
+        assert summary['total_count'] == 4
+
     def test_summary_with_account_filter(self, analytics_engine, mock_db_manager, mock_session):
         """Test summary with account_id filter."""
         mock_db_manager.get_session.return_value = mock_session
@@ -117,12 +134,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 200.0
         mock_result.income_count = 1
         mock_result.expense_count = 2
-        mock_result.total_count = 3
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
             mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
@@ -133,8 +148,10 @@ class TestIncomeExpenseSummaryOptimized:
             )
         
         assert summary['total_income'] == 1000.0
-        # Verify filter was called with account_id
-        assert mock_query.filter.call_count >= 2  # Date filter + account filter
+        # Verify account_id was bound into the prepared statement
+        stmt, params = mock_execute.call_args[0]
+        assert params['account_id'] == 1
+        assert 'account_id' in str(stmt)
     
     def test_summary_with_account_type_filter(self, analytics_engine, mock_db_manager, mock_session):
         """Test summary with account_type filter."""
@@ -145,13 +162,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 100.0
         mock_result.income_count = 1
         mock_result.expense_count = 1
-        mock_result.total_count = 2
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.join.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
             mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
@@ -162,8 +176,10 @@ class TestIncomeExpenseSummaryOptimized:
             )
         
         assert summary['total_income'] == 500.0
-        # Verify join was called for account_type filter
-        mock_query.join.assert_called_once()
+        # Verify the statement joins accounts for the account_type filter
+        stmt, params = mock_execute.call_args[0]
+        assert params['account_type'] == AccountType.BANK
+        assert 'JOIN' in str(stmt)
     
     def test_summary_with_category_filter(self, analytics_engine, mock_db_manager, mock_session):
         """Test summary with category_id filter."""
@@ -174,15 +190,15 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 300.0
         mock_result.income_count = 0
         mock_result.expense_count = 5
-        mock_result.total_count = 5
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
-        with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
+        with patch.object(analytics_engine, 'parse_time_frame') as mock_parse, \
+                patch.object(analytics_engine, '_match_category_tokens') as mock_match:
             mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
+            mock_match.return_value = ['token-groceries']
             
             summary = analytics_engine.get_income_expense_summary(
                 time_frame='all',
@@ -190,8 +206,11 @@ class TestIncomeExpenseSummaryOptimized:
             )
         
         assert summary['total_expenses'] == 300.0
-        # Verify filter was called with category
-        assert mock_query.filter.call_count >= 2
+        # Verify matching category tokens were bound into the prepared statement
+        mock_match.assert_called_once_with(mock_session, 'Groceries')
+        stmt, params = mock_execute.call_args[0]
+        assert params['category_tokens'] == ['token-groceries']
+        assert 'category_index' in str(stmt)
     
     def test_summary_with_explicit_dates(self, analytics_engine, mock_db_manager, mock_session):
         """Test summary with explicit date_from and date_to."""
@@ -202,12 +221,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 150.0
         mock_result.income_count = 1
         mock_result.expense_count = 2
-        mock_result.total_count = 3
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         start_date = datetime(2023, 6, 1)
         end_date = datetime(2023, 6, 30)
@@ -259,12 +276,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 500.0
         mock_result.income_count = 2
         mock_result.expense_count = 3
-        mock_result.total_count = 5
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         summary = analytics_engine.get_income_expense_summary(time_frame=time_frame)
         
@@ -276,10 +291,8 @@ class TestIncomeExpenseSummaryOptimized:
         """Test summary handles query execution errors gracefully."""
         mock_db_manager.get_session.return_value = mock_session
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.side_effect = Exception("Database connection failed")
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.side_effect = Exception("Database connection failed")
         
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
             mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
@@ -299,12 +312,10 @@ class TestIncomeExpenseSummaryOptimized:
         mock_result.total_expenses = 5000.0
         mock_result.income_count = 20
         mock_result.expense_count = 30
-        mock_result.total_count = 50
+        mock_result.zero_count = 0
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.return_value = mock_result
-        mock_session.query.return_value = mock_session
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
         
         # Very large date range (10 years)
         start_date = datetime(2013, 1, 1)
@@ -318,14 +329,41 @@ class TestIncomeExpenseSummaryOptimized:
         assert summary['total_income'] == 10000.0
         # Should still use SQL aggregation (single query), not load all rows
     
+    def test_summary_reuses_prepared_statement(self, analytics_engine, mock_db_manager, mock_session):
+        """Test calls with the same filter shape reuse one statement with new parameters."""
+        mock_db_manager.get_session.return_value = mock_session
+        
+        mock_result = Mock()
+        mock_result.total_income = 100.0
+        mock_result.total_expenses = 50.0
+        mock_result.income_count = 1
+        mock_result.expense_count = 1
+        mock_result.zero_count = 0
+        
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.return_value = mock_result
+        
+        analytics_engine.get_income_expense_summary(
+            date_from=datetime(2023, 1, 1), date_to=datetime(2023, 3, 31), account_id=1
+        )
+        analytics_engine.get_income_expense_summary(
+            date_from=datetime(2023, 4, 1), date_to=datetime(2023, 6, 30), account_id=2
+        )
+        
+        (first_stmt, first_params), (second_stmt, second_params) = [
+            c[0] for c in mock_execute.call_args_list
+        ]
+        assert first_stmt is second_stmt
+        assert first_params['account_id'] == 1
+        assert second_params['account_id'] == 2
+        assert second_params['lower_0'] == datetime(2023, 4, 1)
+    
     def test_summary_ensures_session_closed(self, analytics_engine, mock_db_manager, mock_session):
         """Test that session is always closed, even on error."""
         mock_db_manager.get_session.return_value = mock_session
         
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.one.side_effect = Exception("Test error")
-        mock_session.query.return_value = mock_query
+        mock_execute = mock_session.connection.return_value.execute
+        mock_execute.return_value.one.side_effect = Exception("Test error")
         
         with patch.object(analytics_engine, 'parse_time_frame') as mock_parse:
             mock_parse.return_value = (datetime(2023, 1, 1), datetime(2023, 12, 31))
@@ -12,6 +12,7 @@ from unittest.mock import Mock, MagicMock
 from account_management import AccountManager
 from database_ops import DatabaseManager, AccountType
 from uuid import uuid4
+from sqlalchemy import text
 from datetime import datetime
 
 
@@ -182,6 +183,90 @@ class TestBalanceCalculationWithOverride:
         balance = account_manager_db.get_balance_with_override(account.id, past_date)
         assert balance == 5500.00
 
+    def test_signed_balances_bulk_matches_per_account(self, account_manager_db):
+        """Test bulk signed balances agree with per-account signed balances."""
+        checking = account_manager_db.create_account("Checking", AccountType.BANK)
+        card = account_manager_db.create_account("Card", AccountType.CREDIT)
+        empty = account_manager_db.create_account("Empty", AccountType.SAVINGS)
+        account_manager_db.set_balance_override(checking.id, date(2024, 1, 1), 1000.00)
+        account_manager_db.set_balance_override(checking.id, date(2024, 3, 1), 2000.00)
+
+        db_manager = account_manager_db.db_manager
+        db_manager.insert_transactions([
+            {
+                "date": txn_date,
+                "description": "Activity",
+                "amount": amount,
+                "category": "Misc",
+                "account_id": account.id,
+                "account": account.name,
+                "source_file": "test.csv",
+                "duplicate_hash": f"hash-{uuid4()}",
+                "is_transfer": 0
+            }
+            for account, txn_date, amount in [
+                (checking, datetime(2024, 2, 1), 100.00),   # before latest override
+                (checking, datetime(2024, 4, 1), 250.00),
+                (checking, datetime(2024, 8, 1), 75.00),    # after as_of_date
+                (card, datetime(2024, 2, 1), 300.00),
+            ]
+        ])
+
+        as_of = date(2024, 6, 1)
+        columns = account_manager_db.get_signed_balances_bulk(as_of)
+        balances = {
+            name: {'type': account_type, 'balance': balance}
+            for name, account_type, balance in zip(columns['name'], columns['type'], columns['balance'])
+        }
+
+        assert balances['Checking']['balance'] == 2250.00
+        assert balances['Card']['balance'] == -300.00
+        assert balances['Empty']['balance'] == 0.0
+        assert balances['Card']['type'] == AccountType.CREDIT.value
+        for account in (checking, card, empty):
+            assert balances[account.name]['balance'] == account_manager_db.get_signed_balance(account.id, as_of)
+
+    
+    def test_override_state_matches_separate_calls(self, account_manager_db):
+        """Test the combined override state agrees with the separate lookups."""
+        account = account_manager_db.create_account("Test Account", AccountType.BANK)
+        account_manager_db.set_balance_override(account.id, date(2024, 1, 1), 5000.00)
+        account_manager_db.set_balance_override(account.id, date(2024, 5, 1), 6000.00)
+        
+        db_manager = account_manager_db.db_manager
+        db_manager.insert_transactions([{
+            "date": datetime(2024, 5, 10),
+            "description": "Deposit",
+            "amount": 250.00,
+            "category": "Income",
+            "account_id": account.id,
+            "account": account.name,
+            "source_file": "test.csv",
+            "duplicate_hash": f"hash-{uuid4()}",
+            "is_transfer": 0
+        }])
+        
+        state = account_manager_db.get_override_state(account.id)
+        
+        assert state['balance_with_override'] == 6250.00
+        assert state['balance_with_override'] == account_manager_db.get_balance_with_override(account.id)
+        assert state['overrides'] == account_manager_db.get_balance_overrides(account.id)
+        assert [o['override_date'] for o in state['overrides']] == [date(2024, 5, 1), date(2024, 1, 1)]
+
+    def test_override_state_in_read_session(self, account_manager_db):
+        """Test override state reads through a shared read-only session."""
+        account = account_manager_db.create_account("Test Account", AccountType.BANK)
+        account_manager_db.set_balance_override(account.id, date(2024, 1, 1), 5000.00)
+
+        db_manager = account_manager_db.db_manager
+        with db_manager.read_session() as session:
+            found = account_manager_db.get_account_by_name("Test Account", session=session)
+            state = account_manager_db.get_override_state(found.id, session=session)
+            with pytest.raises(Exception):
+                session.execute(text("DELETE FROM balance_overrides"))
+
+        assert state['balance_with_override'] == 5000.00
+        assert len(account_manager_db.get_balance_overrides(account.id)) == 1
 
 class TestBalanceOverrideManagement:
     """Test balance override management functions."""
@@ -4,19 +4,23 @@ Unit tests for budgeting business logic helpers.
 Validates category retrieval, budget availability, and overview calculations.
 """
 
-from datetime import date, datetime
-from unittest.mock import Mock
+import dataclasses
+from datetime import date, datetime, time
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from budgeting import BudgetManager
-from database_ops import DatabaseManager
+from budgeting import BudgetManager, BudgetStatus, FinancialSnapshot, _day_range, _month_datetime_bounds
+from database_ops import DatabaseManager, IncomeOverride
 
 
 @pytest.fixture
 def mock_db_manager():
     """Provide a mocked database manager instance."""
-    return Mock(spec=DatabaseManager)
+    manager = Mock(spec=DatabaseManager)
+    manager.session_scope.return_value = MagicMock()
+    manager.read_session.return_value = MagicMock()
+    return manager
 
 
 @pytest.fixture
@@ -53,6 +57,27 @@ class TestBudgetCategoryHelpers:
 
         assert categories == ["Groceries", "Rent", "Utilities"]
 
+    def test_config_tables_parsed_once_per_config_version(self, monkeypatch):
+        """Config-derived alias tables should be rebuilt only when the config file changes."""
+        import budgeting
+        import config_manager
+
+        load = Mock(return_value={"budget_category_aliases": {"Groceries": ["Food "]}})
+        monkeypatch.setattr(config_manager, "load_config", load)
+        monkeypatch.setattr(budgeting, "_config_version", lambda: ("test", 1))
+
+        first = BudgetManager._load_budget_category_aliases()
+        second = BudgetManager._load_budget_category_aliases()
+
+        assert first[1] == {"groceries": "groceries", "food": "groceries"}
+        assert second is first
+        assert BudgetManager._show_projections_enabled() is True
+        assert load.call_count == 1
+
+        monkeypatch.setattr(budgeting, "_config_version", lambda: ("test", 2))
+        BudgetManager._load_budget_category_aliases()
+        assert load.call_count == 2
+
     def test_get_available_categories_excludes_existing(self, budget_manager, monkeypatch):
         """Existing budgets (case-insensitive) should be removed from available list."""
 
@@ -64,7 +89,7 @@ class TestBudgetCategoryHelpers:
             DummyBudget(2, "rent", 1200.0, start_dt, end_dt),
         ]
 
-        monkeypatch.setattr(budget_manager, "get_monthly_budgets", Mock(return_value=existing))
+        monkeypatch.setattr(budget_manager, "get_monthly_budgets_lite", Mock(return_value=existing))
 
         available = budget_manager.get_available_categories_for_month(
             month,
@@ -87,7 +112,7 @@ class TestBudgetOverview:
             DummyBudget(10, "Dining", 400.0, start_dt, end_dt),
         ]
 
-        monkeypatch.setattr(budget_manager, "get_monthly_budgets", Mock(return_value=budgets))
+        monkeypatch.setattr(budget_manager, "get_monthly_budgets_lite", Mock(return_value=budgets))
         monkeypatch.setattr(
             budget_manager,
             "get_activity_by_category",
@@ -103,6 +128,167 @@ class TestBudgetOverview:
         assert entry["available"] == pytest.approx(250.0)
         assert entry["budget_used_pct"] == pytest.approx(37.5)
         assert entry["canonical_key"] == "dining"
+
+    def test_get_all_budget_statuses_uses_single_query(self, budget_manager):
+        """Statuses should be built from one joined allocation/spending query."""
+        mock_session = Mock()
+        query = mock_session.query.return_value
+        query.outerjoin.return_value = query
+        query.filter.return_value = query
+        query.group_by.return_value = query
+        query.order_by.return_value = query
+        query.all.return_value = [("Dining", 400.0, 100.0), ("Rent", 1000.0, None), ("Gifts", 0.0, 25.0)]
+        budget_manager.db_manager.get_session.return_value = mock_session
+
+        statuses = budget_manager.get_all_budget_statuses(date(2024, 7, 15))
+
+        mock_session.query.assert_called_once()
+        assert [status.category for status in statuses] == ["Dining", "Rent", "Gifts"]
+        assert statuses[0].remaining == pytest.approx(300.0)
+        assert statuses[0].percentage_used == pytest.approx(25.0)
+        assert statuses[1].spent == 0.0
+        assert statuses[1].remaining == pytest.approx(1000.0)
+        assert statuses[2].remaining == pytest.approx(-25.0)
+        assert statuses[2].percentage_used == 0.0
+        mock_session.close.assert_called_once()
+
+    def test_get_monthly_budgets_reuses_prebuilt_statement(self, budget_manager):
+        """Monthly budget lookups should bind the month bounds into one cached statement."""
+        mock_session = Mock()
+        mock_session.scalars.return_value.all.return_value = []
+        budget_manager.db_manager.get_session.return_value = mock_session
+
+        budget_manager.get_monthly_budgets(date(2024, 2, 10))
+        budget_manager.get_monthly_budgets(date(2024, 3, 10))
+
+        first, second = mock_session.scalars.call_args_list
+        assert first.args[0] is second.args[0]
+        assert first.args[1] == {'start': datetime(2024, 2, 1), 'end': datetime(2024, 2, 29, 23, 59, 59, 999999)}
+        mock_session.query.assert_not_called()
+
+    def test_get_all_budgets_lite_returns_rows_without_orm(self, budget_manager):
+        """Lite budget lookup should execute a column select and return its rows."""
+        rows = [(10, "Dining", 400.0, datetime(2024, 7, 1), datetime(2024, 7, 31, 23, 59, 59))]
+        mock_session = Mock()
+        mock_session.execute.return_value.all.return_value = rows
+        budget_manager.db_manager.get_session.return_value = mock_session
+
+        result = budget_manager.get_all_budgets_lite(date(2024, 7, 15))
+
+        assert result == rows
+        mock_session.query.assert_not_called()
+        mock_session.expunge.assert_not_called()
+        mock_session.close.assert_called_once()
+
+    def test_budget_status_is_slotted_and_frozen(self):
+        """BudgetStatus instances should carry no __dict__ and reject mutation."""
+        status = BudgetStatus(category="Dining", allocated=400.0, spent=100.0, remaining=300.0, percentage_used=25.0)
+
+        assert not hasattr(status, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            status.spent = 0.0
+
+    def test_day_range_is_half_open(self):
+        """_day_range should end at midnight after the last day so filters use < end."""
+        start, end = _day_range(date(2024, 2, 1), date(2024, 2, 29))
+
+        assert start == datetime(2024, 2, 1)
+        assert end == datetime(2024, 3, 1)
+
+    def test_month_datetime_bounds_match_budget_period_columns(self):
+        """Cached month bounds should match the stored period_start/period_end values."""
+        start, end = _month_datetime_bounds(2024, 2)
+
+        assert start == datetime(2024, 2, 1)
+        assert end == datetime.combine(date(2024, 2, 29), time.max)
+        assert _month_datetime_bounds(2024, 2) is _month_datetime_bounds(2024, 2)
+
+    def test_build_financial_snapshot_shares_one_session(self, budget_manager, monkeypatch):
+        """Snapshot queries should all run on the session opened by read_session."""
+        scope = budget_manager.db_manager.read_session.return_value
+        shared_session = scope.__enter__.return_value
+        sums = Mock(return_value=100.0)
+        income_and_spend = Mock(return_value=(100.0, 40.0))
+        balances = Mock(return_value=2500.0)
+        monkeypatch.setattr(budget_manager, "get_income_override", Mock(return_value=None))
+        monkeypatch.setattr(budget_manager, "_sum_transactions", sums)
+        monkeypatch.setattr(budget_manager, "_sum_income_and_spend", income_and_spend)
+        monkeypatch.setattr(budget_manager, "get_account_balance_total", balances)
+        monkeypatch.setattr(budget_manager, "_show_projections_enabled", Mock(return_value=False))
+
+        snapshot = budget_manager.build_financial_snapshot(date(2024, 6, 1), date(2024, 6, 30), [{"assigned": 0.0}])
+
+        assert snapshot.income_total == pytest.approx(100.0)
+        assert snapshot.current_balances == pytest.approx(2500.0)
+        budget_manager.db_manager.read_session.assert_called_once()
+        budget_manager.db_manager.get_session.assert_not_called()
+        assert all(call.kwargs["session"] is shared_session for call in sums.call_args_list)
+        assert income_and_spend.call_args.kwargs["session"] is shared_session
+        balances.assert_called_once_with(session=shared_session)
+
+    def test_historical_income_average_uses_one_grouped_query(self, budget_manager, monkeypatch):
+        """Trailing income should be averaged from a single per-month GROUP BY query."""
+        mock_session = Mock()
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.group_by.return_value.all.return_value = [
+            (2024, 3, 300.0),
+            (2024, 4, 0.0),
+            (2024, 5, 600.0),
+        ]
+        budget_manager.db_manager.get_session.return_value = mock_session
+        monkeypatch.setattr(budget_manager, "_load_income_categories_from_config", Mock(return_value=[]))
+
+        average = budget_manager.calculate_historical_income_average(date(2024, 6, 15), months=3)
+
+        assert average == pytest.approx(450.0)
+        mock_session.query.assert_called_once()
+        budget_manager.db_manager.get_session.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    def test_daily_income_expense_uses_one_query(self, budget_manager, monkeypatch):
+        """Income and spend to date should come back from a single conditional aggregate."""
+        mock_session = Mock()
+        query = mock_session.query.return_value
+        query.filter.return_value.one.return_value = (900.0, 300.0)
+        budget_manager.db_manager.get_session.return_value = mock_session
+        monkeypatch.setattr(budget_manager, "_load_income_categories_from_config", Mock(return_value=[]))
+
+        stats = budget_manager.calculate_daily_income_expense(date(2024, 6, 1), date(2024, 6, 3))
+
+        assert stats["income_to_date"] == pytest.approx(900.0)
+        assert stats["spend_to_date"] == pytest.approx(300.0)
+        assert stats["avg_daily_spend"] == pytest.approx(100.0)
+        mock_session.query.assert_called_once()
+        mock_session.close.assert_called_once()
+
+    def test_empty_snapshot_outside_current_period_skips_database(self, budget_manager, monkeypatch):
+        """A past period with no active budgets should return a zeroed snapshot without queries."""
+        monkeypatch.setattr(budget_manager, "_show_projections_enabled", Mock(return_value=True))
+
+        snapshot = budget_manager.build_financial_snapshot(date(2024, 6, 1), date(2024, 6, 30), [])
+
+        assert snapshot.income_total == 0.0
+        assert snapshot.days_in_period == 30
+        assert snapshot.days_left == 0
+        assert snapshot.tips
+        budget_manager.db_manager.read_session.assert_not_called()
+        budget_manager.db_manager.get_session.assert_not_called()
+
+    def test_budget_totals_are_aggregated_in_sql(self, budget_manager):
+        """Allocated and spent totals should come back as single scalars."""
+        mock_session = Mock()
+        query = mock_session.query.return_value
+        query.filter.return_value = query
+        query.select_from.return_value = query
+        query.join.return_value = query
+        query.scalar.side_effect = [900.0, None]
+        budget_manager.db_manager.get_session.return_value = mock_session
+
+        assert budget_manager.get_total_allocated(date(2024, 7, 15)) == pytest.approx(900.0)
+        assert budget_manager.get_total_spent(date(2024, 7, 15)) == 0.0
+        query.all.assert_not_called()
+        assert mock_session.close.call_count == 2
     
     def test_filter_budget_overview_excludes_zero_assigned(self):
         """filter_budget_overview should drop entries with zero assigned when strict."""
@@ -118,6 +304,20 @@ class TestBudgetOverview:
         assert all(entry["assigned"] > 0 for entry in filtered)
         assert {entry["category"] for entry in filtered} == {"Groceries", "Dining"}
     
+    def test_filter_budget_overview_inclusive_keeps_order(self):
+        """Non-strict filtering should keep entries at the threshold, in input order."""
+        overview = [
+            {"category": "Rent", "assigned": 100.0},
+            {"category": "Misc"},
+            {"category": "Dining", "assigned": 25.0},
+            {"category": "Groceries", "assigned": 50.0},
+        ]
+        
+        filtered = BudgetManager.filter_budget_overview(overview, min_assigned=50.0, strict=False)
+        
+        assert [entry["category"] for entry in filtered] == ["Rent", "Groceries"]
+        assert filtered[0] is overview[0]
+    
     def test_calculate_budget_summary_handles_empty(self):
         """Summary should return zeros when overview is empty."""
         summary = BudgetManager.calculate_budget_summary([])
@@ -156,39 +356,154 @@ class TestBudgetOverview:
     
     def test_get_health_tips_generates_messages(self):
         """Tips should reflect snapshot conditions."""
-        tips = BudgetManager.get_health_tips({
-            "unassigned_funds": -50.0,
-            "available_total": -10.0,
-            "assigned_total": 500.0,
-            "budget_utilization_pct": 95.0,
-            "projected_balance": -20.0,
-        })
+        tips = BudgetManager.get_health_tips(FinancialSnapshot(
+            unassigned_funds=-50.0,
+            available_total=-10.0,
+            assigned_total=500.0,
+            budget_utilization_pct=95.0,
+            projected_balance=-20.0,
+        ))
         assert any("over-assigned" in tip.lower() for tip in tips)
         assert any("overspent" in tip.lower() or "spending" in tip.lower() for tip in tips)
 
+    def test_financial_snapshot_is_slotted_with_dict_view(self):
+        """FinancialSnapshot should use slots and still expose a plain dict for JSON callers."""
+        snapshot = FinancialSnapshot(income_total=1000.0, tips=["Keep going"])
+
+        assert not hasattr(snapshot, "__dict__")
+        data = snapshot.to_dict()
+        assert data["income_total"] == pytest.approx(1000.0)
+        assert data["tips"] == ["Keep going"]
+        assert data["projected_balance"] is None
+
+    def test_calculate_category_spending_cached_until_commit(self, budget_manager):
+        """Repeated spending lookups should be served from cache until data is committed."""
+        mock_session = Mock()
+        execute = mock_session.connection.return_value.execute
+        execute.return_value.scalar.return_value = 120.0
+        budget_manager.db_manager.get_session.return_value = mock_session
+        period = (date(2024, 6, 1), date(2024, 6, 30))
+
+        assert budget_manager.calculate_category_spending("Groceries", *period) == pytest.approx(120.0)
+        assert budget_manager.calculate_category_spending("Groceries", *period) == pytest.approx(120.0)
+        assert execute.call_count == 1
+        assert execute.call_args[0][1]["category_keys"] == ["groceries"]
+
+        add_listener = budget_manager.db_manager.add_commit_listener
+        # One listener for the budget cache, one for the shared account balance cache
+        add_listener.assert_any_call(budget_manager._budget_cache.clear)
+        add_listener.assert_any_call(budget_manager._account_balance_cache.clear)
+        assert add_listener.call_count == 2
+        budget_manager._budget_cache.clear()
+        budget_manager.calculate_category_spending("Groceries", *period)
+        assert execute.call_count == 2
+        # The statement is built once and reused with new parameters
+        assert execute.call_args_list[0][0][0] is execute.call_args_list[1][0][0]
+
+    def test_financial_snapshot_metrics_cached_until_commit(self, budget_manager, monkeypatch):
+        """Repeated snapshots should reuse the database metrics until data is committed."""
+        income = Mock(return_value={"amount": 3000.0, "source": "actual", "override": None})
+        monkeypatch.setattr(budget_manager, "calculate_monthly_income", income)
+        monkeypatch.setattr(budget_manager, "_sum_income_and_spend", Mock(return_value=(3000.0, 900.0)))
+        monkeypatch.setattr(budget_manager, "get_account_balance_total", Mock(return_value=5000.0))
+        monkeypatch.setattr(budget_manager, "_show_projections_enabled", Mock(return_value=False))
+        period = (date(2024, 6, 1), date(2024, 6, 30))
+
+        first = budget_manager.build_financial_snapshot(*period, [{"assigned": 500.0}])
+        second = budget_manager.build_financial_snapshot(*period, [{"assigned": 800.0}])
+
+        assert income.call_count == 1
+        assert first.income_total == second.income_total == pytest.approx(3000.0)
+        assert second.unassigned_funds == pytest.approx(2200.0)
+
+        budget_manager._budget_cache.clear()
+        budget_manager.build_financial_snapshot(*period, [{"assigned": 500.0}])
+        assert income.call_count == 2
+
+    def test_financial_snapshot_override_not_shared_between_snapshots(self, budget_manager, monkeypatch):
+        """Cached snapshots should each get their own IncomeOverride instance."""
+        override = IncomeOverride(
+            id=1,
+            period_start=date(2024, 6, 1),
+            period_end=date(2024, 6, 30),
+            override_amount=4000.0,
+            notes="Bonus month",
+        )
+        income = Mock(return_value={"amount": 4000.0, "source": "override", "override": override})
+        monkeypatch.setattr(budget_manager, "calculate_monthly_income", income)
+        monkeypatch.setattr(budget_manager, "_sum_income_and_spend", Mock(return_value=(3000.0, 900.0)))
+        monkeypatch.setattr(budget_manager, "get_account_balance_total", Mock(return_value=5000.0))
+        monkeypatch.setattr(budget_manager, "_show_projections_enabled", Mock(return_value=False))
+        period = (date(2024, 6, 1), date(2024, 6, 30))
+
+        first = budget_manager.build_financial_snapshot(*period, [])
+        first.override.override_amount = 1.0
+        second = budget_manager.build_financial_snapshot(*period, [])
+
+        assert income.call_count == 1
+        assert second.override is not first.override
+        assert second.override.override_amount == pytest.approx(4000.0)
+        assert second.override.notes == "Bonus month"
+
+    def test_account_balance_total_shared_across_managers(self, budget_manager):
+        """The balance total should be read once per database until the next commit."""
+        mock_session = Mock()
+        mock_session.query.return_value.scalar.return_value = 2500.0
+        budget_manager.db_manager.get_session.return_value = mock_session
+        other_manager = BudgetManager(budget_manager.db_manager)
+
+        assert budget_manager.get_account_balance_total() == pytest.approx(2500.0)
+        assert other_manager.get_account_balance_total() == pytest.approx(2500.0)
+        mock_session.query.assert_called_once()
+
+        other_manager._account_balance_cache.clear()
+        budget_manager.get_account_balance_total()
+        assert mock_session.query.call_count == 2
+
+    def test_get_budget_status_cached_until_commit(self, budget_manager, monkeypatch):
+        """Budget status should be served from cache on repeat reads until a commit."""
+        budget = DummyBudget(10, "Dining", 400.0, datetime(2024, 7, 1), datetime(2024, 7, 31, 23, 59, 59))
+        lookup = Mock(return_value=budget)
+        monkeypatch.setattr(budget_manager, "get_budget", lookup)
+        monkeypatch.setattr(budget_manager, "calculate_category_spending", Mock(return_value=100.0))
+
+        first = budget_manager.get_budget_status("Dining", date(2024, 7, 15))
+        second = budget_manager.get_budget_status("Dining", date(2024, 7, 15))
+
+        assert second == first
+        assert first.remaining == pytest.approx(300.0)
+        assert lookup.call_count == 1
+
+        budget_manager._budget_cache.clear()
+        budget_manager.get_budget_status("Dining", date(2024, 7, 15))
+        assert lookup.call_count == 2
+
     def test_get_activity_by_category_queries_database(self, budget_manager):
-        """get_activity_by_category should aggregate negative amounts and return positives."""
+        """get_activity_by_category should return the positive expense totals summed in SQL."""
         mock_session = Mock()
         query = Mock()
         group = Mock()
+        # Tokens are mapped to canonical keys in SQL, so rows arrive keyed by category
         group.all.return_value = [
-            ("groceries", -120.0),
-            ("rent", -1000.0),
-            (None, -50.0),
+            ("groceries", 120.0),
+            ("rent", 1000.0),
         ]
         query.filter.return_value = query
         query.group_by.return_value = group
         mock_session.query.return_value = query
         budget_manager.db_manager.get_session.return_value = mock_session
 
-        activity = budget_manager.get_activity_by_category(
-            period_start=date(2024, 6, 1),
-            period_end=date(2024, 6, 30),
-            categories=["Groceries", "Rent"]
-        )
+        with patch("budgeting.derive_search_token", side_effect=lambda key: f"token:{key}"):
+            activity = budget_manager.get_activity_by_category(
+                period_start=date(2024, 6, 1),
+                period_end=date(2024, 6, 30),
+                categories=["Groceries", "Rent"]
+            )
 
         assert activity["groceries"] == pytest.approx(120.0)
         assert activity["rent"] == pytest.approx(1000.0)
-        assert "none" not in activity
+        assert set(activity) == {"groceries", "rent"}
+        query.group_by.assert_called_once_with("group_key")
+        budget_manager.db_manager.sync_category_index.assert_not_called()
         mock_session.close.assert_called_once()
 
@@ -72,6 +72,40 @@ class TestMonthlyBudgetFunctions:
         # Should not create new
         budget_manager.create_budget.assert_not_called()
     
+    @pytest.mark.parametrize("month, expected", [
+        (date(2024, 2, 10), (date(2024, 2, 1), date(2024, 2, 29))),
+        (date(2023, 2, 1), (date(2023, 2, 1), date(2023, 2, 28))),
+        (date(2024, 12, 31), (date(2024, 12, 1), date(2024, 12, 31))),
+    ])
+    def test_get_month_period_bounds(self, month, expected):
+        """Test month bounds across leap years and the December rollover."""
+        assert BudgetManager.get_month_period(month) == expected
+    
+    def test_bulk_get_or_create_monthly_budgets_commits_once(self, budget_manager):
+        """Test bulk creation reuses existing budgets and inserts the rest together."""
+        mock_session = Mock()
+        budget_manager.db_manager.get_session.return_value = mock_session
+        
+        existing_budget = Mock()
+        existing_budget.category = "Groceries"
+        mock_session.query.return_value.filter.return_value.all.return_value = [existing_budget]
+        
+        budgets = budget_manager.bulk_get_or_create_monthly_budgets(
+            ["groceries ", "Gas", "gas", ""],
+            month=date(2024, 6, 15),
+            allocated_amount=50.0
+        )
+        
+        assert len(budgets) == 2
+        assert budgets[0] is existing_budget
+        assert budgets[1].category == "Gas"
+        assert budgets[1].allocated_amount == 50.0
+        assert budgets[1].period_start.date() == date(2024, 6, 1)
+        assert budgets[1].period_end.date() == date(2024, 6, 30)
+        mock_session.add_all.assert_called_once_with([budgets[1]])
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+    
     def test_get_all_categories_from_transactions(self, budget_manager):
         """Test getting unique categories from transactions."""
         mock_session = Mock()
@@ -79,7 +113,7 @@ class TestMonthlyBudgetFunctions:
         
         # Mock query results
         mock_query = Mock()
-        mock_query.filter.return_value.distinct.return_value.all.return_value = [
+        mock_query.filter.return_value.group_by.return_value.order_by.return_value.execution_options.return_value = [
             ('Groceries',),
             ('Gas',),
             ('Restaurants',),
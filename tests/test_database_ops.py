@@ -4,6 +4,7 @@ from typing import Dict
 import pytest
 
 from database_ops import (
+    BLANK_CATEGORY_INDEX,
     DatabaseError,
     bulk_insert_transactions_sqlite,
     delete_transaction_sqlite,
@@ -13,6 +14,7 @@ from database_ops import (
     insert_transaction_sqlite,
     query_transactions_sqlite,
 )
+from encryption_utils import derive_search_token
 
 
 @pytest.fixture()
@@ -208,3 +210,16 @@ def test_bulk_insert_database_error_on_failure(sqlite_conn):
     assert error.message is not None
     assert "operation" in error.details or "error" in error.details
 
+
+def test_raw_inserts_write_category_index(sqlite_conn):
+    insert_transaction_sqlite(sqlite_conn, _build_transaction(1))
+    bulk_insert_transactions_sqlite(
+        sqlite_conn,
+        [_build_transaction(2, category="  "), _build_transaction(3, category=None)],
+    )
+
+    tokens = dict(sqlite_conn.execute("SELECT duplicate_hash, category_index FROM transactions"))
+
+    assert tokens["hash-1"] == derive_search_token("groceries")
+    assert tokens["hash-2"] == BLANK_CATEGORY_INDEX
+    assert tokens["hash-3"] is None
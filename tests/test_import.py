@@ -498,7 +498,8 @@ class TestEnhancedImporter:
         self,
         test_database,
         column_mappings,
-        date_formats
+        date_formats,
+        tmp_path
     ):
         """Batch import should create a new account and respect initial balance overrides."""
         db_manager = DatabaseManager(test_database)
@@ -519,6 +520,8 @@ class TestEnhancedImporter:
                 "key_fields": ["date", "description", "amount"],
                 "hash_algorithm": "md5",
             },
+            # Uploaded files are persisted to the data directory; keep them out of the repo
+            "database": {"data_dir": str(tmp_path)},
         }
         
         result = importer.batch_import(
@@ -555,7 +558,8 @@ class TestEnhancedImporter:
         self,
         test_database,
         column_mappings,
-        date_formats
+        date_formats,
+        tmp_path
     ):
         """Robinhood Gold Card purchases should be stored as negative amounts."""
         db_manager = DatabaseManager(test_database)
@@ -583,6 +587,8 @@ class TestEnhancedImporter:
                 "key_fields": ["date", "description", "amount"],
                 "hash_algorithm": "md5",
             },
+            # Uploaded files are persisted to the data directory; keep them out of the repo
+            "database": {"data_dir": str(tmp_path)},
         }
 
         try:
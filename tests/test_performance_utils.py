@@ -4,6 +4,7 @@ Tests for performance utilities module.
 Tests query profiling, EXPLAIN functionality, and performance measurement tools.
 """
 
+import gc
 import pytest
 import os
 from unittest.mock import Mock, MagicMock, patch, call
@@ -15,7 +16,10 @@ from performance_utils import (
     profile_query_with_timing,
     log_query_performance,
     is_profiling_enabled,
-    profile_analytics_method
+    profile_analytics_method,
+    TTLCache,
+    cached_method,
+    shared_commit_cache
 )
 from database_ops import Transaction
 from analytics import AnalyticsEngine
@@ -301,6 +305,157 @@ class TestProfileAnalyticsMethod:
                 assert mock_logger.warning.called
 
 
+class TestTTLCache:
+    """Test the in-process TTL cache and method memoization decorator."""
+    
+    def test_get_set_and_clear(self):
+        """Values round-trip until the cache is cleared."""
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set('a', 1)
+        
+        assert cache.get('a') == 1
+        assert cache.get('missing', 'default') == 'default'
+        
+        cache.clear()
+        assert cache.get('a') is None
+    
+    def test_entries_expire(self):
+        """Entries older than the TTL are treated as misses."""
+        cache = TTLCache(maxsize=4, ttl=10)
+        with patch('performance_utils.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('performance_utils.time.monotonic', return_value=111.0):
+            assert cache.get('a') is None
+    
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert len(cache) == 2
+    
+    def test_cached_method_normalizes_arguments(self):
+        """Positional and keyword calls share one cache entry."""
+        class Engine:
+            def __init__(self):
+                self._result_cache = TTLCache()
+                self.calls = 0
+            
+            @cached_method('_result_cache')
+            def summary(self, time_frame='all', account_id=None):
+                self.calls += 1
+                return {'time_frame': time_frame}
+        
+        engine = Engine()
+        first = engine.summary('3m')
+        first['mutated'] = True
+        second = engine.summary(time_frame='3m', account_id=None)
+        
+        assert engine.calls == 1
+        assert 'mutated' not in second
+        
+        engine.summary('6m')
+        assert engine.calls == 2
+    
+    def test_cached_method_ignores_listed_arguments(self):
+        """Ignored parameters such as a reused session do not split cache entries."""
+        class Engine:
+            def __init__(self):
+                self._result_cache = TTLCache()
+                self.calls = 0
+            
+            @cached_method('_result_cache', ignore=('session',))
+            def trends(self, time_frame='12m', session=None):
+                self.calls += 1
+                return {'time_frame': time_frame}
+        
+        engine = Engine()
+        engine.trends('6m', session=object())
+        engine.trends('6m', session=object())
+        engine.trends('6m')
+        
+        assert engine.calls == 1
+    
+    def test_cached_method_keys_list_arguments_as_tuples(self):
+        """List arguments are cached instead of bypassing the cache."""
+        class Engine:
+            def __init__(self):
+                self._result_cache = TTLCache()
+                self.calls = 0
+            
+            @cached_method('_result_cache')
+            def compare(self, periods):
+                self.calls += 1
+                return list(periods)
+        
+        engine = Engine()
+        engine.compare(['1m', '3m'])
+        engine.compare(['1m', '3m'])
+        engine.compare(['3m', '1m'])
+        
+        assert engine.calls == 2
+    
+    def test_cached_method_copies_nested_results(self):
+        """Containers in a cached result are copied, not shared with the cache."""
+        class Engine:
+            def __init__(self):
+                self._result_cache = TTLCache()
+            
+            @cached_method('_result_cache')
+            def breakdown(self):
+                return {'categories': [{'name': 'Food', 'amount': 10.0}], 'pair': ([1], [2])}
+        
+        engine = Engine()
+        first = engine.breakdown()
+        first['categories'].clear()
+        second = engine.breakdown()
+        second['pair'][0].append(99)
+        third = engine.breakdown()
+        
+        assert third['categories'] == [{'name': 'Food', 'amount': 10.0}]
+        assert third['pair'] == ([1], [2])
+        assert third['categories'] is not second['categories']
+
+    
+    def test_shared_commit_cache_registers_one_listener_per_database(self):
+        """Managers re-created on one database reuse its cache and listener."""
+        db_manager = Mock()
+        
+        first = shared_commit_cache(db_manager, 'budgets')
+        second = shared_commit_cache(db_manager, 'budgets')
+        other = shared_commit_cache(db_manager, 'analytics')
+        
+        assert first is second
+        assert other is not first
+        assert db_manager.add_commit_listener.call_args_list == [call(first.clear), call(other.clear)]
+        assert shared_commit_cache(Mock(), 'budgets') is not first
+    
+    def test_commit_listeners_do_not_keep_owners_alive(self, tmp_path):
+        """Bound-method listeners are held weakly and dropped once their owner is gone."""
+        db_manager = DatabaseManager(f"sqlite:///{tmp_path / 'listeners.db'}")
+        db_manager.create_tables()
+        cache = TTLCache()
+        cache.set('key', 1)
+        kept = TTLCache()
+        kept.set('key', 1)
+        db_manager.add_commit_listener(cache.clear)
+        db_manager.add_commit_listener(kept.clear)
+        
+        del cache
+        gc.collect()
+        with db_manager.engine.begin() as connection:
+            connection.execute(text("SELECT 1"))
+        
+        assert len(kept) == 0
+        assert len(db_manager._commit_listeners) == 1
+        db_manager.close()
+
+
 class TestIntegrationWithRealQueries:
     """Integration tests with real SQLAlchemy queries (using in-memory SQLite)."""
     
@@ -329,6 +484,79 @@ class TestIntegrationWithRealQueries:
             assert 'transactions' in result['sql'].lower() or 'transaction' in result['sql'].lower()
         finally:
             session.close()
+    
+    def test_explain_query_sqlite_uses_analytics_indexes(self, test_db):
+        """SQLite plans for analytics date/transfer filters use the composite indexes."""
+        from datetime import datetime
+        from sqlalchemy import select
+        
+        session = test_db.get_session()
+        try:
+            stmt = select(func.count(Transaction.id)).where(
+                Transaction.date >= datetime(2023, 1, 1),
+                Transaction.date <= datetime(2023, 12, 31),
+                Transaction.is_transfer == 0
+            )
+            
+            result = explain_query(session, stmt, analyze=True)
+            
+            assert 'idx_tx_' in result['formatted_plan']
+        finally:
+            session.close()
+    
+    def test_create_tables_adds_missing_indexes(self, test_db):
+        """create_tables adds new indexes to tables that already exist."""
+        with test_db.engine.begin() as connection:
+            connection.execute(text("DROP INDEX idx_tx_date_xfer_acct"))
+        
+        test_db.create_tables()
+        
+        with test_db.engine.connect() as connection:
+            names = {
+                row[0] for row in connection.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transactions'")
+                )
+            }
+        assert {'idx_tx_date_xfer_acct', 'idx_tx_nontransfer'} <= names
+    
+    def test_explain_query_sqlite_uses_budget_period_index(self, test_db):
+        """SQLite plans for active-budget lookups use the period index."""
+        from datetime import datetime
+        from sqlalchemy import select
+        from database_ops import Budget
+        
+        session = test_db.get_session()
+        try:
+            period = datetime(2024, 7, 15)
+            stmt = select(Budget.id).where(
+                Budget.period_start <= period,
+                Budget.period_end >= period
+            )
+            
+            result = explain_query(session, stmt, analyze=True)
+            
+            assert 'idx_budget_period' in result['formatted_plan']
+        finally:
+            session.close()
+    
+    def test_explain_query_sqlite_monthly_budgets_use_period_index(self, test_db):
+        """SQLite plans for a month's budgets use the period index."""
+        from datetime import datetime
+        from sqlalchemy import select
+        from database_ops import Budget
+        
+        session = test_db.get_session()
+        try:
+            stmt = select(Budget.id, Budget.category).where(
+                Budget.period_start == datetime(2024, 7, 1),
+                Budget.period_end == datetime(2024, 7, 31, 23, 59, 59)
+            )
+            
+            result = explain_query(session, stmt, analyze=True)
+            
+            assert 'idx_budget_period' in result['formatted_plan']
+        finally:
+            session.close()
 
 
 if __name__ == '__main__':
@@ -7,7 +7,7 @@ sorting, and net worth calculations.
 
 import pytest
 from datetime import date
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, patch
 
 from account_management import AccountManager
 from database_ops import DatabaseManager, AccountType
@@ -95,6 +95,26 @@ class TestSignedBalance:
         
         # Zero should remain zero (or -0.00, which equals 0.00)
         assert balance == 0.00 or balance == -0.00
+    
+    def test_signed_balance_cached_until_commit(self, mock_db_manager, account_manager):
+        """Test signed balances are shared across managers and cleared on commit."""
+        account_manager.get_balance_with_override = Mock(return_value=750.00)
+        mock_account = Mock()
+        mock_account.type = AccountType.BANK
+        account_manager.get_account = Mock(return_value=mock_account)
+        
+        assert account_manager.get_signed_balance(1, date(2024, 1, 31)) == 750.00
+        # A second manager on the same database reuses the cached value
+        assert AccountManager(mock_db_manager).get_signed_balance(1, date(2024, 1, 31)) == 750.00
+        assert account_manager.get_balance_with_override.call_count == 1
+        
+        # Only one listener is registered per database manager
+        mock_db_manager.add_commit_listener.assert_called_once()
+        on_commit = mock_db_manager.add_commit_listener.call_args[0][0]
+        on_commit()
+        
+        account_manager.get_signed_balance(1, date(2024, 1, 31))
+        assert account_manager.get_balance_with_override.call_count == 2
 
 
 class TestNetWorthCalculation:
@@ -219,6 +239,47 @@ class TestSorting:
         assert liabilities_sorted[2]['balance'] == -100.00
 
 
+class TestRefinedSummary:
+    """Test the refined summary built by the analytics engine."""
+    
+    def test_split_sort_and_totals(self, mock_db_manager):
+        """Test accounts are split by sign, sorted and totalled."""
+        from analytics import AnalyticsEngine
+        
+        bulk = {
+            'id': [1, 2, 3, 4],
+            'name': ['Card', 'Checking', 'Loan', 'Savings'],
+            'type': ['credit', 'bank', 'credit', 'savings'],
+            'balance': [-100.0, 1000.0, -5000.0, 0.0]
+        }
+        
+        with patch('analytics.AccountManager') as manager_cls:
+            manager_cls.return_value.get_signed_balances_bulk.return_value = bulk
+            summary = AnalyticsEngine(mock_db_manager).get_account_summary_refined('2024-06-01')
+        
+        manager_cls.return_value.get_signed_balances_bulk.assert_called_once_with(date(2024, 6, 1))
+        assert list(summary['assets']['name']) == ['Checking', 'Savings']
+        assert list(summary['liabilities']['name']) == ['Card', 'Loan']
+        assert list(summary['liabilities'].index) == [0, 1]
+        assert summary['assets_total'] == 1000.0
+        assert summary['liabilities_total'] == -5100.0
+        assert summary['net_worth'] == -4100.0
+
+    
+    @pytest.mark.parametrize('as_of_date', ['2024-13-01', '2024-6-1', '20240601', 'yesterday'])
+    def test_invalid_as_of_date_uses_today(self, mock_db_manager, as_of_date):
+        """Test malformed or impossible dates fall back to today."""
+        from analytics import AnalyticsEngine
+        
+        with patch('analytics.AccountManager') as manager_cls:
+            manager_cls.return_value.get_signed_balances_bulk.return_value = {
+                'id': [], 'name': [], 'type': [], 'balance': []
+            }
+            summary = AnalyticsEngine(mock_db_manager).get_account_summary_refined(as_of_date)
+        
+        manager_cls.return_value.get_signed_balances_bulk.assert_called_once_with(date.today())
+        assert summary['net_worth'] == 0.0
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
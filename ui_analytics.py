@@ -104,6 +104,61 @@ def format_currency(amount: float) -> str:
     return f"${amount:,.2f}"
 
 
+def fetch_trends_with_comparison(analytics, time_frame, account_id, comparison_selection):
+    """
+    Fetch monthly trends and, when requested, the comparison period in one query.
+    
+    Args:
+        analytics: AnalyticsEngine instance
+        time_frame: Time frame for the current period
+        account_id: Optional account ID filter
+        comparison_selection: Dropdown label ("None", "Previous Month", "Previous Year")
+    
+    Returns:
+        Tuple of (trends_df, comparison_df, comparison_type, changes); the last
+        three are None when no comparison is shown.
+    """
+    comparison_type = {
+        "Previous Month": 'previous_month',
+        "Previous Year": 'previous_year'
+    }.get(comparison_selection)
+    
+    # One session (and read snapshot) serves both periods and any fallback
+    with analytics.db_manager.session_scope() as session:
+        if comparison_type is None:
+            df = analytics.get_monthly_trends(time_frame=time_frame, account_id=account_id, session=session)
+            return df, None, None, None
+        
+        try:
+            df, comparison_df = analytics.get_trends_with_comparison(
+                time_frame=time_frame,
+                comparison_type=comparison_type,
+                account_id=account_id,
+                session=session
+            )
+        except Exception as e:
+            logger.error(f"Error fetching comparison data: {e}", exc_info=True)
+            st.error(f"Error loading comparison data: {e}")
+            session.rollback()
+            df = analytics.get_monthly_trends(time_frame=time_frame, account_id=account_id, session=session)
+            return df, None, None, None
+    
+    if df.empty:
+        return df, None, None, None
+    
+    # Need at least 2 months for previous month comparison
+    if comparison_type == 'previous_month' and len(df) < 2:
+        st.warning("⚠️ Previous Month comparison requires at least 2 months of data. Showing current period only.")
+        return df, None, None, None
+    
+    if comparison_df.empty:
+        st.warning(f"⚠️ No data available for {comparison_selection.lower()} comparison.")
+        return df, comparison_df, comparison_type, None
+    
+    changes = analytics.calculate_percentage_changes(df, comparison_df)
+    return df, comparison_df, comparison_type, changes
+
+
 def create_category_pie_chart(df: pd.DataFrame, title: str = "Spending by Category") -> alt.Chart:
     """
     Create interactive pie chart for category breakdown using Altair.
@@ -880,53 +935,11 @@ def render_overview(analytics, report_gen, time_frame, account_id, time_frame_la
         help="Select a comparison period to overlay on the chart"
     )
     
-    df_trends = analytics.get_monthly_trends(
-        time_frame=time_frame,
-        account_id=account_id
+    df_trends, comparison_df, comparison_type, changes = fetch_trends_with_comparison(
+        analytics, time_frame, account_id, comparison_selection
     )
     
     if not df_trends.empty:
-        # Determine comparison type and fetch data if needed
-        comparison_df = None
-        comparison_type = None
-        changes = None
-        
-        if comparison_selection == "Previous Month":
-            # Check if we have enough data (need at least 2 months for previous month comparison)
-            if len(df_trends) < 2:
-                st.warning("⚠️ Previous Month comparison requires at least 2 months of data. Showing current period only.")
-            else:
-                try:
-                    comparison_type = 'previous_month'
-                    comparison_df = analytics.get_comparison_data(
-                        current_df=df_trends,
-                        comparison_type=comparison_type,
-                        account_id=account_id
-                    )
-                    if comparison_df.empty:
-                        st.warning("⚠️ No data available for previous month comparison.")
-                    else:
-                        changes = analytics.calculate_percentage_changes(df_trends, comparison_df)
-                except Exception as e:
-                    logger.error(f"Error fetching comparison data: {e}", exc_info=True)
-                    st.error(f"Error loading comparison data: {e}")
-        
-        elif comparison_selection == "Previous Year":
-            try:
-                comparison_type = 'previous_year'
-                comparison_df = analytics.get_comparison_data(
-                    current_df=df_trends,
-                    comparison_type=comparison_type,
-                    account_id=account_id
-                )
-                if comparison_df.empty:
-                    st.warning("⚠️ No data available for previous year comparison.")
-                else:
-                    changes = analytics.calculate_percentage_changes(df_trends, comparison_df)
-            except Exception as e:
-                logger.error(f"Error fetching comparison data: {e}", exc_info=True)
-                st.error(f"Error loading comparison data: {e}")
-        
         # Create and display chart
         chart_title = "Last 6 Months"
         if comparison_selection != "None" and comparison_df is not None and not comparison_df.empty:
@@ -1439,57 +1452,15 @@ def render_trends(analytics, report_gen, time_frame, account_id, time_frame_labe
         help="Select a comparison period to overlay on the chart"
     )
     
-    # Get trends data
-    df = analytics.get_monthly_trends(
-        time_frame=time_frame,
-        account_id=account_id
+    # Get trends data (and comparison period, if selected, in the same query)
+    df, comparison_df, comparison_type, changes = fetch_trends_with_comparison(
+        analytics, time_frame, account_id, comparison_selection
     )
     
     if df.empty:
         st.warning("No trend data available for the selected time frame.")
         return
     
-    # Determine comparison type and fetch data if needed
-    comparison_df = None
-    comparison_type = None
-    changes = None
-    
-    if comparison_selection == "Previous Month":
-        # Check if we have enough data (need at least 2 months for previous month comparison)
-        if len(df) < 2:
-            st.warning("⚠️ Previous Month comparison requires at least 2 months of data. Showing current period only.")
-        else:
-            try:
-                comparison_type = 'previous_month'
-                comparison_df = analytics.get_comparison_data(
-                    current_df=df,
-                    comparison_type=comparison_type,
-                    account_id=account_id
-                )
-                if comparison_df.empty:
-                    st.warning("⚠️ No data available for previous month comparison.")
-                else:
-                    changes = analytics.calculate_percentage_changes(df, comparison_df)
-            except Exception as e:
-                logger.error(f"Error fetching comparison data: {e}", exc_info=True)
-                st.error(f"Error loading comparison data: {e}")
-    
-    elif comparison_selection == "Previous Year":
-        try:
-            comparison_type = 'previous_year'
-            comparison_df = analytics.get_comparison_data(
-                current_df=df,
-                comparison_type=comparison_type,
-                account_id=account_id
-            )
-            if comparison_df.empty:
-                st.warning("⚠️ No data available for previous year comparison.")
-            else:
-                changes = analytics.calculate_percentage_changes(df, comparison_df)
-        except Exception as e:
-            logger.error(f"Error fetching comparison data: {e}", exc_info=True)
-            st.error(f"Error loading comparison data: {e}")
-    
     # Create chart title
     chart_title = f"Monthly Income & Expenses ({time_frame_label})"
     if comparison_selection != "None" and comparison_df is not None and not comparison_df.empty:
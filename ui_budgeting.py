@@ -6,7 +6,7 @@ editable tables, category assignments, and spending tracking.
 """
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 from typing import Dict, Any
 import pandas as pd
 import streamlit as st
@@ -34,8 +34,9 @@ def get_month_options() -> Dict[str, date]:
     months = {}
     
     for i in range(12):  # Show last 12 months + current
-        month_date = today.replace(day=1) - timedelta(days=30 * i)
-        month_date = month_date.replace(day=1)  # Normalize to first of month
+        # Step back whole months by index; 30-day steps could skip or repeat a month
+        year, month_index = divmod(today.year * 12 + today.month - 1 - i, 12)
+        month_date = date(year, month_index + 1, 1)
         label = month_date.strftime("%B %Y")
         months[label] = month_date
     
@@ -173,7 +174,7 @@ def render_budget_dashboard(db_manager: DatabaseManager):
     if "canonical_key" in active_df.columns:
         active_df = active_df.drop(columns=["canonical_key"])
     snapshot = budget_manager.build_financial_snapshot(period_start, period_end, active_budgets)
-    income_override = snapshot.get("override")
+    income_override = snapshot.override
     
     def _value_color(value: float) -> str:
         if value > 0:
@@ -186,11 +187,11 @@ def render_budget_dashboard(db_manager: DatabaseManager):
     metric_cols = st.columns(3)
     
     income_label = "Total Monthly Income"
-    income_caption = f"Source: {snapshot['income_source'].capitalize()}"
+    income_caption = f"Source: {snapshot.income_source.capitalize()}"
     with metric_cols[0]:
         st.metric(
             income_label,
-            format_currency(snapshot["income_total"]),
+            format_currency(snapshot.income_total),
             help="Expected income for the selected month. Override below if needed."
         )
         st.caption(income_caption)
@@ -198,16 +199,16 @@ def render_budget_dashboard(db_manager: DatabaseManager):
     with metric_cols[1]:
         st.metric(
             "Assigned to Budgets",
-            format_currency(snapshot["assigned_total"]),
+            format_currency(snapshot.assigned_total),
             help="Sum of all category assignments. Every dollar should have a job."
         )
     
-    unassigned_color = _value_color(snapshot["unassigned_funds"])
+    unassigned_color = _value_color(snapshot.unassigned_funds)
     with metric_cols[2]:
         st.markdown(
             f"<div style='font-size:0.9rem; font-weight:600;'>Unassigned Funds</div>"
             f"<div style='font-size:1.6rem; font-weight:700; color:{unassigned_color};'>"
-            f"{format_currency(snapshot['unassigned_funds'])}</div>",
+            f"{format_currency(snapshot.unassigned_funds)}</div>",
             unsafe_allow_html=True
         )
         st.caption("Assign remaining funds to categories (YNAB Rule 1).")
@@ -216,21 +217,21 @@ def render_budget_dashboard(db_manager: DatabaseManager):
     with metric_cols_row2[0]:
         st.metric(
             "Current Spent",
-            format_currency(snapshot["spent_total"]),
+            format_currency(snapshot.spent_total),
             help="Actual expenses recorded in transactions for the selected month."
         )
     
-    available_color = _value_color(snapshot["available_total"])
+    available_color = _value_color(snapshot.available_total)
     with metric_cols_row2[1]:
         st.markdown(
             f"<div style='font-size:0.9rem; font-weight:600;'>Remaining Available</div>"
             f"<div style='font-size:1.6rem; font-weight:700; color:{available_color};'>"
-            f"{format_currency(snapshot['available_total'])}</div>",
+            f"{format_currency(snapshot.available_total)}</div>",
             unsafe_allow_html=True
         )
         st.caption("Assigned minus spent. Stay green to keep categories on track.")
     
-    utilization = snapshot["budget_utilization_pct"]
+    utilization = snapshot.budget_utilization_pct
     with metric_cols_row2[2]:
         st.metric(
             "Budget Utilization %",
@@ -240,10 +241,10 @@ def render_budget_dashboard(db_manager: DatabaseManager):
         st.progress(min(utilization / 100.0, 1.0))
     
     projection_cols = st.columns(2)
-    if snapshot["show_projections"]:
+    if snapshot.show_projections:
         with projection_cols[0]:
-            projected_color = _value_color(snapshot.get("projected_balance") or 0.0)
-            proj_value = snapshot.get("projected_balance")
+            projected_color = _value_color(snapshot.projected_balance or 0.0)
+            proj_value = snapshot.projected_balance
             if proj_value is not None:
                 st.markdown(
                     f"<div style='font-size:0.9rem; font-weight:600;'>Projected End-of-Month Balance</div>"
@@ -252,14 +253,14 @@ def render_budget_dashboard(db_manager: DatabaseManager):
                     unsafe_allow_html=True
                 )
                 st.caption(
-                    f"Days left: {snapshot['days_left']}. Projection assumes linear trend from average daily income/spend."
+                    f"Days left: {snapshot.days_left}. Projection assumes linear trend from average daily income/spend."
                 )
     else:
         with projection_cols[0]:
             st.info("Projections disabled in configuration.")
     
     income_state_key = f"income_override_value_{selected_month.strftime('%Y%m')}"
-    default_income_value = income_override.override_amount if income_override else snapshot["income_total"]
+    default_income_value = income_override.override_amount if income_override else snapshot.income_total
     if income_state_key not in st.session_state:
         st.session_state[income_state_key] = float(default_income_value)
     
@@ -295,12 +296,12 @@ def render_budget_dashboard(db_manager: DatabaseManager):
             else:
                 st.error("Failed to clear override.")
     
-    if snapshot["alerts"]:
-        for alert in snapshot["alerts"]:
+    if snapshot.alerts:
+        for alert in snapshot.alerts:
             st.error(alert)
     
     with st.expander("💡 Budget Tips"):
-        for tip in snapshot["tips"]:
+        for tip in snapshot.tips:
             st.markdown(f"- {tip}")
     
     st.markdown("---")